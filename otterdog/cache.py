@@ -14,9 +14,13 @@ from otterdog.logging import get_logger
 from otterdog.providers.github.cache.file import file_cache
 
 if TYPE_CHECKING:
+    from otterdog.models.config_cache import OrgConfigCache
+    from otterdog.models.live_snapshot import LiveSnapshotStore
     from otterdog.providers.github.cache import CacheStrategy
 
 _GITHUB_CACHE = file_cache()
+_CONFIG_CACHE: OrgConfigCache | None = None
+_LIVE_SNAPSHOT_STORE: LiveSnapshotStore | None = None
 _logger = get_logger(__name__)
 
 
@@ -30,3 +34,25 @@ def set_github_cache(cache: CacheStrategy) -> None:
 
     _logger.trace("setting %s as GitHub cache strategy", cache)
     _GITHUB_CACHE = cache
+
+
+def get_config_cache() -> OrgConfigCache | None:
+    return _CONFIG_CACHE
+
+
+def set_config_cache(cache: OrgConfigCache | None) -> None:
+    global _CONFIG_CACHE
+
+    _logger.trace("setting %s as configuration cache", cache)
+    _CONFIG_CACHE = cache
+
+
+def get_live_snapshot_store() -> LiveSnapshotStore | None:
+    return _LIVE_SNAPSHOT_STORE
+
+
+def set_live_snapshot_store(store: LiveSnapshotStore | None) -> None:
+    global _LIVE_SNAPSHOT_STORE
+
+    _logger.trace("setting %s as live snapshot store", store)
+    _LIVE_SNAPSHOT_STORE = store
@@ -15,9 +15,11 @@ from typing import Any
 import click
 from click.shell_completion import CompletionItem
 
-from otterdog.cache import set_github_cache
+from otterdog.cache import set_config_cache, set_github_cache, set_live_snapshot_store
 from otterdog.logging import CONSOLE_STDOUT, init_logging, print_error, print_exception
-from otterdog.providers.github.cache.file import file_cache
+from otterdog.models.config_cache import OrgConfigCache
+from otterdog.models.live_snapshot import LiveSnapshotStore
+from otterdog.providers.github.cache.etag import etag_cache
 
 from . import __version__
 from .config import OtterdogConfig
@@ -64,6 +66,46 @@ def complete_organizations(ctx, param, incomplete):
         return []
 
 
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+
+class Duration(click.ParamType):
+    """
+    A duration in seconds, specified as number of seconds or with a unit, e.g. 30s, 10m or 1h.
+    """
+
+    name = "duration"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int | float):
+            return float(value)
+
+        text = value.strip().lower()
+        factor = _DURATION_UNITS.get(text[-1:])
+        if factor is not None:
+            text = text[:-1]
+        else:
+            factor = 1
+
+        try:
+            seconds = float(text) * factor
+        except ValueError:
+            self.fail(f"'{value}' is not a valid duration, use e.g. 30s, 10m or 1h", param, ctx)
+
+        if seconds < 0:
+            self.fail(f"'{value}' is not a valid duration, it must not be negative", param, ctx)
+
+        return seconds
+
+
+_MAX_AGE_OPTION = click.option(
+    "--max-age",
+    type=Duration(),
+    default=None,
+    help="reuse a snapshot of the live configuration that is not older than the given duration, e.g. 10m",
+)
+
+
 class StdCommand(click.Command):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -177,13 +219,21 @@ def cli():
 
 
 @cli.command(cls=StdCommand)
-def validate(organizations: list[str]):
+@click.option(
+    "-p",
+    "--parallel",
+    type=click.IntRange(min=1),
+    show_default=True,
+    default=1,
+    help="number of organizations to process concurrently",
+)
+def validate(organizations: list[str], parallel):
     """
     Validates the configuration for organizations.
     """
     from otterdog.operations.validate import ValidateOperation
 
-    _execute_operation(organizations, ValidateOperation())
+    _execute_operation(organizations, ValidateOperation(), parallel)
 
 
 @cli.command(cls=StdCommand)
@@ -218,13 +268,14 @@ def show(organizations: list[str], markdown, output_dir):
     default=False,
     help="skip settings retrieved via web ui",
 )
-def show_live(organizations: list[str], no_web_ui):
+@_MAX_AGE_OPTION
+def show_live(organizations: list[str], no_web_ui, max_age):
     """
     Displays the live configuration for organizations.
     """
     from otterdog.operations.show_live import ShowLiveOperation
 
-    _execute_operation(organizations, ShowLiveOperation(no_web_ui=no_web_ui))
+    _execute_operation(organizations, ShowLiveOperation(no_web_ui=no_web_ui, max_age=max_age))
 
 
 @cli.command(cls=StdCommand)
@@ -466,8 +517,25 @@ def import_command(organizations: list[str], force, no_web_ui):
     default="*",
     help="a valid shell pattern to match webhook urls / secret names to be included for update",
 )
+@click.option(
+    "-p",
+    "--parallel",
+    type=click.IntRange(min=1),
+    show_default=True,
+    default=1,
+    help="number of organizations to process concurrently",
+)
+@_MAX_AGE_OPTION
 def plan(
-    organizations: list[str], no_web_ui, repo_filter, update_webhooks, update_secrets, only_secrets, update_filter
+    organizations: list[str],
+    no_web_ui,
+    repo_filter,
+    update_webhooks,
+    update_secrets,
+    only_secrets,
+    update_filter,
+    parallel,
+    max_age,
 ):
     """
     Show changes that would be applied by otterdog based on the current configuration
@@ -484,7 +552,9 @@ def plan(
             update_secrets=update_secrets,
             only_secrets=only_secrets,
             update_filter=update_filter,
+            max_age=max_age,
         ),
+        parallel,
     )
 
 
@@ -510,7 +580,16 @@ def plan(
     type=click.Path(file_okay=True, dir_okay=False, writable=False, readable=True, allow_dash=True),
     help="a file to write the status as JSON output",
 )
-def check_status(organizations: list[str], no_web_ui, repo_filter, json):
+@click.option(
+    "-p",
+    "--parallel",
+    type=click.IntRange(min=1),
+    show_default=True,
+    default=1,
+    help="number of organizations to process concurrently",
+)
+@_MAX_AGE_OPTION
+def check_status(organizations: list[str], no_web_ui, repo_filter, json, parallel, max_age):
     """
     Check the status of current configuration (validity and whether it is in sync with the GitHub live configuration).
     Output JSON with the status of each organization.
@@ -523,7 +602,9 @@ def check_status(organizations: list[str], no_web_ui, repo_filter, json):
             no_web_ui=no_web_ui,
             repo_filter=repo_filter,
             output_json=json,
+            max_age=max_age,
         ),
+        parallel,
     )
 
 
@@ -650,6 +731,20 @@ def local_plan(
     default=False,
     help="enables deletion of resources if they are missing in the definition",
 )
+@click.option(
+    "--serial",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    help="applies changes one after another in a fixed order",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    show_default=True,
+    default=8,
+    help="maximum number of changes to apply concurrently",
+)
 def apply(
     organizations: list[str],
     force,
@@ -660,6 +755,8 @@ def apply(
     only_secrets,
     update_filter,
     delete_resources,
+    serial,
+    concurrency,
 ):
     """
     Apply changes based on the current configuration to the live configuration at GitHub.
@@ -677,6 +774,8 @@ def apply(
             only_secrets=only_secrets,
             update_filter=update_filter,
             delete_resources=delete_resources,
+            serial=serial,
+            apply_concurrency=concurrency,
         ),
     )
 
@@ -747,6 +846,20 @@ def apply(
     default=False,
     help="enables deletion of resources if they are missing in the definition",
 )
+@click.option(
+    "--serial",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    help="applies changes one after another in a fixed order",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    show_default=True,
+    default=8,
+    help="maximum number of changes to apply concurrently",
+)
 def local_apply(
     organizations: list[str],
     force,
@@ -757,6 +870,8 @@ def local_apply(
     only_secrets,
     update_filter,
     delete_resources,
+    serial,
+    concurrency,
     suffix,
 ):
     """
@@ -776,6 +891,8 @@ def local_apply(
             only_secrets=only_secrets,
             update_filter=update_filter,
             delete_resources=delete_resources,
+            serial=serial,
+            apply_concurrency=concurrency,
         ),
     )
 
@@ -969,14 +1086,16 @@ def install_deps():
         print_error(f"could not install required dependencies: {status}")
 
 
-def _execute_operation(organizations: list[str], operation: Operation):
+def _execute_operation(organizations: list[str], operation: Operation, parallel: int = 1):
     printer = IndentingPrinter(CONSOLE_STDOUT)
 
     try:
         exit_code = 0
         config = unwrap(_CONFIG)
 
-        set_github_cache(file_cache())
+        set_github_cache(etag_cache())
+        set_config_cache(OrgConfigCache())
+        set_live_snapshot_store(LiveSnapshotStore())
 
         operation.init(config, printer)
         operation.pre_execute()
@@ -986,12 +1105,10 @@ def _execute_operation(organizations: list[str], operation: Operation):
         if len(organizations) == 0:
             organizations = config.organization_names
 
-        total_num_orgs = len(organizations)
-        current_org_number = 1
-        for organization in organizations:
-            org_config = config.get_organization_config(organization)
-            exit_code = max(exit_code, asyncio.run(operation.execute(org_config, current_org_number, total_num_orgs)))
-            current_org_number += 1
+        if parallel > 1 and len(organizations) > 1:
+            exit_code = asyncio.run(_execute_operation_in_parallel(config, organizations, operation, parallel))
+        else:
+            exit_code = asyncio.run(_execute_operation_sequentially(config, organizations, operation))
 
         operation.post_execute()
         sys.exit(exit_code)
@@ -1001,5 +1118,101 @@ def _execute_operation(organizations: list[str], operation: Operation):
         sys.exit(2)
 
 
+async def _execute_operation_sequentially(
+    config: OtterdogConfig,
+    organizations: list[str],
+    operation: Operation,
+) -> int:
+    from otterdog.providers.github.browser_pool import BrowserPool, set_browser_pool
+
+    total_num_orgs = len(organizations)
+
+    # all organizations share the same browser and web session of the bot account
+    browser_pool = BrowserPool()
+    set_browser_pool(browser_pool)
+
+    try:
+        exit_code = 0
+        for org_number, organization in enumerate(organizations, start=1):
+            org_config = config.get_organization_config(organization)
+            exit_code = max(exit_code, await operation.execute(org_config, org_number, total_num_orgs))
+
+        return exit_code
+    finally:
+        set_browser_pool(None)
+        await browser_pool.close()
+
+
+async def _execute_operation_in_parallel(
+    config: OtterdogConfig,
+    organizations: list[str],
+    operation: Operation,
+    parallel: int,
+) -> int:
+    from io import StringIO
+
+    from otterdog.logging import create_buffered_console
+    from otterdog.providers.github.browser_pool import BrowserPool, set_browser_pool
+    from otterdog.providers.github.rest.requester import SessionPool, set_session_pool
+    from otterdog.utils import JsonnetEngine, set_jsonnet_engine
+
+    total_num_orgs = len(organizations)
+    semaphore = asyncio.Semaphore(parallel)
+
+    async def _execute(org_number: int, organization: str) -> tuple[Operation, StringIO, int]:
+        async with semaphore:
+            # buffer the output of each organization, so that it is not interleaved with the output of others
+            buffer = StringIO()
+            forked_operation = operation.fork(IndentingPrinter(create_buffered_console(buffer)))
+            org_config = config.get_organization_config(organization)
+            org_exit_code = await forked_operation.execute(org_config, org_number, total_num_orgs)
+            return forked_operation, buffer, org_exit_code
+
+    # all organizations share the same connections to GitHub which limits
+    # the overall number of requests in flight.
+    session_pool = SessionPool()
+    set_session_pool(session_pool)
+
+    # as well as the same browser and web session of the bot account
+    browser_pool = BrowserPool()
+    set_browser_pool(browser_pool)
+
+    # evaluate the configurations in worker processes to not block the other organizations
+    jsonnet_engine = JsonnetEngine(max_workers=parallel)
+    set_jsonnet_engine(jsonnet_engine)
+
+    tasks = [
+        asyncio.create_task(_execute(org_number, organization))
+        for org_number, organization in enumerate(organizations, start=1)
+    ]
+
+    try:
+        exit_code = 0
+        for task in tasks:
+            forked_operation, buffer, org_exit_code = await task
+
+            CONSOLE_STDOUT.file.write(buffer.getvalue())
+            CONSOLE_STDOUT.file.flush()
+
+            operation.join(forked_operation)
+            exit_code = max(exit_code, org_exit_code)
+
+        return exit_code
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        set_session_pool(None)
+        await session_pool.close()
+
+        set_browser_pool(None)
+        await browser_pool.close()
+
+        set_jsonnet_engine(None)
+        jsonnet_engine.close()
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,142 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from otterdog.logging import get_logger
+
+if TYPE_CHECKING:
+    from types import CodeType
+
+_logger = get_logger(__name__)
+
+
+@dataclasses.dataclass
+class HookTiming:
+    """
+    The number of executions of a hook script and the total time spent executing it.
+    """
+
+    calls: int = 0
+    total_time: float = 0.0
+
+
+@dataclasses.dataclass(frozen=True)
+class _CompiledHook:
+    mtime_ns: int
+    size: int
+    code: CodeType
+
+
+class HookRegistry:
+    """
+    Compiles custom hook scripts, e.g. validate-team.py, once and caches the compiled code.
+
+    Hooks are keyed by the real path of their script, so that hooks of a template shared via
+    a symlinked workspace are only compiled once. A cached hook is recompiled when the
+    modification time or size of its script changes. At most max_entries hooks are kept,
+    evicting the least recently used ones together with their timings, and hooks whose
+    script does not exist anymore are removed.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._hooks: OrderedDict[str, _CompiledHook] = OrderedDict()
+        self._timings: dict[str, HookTiming] = {}
+
+    def get_code(self, hook_script: str) -> CodeType | None:
+        """
+        Returns the compiled code of the given hook script, or None if it does not exist.
+        """
+        hook_script = os.path.realpath(hook_script)
+
+        try:
+            stat = os.stat(hook_script)
+        except FileNotFoundError:
+            with self._lock:
+                self._remove(hook_script)
+            return None
+
+        with self._lock:
+            hook = self._hooks.get(hook_script)
+            if hook is not None and hook.mtime_ns == stat.st_mtime_ns and hook.size == stat.st_size:
+                self._hooks.move_to_end(hook_script)
+                return hook.code
+
+        _logger.debug("compiling hook '%s'", hook_script)
+
+        with open(hook_script) as file:
+            code = compile(file.read(), hook_script, "exec")
+
+        with self._lock:
+            self._hooks[hook_script] = _CompiledHook(stat.st_mtime_ns, stat.st_size, code)
+            self._hooks.move_to_end(hook_script)
+            while len(self._hooks) > self._max_entries:
+                evicted_script, _ = self._hooks.popitem(last=False)
+                self._timings.pop(evicted_script, None)
+
+        return code
+
+    def _remove(self, hook_script: str) -> None:
+        self._hooks.pop(hook_script, None)
+        self._timings.pop(hook_script, None)
+
+    def execute_if_present(self, hook_script: str, global_vars: dict[str, Any], local_vars: dict[str, Any]) -> bool:
+        """
+        Executes the given hook script with the provided globals and locals if it exists.
+
+        Returns True if the hook has been executed.
+        """
+        code = self.get_code(hook_script)
+        if code is None:
+            return False
+
+        start = time.perf_counter()
+        try:
+            exec(code, global_vars, local_vars)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                # the code is compiled with the real path of the script as filename
+                if code.co_filename in self._hooks:
+                    timing = self._timings.setdefault(code.co_filename, HookTiming())
+                    timing.calls += 1
+                    timing.total_time += elapsed
+
+        return True
+
+    def get_timings(self) -> dict[str, HookTiming]:
+        """
+        Returns a copy of the execution timings of all hooks keyed by the real path of their script.
+        """
+        with self._lock:
+            return {k: dataclasses.replace(v) for k, v in self._timings.items()}
+
+    def log_timings(self) -> None:
+        for hook_script, timing in self.get_timings().items():
+            _logger.debug("hook '%s': %d call(s) in %.3fs", hook_script, timing.calls, timing.total_time)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hooks.clear()
+            self._timings.clear()
+
+
+_HOOK_REGISTRY = HookRegistry()
+
+
+def get_hook_registry() -> HookRegistry:
+    return _HOOK_REGISTRY
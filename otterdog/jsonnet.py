@@ -6,21 +6,41 @@
 #  SPDX-License-Identifier: EPL-2.0
 #  *******************************************************************************
 
+import asyncio
+import copy
 import os
-from asyncio import Lock
 from functools import cached_property
-from shutil import ignore_patterns
-from typing import Any
+from typing import Any, ClassVar
 
 import aiofiles.os
 import aiofiles.ospath
 
 from .logging import get_logger
-from .utils import jsonnet_evaluate_snippet, parse_github_url, parse_template_url
+from .template_workspace import (
+    copy_template,
+    get_template_checkout_dir,
+    get_template_checkout_lock,
+    get_template_workspace_cache,
+    hash_template_dir,
+    refresh_template_checkout,
+)
+from .utils import JsonnetEngine, get_jsonnet_engine, jsonnet_evaluate_snippet, parse_template_url
 
-_template_lock = Lock()
 _logger = get_logger(__name__)
 
+# evaluated default configs shared between all configs using the same template
+_MEMO_SIZE = 256
+_default_configs_memo: dict[str, dict[str, Any]] = {}
+_default_org_configs_memo: dict[tuple[str, str, str], dict[str, Any]] = {}
+
+
+def _memoize(memo: dict[Any, dict[str, Any]], key: Any, value: dict[str, Any]) -> None:
+    if key not in memo and len(memo) >= _MEMO_SIZE:
+        # evict the oldest entry
+        del memo[next(iter(memo))]
+
+    memo[key] = value
+
 
 class JsonnetConfig:
     # FIXME: the function names to create resources should not be hard-coded but
@@ -48,6 +68,31 @@ class JsonnetConfig:
     create_status_checks = "newStatusChecks"
     create_merge_queue = "newMergeQueue"
 
+    # the default configs that are evaluated in a single pass,
+    # mapping the name of the cached property to the template function and its arguments.
+    _default_configs: ClassVar[dict[str, tuple[str, str]]] = {
+        "default_org_config": (create_org, "'default', 'default'"),
+        "default_org_role_config": (create_org_role, "'default'"),
+        "default_team_config": (create_org_team, "'default'"),
+        "default_org_custom_property_config": (create_org_custom_property, "'default'"),
+        "default_org_webhook_config": (create_org_webhook, "'default'"),
+        "default_org_secret_config": (create_org_secret, "'default'"),
+        "default_org_variable_config": (create_org_variable, "'default'"),
+        "default_org_ruleset_config": (create_org_ruleset, "'default'"),
+        "default_repo_config": (create_repo, "'default'"),
+        "default_repo_webhook_config": (create_repo_webhook, "'default'"),
+        "default_repo_secret_config": (create_repo_secret, "'default'"),
+        "default_repo_variable_config": (create_repo_variable, "'default'"),
+        "default_branch_protection_rule_config": (create_branch_protection_rule, "'default'"),
+        "default_repo_ruleset_config": (create_repo_ruleset, "'default'"),
+        "default_environment_config": (create_environment, "'default'"),
+        "default_environment_secret_config": (create_environment_secret, "'default'"),
+        "default_environment_variable_config": (create_environment_variable, "'default'"),
+        "default_pull_request_config": (create_pull_request, ""),
+        "default_status_checks_config": (create_status_checks, ""),
+        "default_merge_queue_config": (create_merge_queue, ""),
+    }
+
     def __init__(
         self,
         org_id: str,
@@ -99,223 +144,254 @@ class JsonnetConfig:
         if self._initialized is True:
             return
 
+        template_hash = None
         if not self._local_only:
-            await self._init_base_template()
+            template_hash = await self._init_base_template()
 
         template_file = self.template_file
         _logger.debug("loading template file '%s'", template_file)
         if not await aiofiles.ospath.exists(self.template_file):
             raise RuntimeError(f"template file '{template_file}' does not exist")
 
+        # the template might have changed, hash it again
+        if template_hash is None:
+            template_hash = await asyncio.to_thread(self._hash_template)
+
+        self.__dict__["template_hash"] = template_hash
+
+        jsonnet_engine = get_jsonnet_engine()
+        if jsonnet_engine is not None:
+            self.__dict__["_evaluated_default_configs"] = await self._evaluate_default_configs_async(jsonnet_engine)
+
         self._initialized = True
 
+    def _hash_template(self) -> str:
+        return hash_template_dir(self._base_template_file, self.template_dir)
+
+    @cached_property
+    def template_hash(self) -> str:
+        """
+        The hash of all files of the template, used as key to share evaluated defaults.
+        """
+        return self._hash_template()
+
+    def _default_configs_snippet(self) -> str:
+        # functions that are not defined by the template are skipped
+        fields = "".join(
+            f"  [if std.objectHasAll(template, '{function}') then '{name}']: template.{function}({args}),\n"
+            for name, (function, args) in self._default_configs.items()
+        )
+        return f"local template = import '{self.template_file}';\n{{\n{fields}}}"
+
+    def _memoize_default_configs(self, default_configs: dict[str, Any] | None) -> dict[str, Any] | None:
+        if default_configs is not None:
+            _memoize(_default_configs_memo, self.template_hash, default_configs)
+            return copy.deepcopy(default_configs)
+        else:
+            return None
+
+    async def _evaluate_default_configs_async(self, engine: JsonnetEngine) -> dict[str, Any] | None:
+        memoized = _default_configs_memo.get(self.template_hash)
+        if memoized is not None:
+            return copy.deepcopy(memoized)
+
+        try:
+            default_configs = await engine.evaluate_snippet(self._default_configs_snippet())
+        except RuntimeError as ex:
+            _logger.debug("failed to evaluate default configs at once, evaluating them individually: %s", ex)
+            default_configs = None
+
+        return self._memoize_default_configs(default_configs)
+
+    @cached_property
+    def _evaluated_default_configs(self) -> dict[str, Any] | None:
+        """
+        All default configs of the template evaluated in a single pass, or None if the
+        evaluation failed, in which case the default configs are evaluated individually.
+        """
+        memoized = _default_configs_memo.get(self.template_hash)
+        if memoized is not None:
+            return copy.deepcopy(memoized)
+
+        try:
+            default_configs = jsonnet_evaluate_snippet(self._default_configs_snippet())
+        except RuntimeError as ex:
+            _logger.debug("failed to evaluate default configs at once, evaluating them individually: %s", ex)
+            default_configs = None
+
+        return self._memoize_default_configs(default_configs)
+
+    def _get_default_config(self, name: str, skip_message: str) -> dict[str, Any] | None:
+        default_configs = self._evaluated_default_configs
+        if default_configs is not None:
+            if name in default_configs:
+                return default_configs[name]
+            else:
+                _logger.debug(skip_message)
+                return None
+
+        function, args = self._default_configs[name]
+        try:
+            return jsonnet_evaluate_snippet(f"(import '{self.template_file}').{function}({args})")
+        except RuntimeError:
+            _logger.debug(skip_message)
+            return None
+
     def default_org_config_for_org_id(self, project_name: str, org_id: str) -> dict[str, Any]:
+        key = (self.template_hash, project_name, org_id)
+        memoized = _default_org_configs_memo.get(key)
+        if memoized is not None:
+            return copy.deepcopy(memoized)
+
         try:
             # load the default settings for the organization
             snippet = f"(import '{self.template_file}').{self.create_org}('{project_name}', '{org_id}')"
-            return jsonnet_evaluate_snippet(snippet)
+            default_org_config = jsonnet_evaluate_snippet(snippet)
         except RuntimeError as ex:
             raise RuntimeError(f"failed to get default organization config for org '{org_id}': {ex}") from ex
 
+        _memoize(_default_org_configs_memo, key, default_org_config)
+        return copy.deepcopy(default_org_config)
+
     @cached_property
     def default_org_config(self) -> dict[str, Any]:
-        return self.default_org_config_for_org_id("default", "default")
+        default_configs = self._evaluated_default_configs
+        if default_configs is not None and "default_org_config" in default_configs:
+            return default_configs["default_org_config"]
+        else:
+            return self.default_org_config_for_org_id("default", "default")
 
     @cached_property
     def default_org_role_config(self):
-        try:
-            # load the default org role config
-            org_role_snippet = f"(import '{self.template_file}').{self.create_org_role}('default')"
-            return jsonnet_evaluate_snippet(org_role_snippet)
-        except RuntimeError:
-            _logger.debug("no default org role config found, roles will be skipped")
-            return None
+        # load the default org role config
+        return self._get_default_config(
+            "default_org_role_config", "no default org role config found, roles will be skipped"
+        )
 
     @cached_property
     def default_team_config(self):
-        try:
-            # load the default team config
-            team_snippet = f"(import '{self.template_file}').{self.create_org_team}('default')"
-            return jsonnet_evaluate_snippet(team_snippet)
-        except RuntimeError:
-            _logger.debug("no default team config found, teams will be skipped")
-            return None
+        # load the default team config
+        return self._get_default_config("default_team_config", "no default team config found, teams will be skipped")
 
     @cached_property
     def default_org_custom_property_config(self):
-        try:
-            # load the default org custom property config
-            org_custom_property_snippet = (
-                f"(import '{self.template_file}').{self.create_org_custom_property}('default')"
-            )
-            return jsonnet_evaluate_snippet(org_custom_property_snippet)
-        except RuntimeError:
-            _logger.debug("no default org custom property config found, custom properties will be skipped")
-            return None
+        # load the default org custom property config
+        return self._get_default_config(
+            "default_org_custom_property_config",
+            "no default org custom property config found, custom properties will be skipped",
+        )
 
     @cached_property
     def default_org_webhook_config(self):
-        try:
-            # load the default org webhook config
-            org_webhook_snippet = f"(import '{self.template_file}').{self.create_org_webhook}('default')"
-            return jsonnet_evaluate_snippet(org_webhook_snippet)
-        except RuntimeError:
-            _logger.debug("no default org webhook config found, webhooks will be skipped")
-            return None
+        # load the default org webhook config
+        return self._get_default_config(
+            "default_org_webhook_config", "no default org webhook config found, webhooks will be skipped"
+        )
 
     @cached_property
     def default_org_secret_config(self):
-        try:
-            # load the default org secret config
-            org_secret_snippet = f"(import '{self.template_file}').{self.create_org_secret}('default')"
-            return jsonnet_evaluate_snippet(org_secret_snippet)
-        except RuntimeError:
-            _logger.debug("no default org secret config found, secrets will be skipped")
-            return None
+        # load the default org secret config
+        return self._get_default_config(
+            "default_org_secret_config", "no default org secret config found, secrets will be skipped"
+        )
 
     @cached_property
     def default_org_variable_config(self):
-        try:
-            # load the default org variable config
-            org_variable_snippet = f"(import '{self.template_file}').{self.create_org_variable}('default')"
-            return jsonnet_evaluate_snippet(org_variable_snippet)
-        except RuntimeError:
-            _logger.debug("no default org variable config found, variables will be skipped")
-            return None
+        # load the default org variable config
+        return self._get_default_config(
+            "default_org_variable_config", "no default org variable config found, variables will be skipped"
+        )
 
     @cached_property
     def default_org_ruleset_config(self):
-        try:
-            # load the default org ruleset config
-            org_ruleset_snippet = f"(import '{self.template_file}').{self.create_org_ruleset}('default')"
-            return jsonnet_evaluate_snippet(org_ruleset_snippet)
-        except RuntimeError:
-            _logger.debug("no default org ruleset config found, rulesets will be skipped")
-            return None
+        # load the default org ruleset config
+        return self._get_default_config(
+            "default_org_ruleset_config", "no default org ruleset config found, rulesets will be skipped"
+        )
 
     @cached_property
     def default_repo_config(self):
-        try:
-            # load the default repo config
-            repo_snippet = f"(import '{self.template_file}').{self.create_repo}('default')"
-            return jsonnet_evaluate_snippet(repo_snippet)
-        except RuntimeError:
-            _logger.debug("no default repo config found, repos will be skipped")
-            return None
+        # load the default repo config
+        return self._get_default_config("default_repo_config", "no default repo config found, repos will be skipped")
 
     @cached_property
     def default_repo_webhook_config(self):
-        try:
-            # load the default repo webhook config
-            repo_webhook_snippet = f"(import '{self.template_file}').{self.create_repo_webhook}('default')"
-            return jsonnet_evaluate_snippet(repo_webhook_snippet)
-        except RuntimeError:
-            _logger.debug("no default repo webhook config found, webhooks will be skipped")
-            return None
+        # load the default repo webhook config
+        return self._get_default_config(
+            "default_repo_webhook_config", "no default repo webhook config found, webhooks will be skipped"
+        )
 
     @cached_property
     def default_repo_secret_config(self):
-        try:
-            # load the default repo secret config
-            repo_secret_snippet = f"(import '{self.template_file}').{self.create_repo_secret}('default')"
-            return jsonnet_evaluate_snippet(repo_secret_snippet)
-        except RuntimeError:
-            _logger.debug("no default repo secret config found, secrets will be skipped")
-            return None
+        # load the default repo secret config
+        return self._get_default_config(
+            "default_repo_secret_config", "no default repo secret config found, secrets will be skipped"
+        )
 
     @cached_property
     def default_repo_variable_config(self):
-        try:
-            # load the default repo variable config
-            repo_variable_snippet = f"(import '{self.template_file}').{self.create_repo_variable}('default')"
-            return jsonnet_evaluate_snippet(repo_variable_snippet)
-        except RuntimeError:
-            _logger.debug("no default repo variable config found, variables will be skipped")
-            return None
+        # load the default repo variable config
+        return self._get_default_config(
+            "default_repo_variable_config", "no default repo variable config found, variables will be skipped"
+        )
 
     @cached_property
     def default_branch_protection_rule_config(self):
-        try:
-            # load the default branch protection rule config
-            branch_protection_snippet = (
-                f"(import '{self.template_file}').{self.create_branch_protection_rule}('default')"
-            )
-            return jsonnet_evaluate_snippet(branch_protection_snippet)
-        except RuntimeError:
-            _logger.debug("no default branch protection rule config found, branch protection rules will be skipped")
-            return None
+        # load the default branch protection rule config
+        return self._get_default_config(
+            "default_branch_protection_rule_config",
+            "no default branch protection rule config found, branch protection rules will be skipped",
+        )
 
     @cached_property
     def default_repo_ruleset_config(self):
-        try:
-            # load the default repo ruleset config
-            repo_ruleset_snippet = f"(import '{self.template_file}').{self.create_repo_ruleset}('default')"
-            return jsonnet_evaluate_snippet(repo_ruleset_snippet)
-        except RuntimeError:
-            _logger.debug("no default repo ruleset config found, rulesets will be skipped")
-            return None
+        # load the default repo ruleset config
+        return self._get_default_config(
+            "default_repo_ruleset_config", "no default repo ruleset config found, rulesets will be skipped"
+        )
 
     @cached_property
     def default_environment_config(self):
-        try:
-            # load the default environment config
-            environment_snippet = f"(import '{self.template_file}').{self.create_environment}('default')"
-            return jsonnet_evaluate_snippet(environment_snippet)
-        except RuntimeError:
-            _logger.debug("no default environment config found, environments will be skipped")
-            return None
+        # load the default environment config
+        return self._get_default_config(
+            "default_environment_config", "no default environment config found, environments will be skipped"
+        )
 
     @cached_property
     def default_environment_secret_config(self):
-        try:
-            # load the default environment secret config
-            environment_secret_snippet = f"(import '{self.template_file}').{self.create_environment_secret}('default')"
-            return jsonnet_evaluate_snippet(environment_secret_snippet)
-        except RuntimeError:
-            _logger.debug("no default environment secret config found, secrets will be skipped")
-            return None
+        # load the default environment secret config
+        return self._get_default_config(
+            "default_environment_secret_config", "no default environment secret config found, secrets will be skipped"
+        )
 
     @cached_property
     def default_environment_variable_config(self):
-        try:
-            # load the default environment variable config
-            environment_variable_snippet = (
-                f"(import '{self.template_file}').{self.create_environment_variable}('default')"
-            )
-            return jsonnet_evaluate_snippet(environment_variable_snippet)
-        except RuntimeError:
-            _logger.debug("no default environment variable config found, variables will be skipped")
-            return None
+        # load the default environment variable config
+        return self._get_default_config(
+            "default_environment_variable_config",
+            "no default environment variable config found, variables will be skipped",
+        )
 
     @cached_property
     def default_pull_request_config(self):
-        try:
-            # load the default pull request config
-            pull_request_snippet = f"(import '{self.template_file}').{self.create_pull_request}()"
-            return jsonnet_evaluate_snippet(pull_request_snippet)
-        except RuntimeError:
-            _logger.debug("no default pull request config found, pull requests will be skipped")
-            return None
+        # load the default pull request config
+        return self._get_default_config(
+            "default_pull_request_config", "no default pull request config found, pull requests will be skipped"
+        )
 
     @cached_property
     def default_status_checks_config(self):
-        try:
-            # load the default status check config
-            status_checks_snippet = f"(import '{self.template_file}').{self.create_status_checks}()"
-            return jsonnet_evaluate_snippet(status_checks_snippet)
-        except RuntimeError:
-            _logger.debug("no default status checks config found, status checks will be skipped")
-            return None
+        # load the default status check config
+        return self._get_default_config(
+            "default_status_checks_config", "no default status checks config found, status checks will be skipped"
+        )
 
     @cached_property
     def default_merge_queue_config(self):
-        try:
-            # load the default merge queue config
-            merge_queue_snippet = f"(import '{self.template_file}').{self.create_merge_queue}()"
-            return jsonnet_evaluate_snippet(merge_queue_snippet)
-        except RuntimeError:
-            _logger.debug("no default merge queue config found, merge queues will be skipped")
-            return None
+        # load the default merge queue config
+        return self._get_default_config(
+            "default_merge_queue_config", "no default merge queue config found, merge queues will be skipped"
+        )
 
     @property
     def base_template_repo_name(self) -> str:
@@ -369,32 +445,17 @@ class JsonnetConfig:
     def import_statement(self) -> str:
         return f"import 'vendor/{self._base_template_repo_name}/{self._base_template_file}'"
 
-    async def _init_base_template(self) -> None:
-        import git
+    async def _init_base_template(self) -> str | None:
+        """
+        Provides the base template in the vendor directory of the organization.
+
+        Returns the hash of the template if already known, None otherwise.
+        """
         from aiofiles.os import makedirs
         from aiofiles.ospath import exists
-        from aioshutil import copytree, rmtree
+        from aioshutil import rmtree
 
         _logger.debug("initializing base template '%s@%s'", self._base_template_repo_url, self._base_template_ref)
-        template_owner, template_repository = parse_github_url(self._base_template_repo_url)
-
-        async with _template_lock:
-            # cache the template repo with the requested ref in the 'templates' directory
-            template_dir = f"{self.base_dir}/templates/{template_owner}/{template_repository}/{self._base_template_ref}"
-
-            if not await exists(f"{template_dir}/.git"):
-                _logger.debug("cloning base template from url '%s'", self._base_template_repo_url)
-                with git.Repo.clone_from(self._base_template_repo_url, template_dir) as repo:
-                    repo.git.checkout(self._base_template_ref)
-            else:
-                with git.Repo(template_dir) as repo:
-                    if not repo.head.is_detached:
-                        _logger.debug(
-                            "pulling changes from base template url '%s' with ref '%s'",
-                            self._base_template_repo_url,
-                            repo.head.ref,
-                        )
-                        repo.remotes.origin.pull()
 
         # create base directory if it does not exist yet
         if not await exists(self.org_dir):
@@ -403,27 +464,29 @@ class JsonnetConfig:
         if await exists(f"{self.org_dir}/vendor"):
             await rmtree(f"{self.org_dir}/vendor")
 
-        # copy over the cloned template repository
-        base_template_directory = os.path.dirname(self.base_template_file_name)
-        if len(base_template_directory) > 0:
-            # if the base template is in a subdir, only copy this subdir
-            pattern = f"{base_template_directory}/**"
+        workspace_cache = get_template_workspace_cache()
+        if workspace_cache is not None:
+            workspace = await workspace_cache.get(
+                self.base_dir,
+                self._base_template_repo_url,
+                self._base_template_ref,
+                self._base_template_file,
+            )
 
-            def _include_pattern(path, names):
-                from pathlib import PurePath
+            # link to the prepared workspace instead of copying the template
+            await makedirs(f"{self.org_dir}/vendor")
+            await aiofiles.os.symlink(os.path.abspath(workspace.path), self.template_dir, target_is_directory=True)
+            return workspace.template_hash
 
-                ignored_names = []
-                for name in names:
-                    p = PurePath(os.path.join(path, name))
-                    relative_path = p.relative_to(template_dir)
-                    if not base_template_directory.startswith(str(relative_path)) and not p.match(pattern):
-                        ignored_names.append(name)
-                return set(ignored_names)
+        # cache the template repo with the requested ref in the 'templates' directory
+        template_dir = get_template_checkout_dir(self.base_dir, self._base_template_repo_url, self._base_template_ref)
+        await refresh_template_checkout(self._base_template_repo_url, self._base_template_ref, template_dir)
 
-            ignore = _include_pattern
-        else:
-            ignore = ignore_patterns(".git")
-        await copytree(template_dir, self.template_dir, ignore=ignore)
+        # copy over the cloned template repository, the checkout must not be updated in the meantime
+        async with get_template_checkout_lock(template_dir):
+            await asyncio.to_thread(copy_template, template_dir, self._base_template_file, self.template_dir)
+
+        return None
 
     def __repr__(self) -> str:
         return f"JsonnetConfig('{self.base_dir}, '{self._base_template_file}')"
@@ -8,7 +8,7 @@
 
 import logging
 from logging import DEBUG, ERROR, INFO, WARNING  # noqa: F401 - passthrough for users of this module
-from typing import cast
+from typing import TextIO, cast
 
 from rich.box import Box
 from rich.console import Console
@@ -24,21 +24,38 @@ TRACE = logging.DEBUG - 5
 # 3: trace
 _verbose_level = 0
 
+_CONSOLE_THEME = Theme(
+    {
+        "logging.level.error": "red",
+        "logging.level.warning": "yellow",
+        "logging.level.info": "green",
+        "logging.level.debug": "cyan",
+        "logging.level.trace": "magenta",
+    }
+)
+
 CONSOLE_STDOUT = Console(
-    theme=Theme(
-        {
-            "logging.level.error": "red",
-            "logging.level.warning": "yellow",
-            "logging.level.info": "green",
-            "logging.level.debug": "cyan",
-            "logging.level.trace": "magenta",
-        }
-    ),
+    theme=_CONSOLE_THEME,
     highlight=False,
 )
 CONSOLE_STDERR = Console(stderr=True)
 
 
+def create_buffered_console(buffer: TextIO) -> Console:
+    """
+    Creates a console that writes into the given buffer, rendering its output
+    the same way as CONSOLE_STDOUT so that it can be written there later on.
+    """
+    return Console(
+        file=buffer,
+        theme=_CONSOLE_THEME,
+        highlight=False,
+        force_terminal=CONSOLE_STDOUT.is_terminal,
+        color_system=CONSOLE_STDOUT.color_system,  # type: ignore[arg-type]
+        width=CONSOLE_STDOUT.width,
+    )
+
+
 class CustomLogger(logging.Logger):
     def __init__(self, name, level=logging.NOTSET):
         super().__init__(name, level)
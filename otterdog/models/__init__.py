@@ -14,9 +14,10 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Generic, Protocol, Self, TypeVar, cast, final
 
-from jsonbender import OptionalS, S, bend  # type: ignore
+from jsonbender import S, bend  # type: ignore
 from rich.markup import escape
 
+from otterdog.hooks import get_hook_registry
 from otterdog.utils import (
     UNSET,
     Change,
@@ -32,6 +33,9 @@ from otterdog.utils import (
     write_patch_object_as_json,
 )
 
+from .converter import get_field_selectors, get_model_converter, get_provider_converter
+from .fields import FieldTable, get_field_table
+
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator, Mapping, Sequence
     from re import Pattern
@@ -199,13 +203,9 @@ class _DefaultValuesMixin:
         """
         Assigns to all field which are UNSET their default value, if one is available.
         """
-        for field in self.all_fields():  # type: ignore[attr-defined]
-            value = self.__getattribute__(field.name)
-            if is_unset(value):
-                if field.default is not dataclasses.MISSING:
-                    self.__setattr__(field.name, field.default)
-                elif field.default_factory is not dataclasses.MISSING:
-                    self.__setattr__(field.name, field.default_factory())
+        for name, default, default_factory in self._field_table().defaults:  # type: ignore[attr-defined]
+            if is_unset(self.__getattribute__(name)):
+                self.__setattr__(name, default if default_factory is None else default_factory())
 
 
 @dataclasses.dataclass
@@ -281,9 +281,13 @@ class EmbeddedModelObject(_DefaultValuesMixin, ABC):
 
         write_patch_object_as_json(patch, printer)
 
+    @classmethod
+    def _field_table(cls) -> FieldTable:
+        return get_field_table(cls, EmbeddedModelObject)
+
     @classmethod
     def all_fields(cls) -> list[dataclasses.Field]:
-        return list(dataclasses.fields(cls))
+        return list(cls._field_table().all_fields)
 
     def include_field_for_diff_computation(self, field: dataclasses.Field) -> bool:
         return True
@@ -299,11 +303,15 @@ class EmbeddedModelObject(_DefaultValuesMixin, ABC):
     ) -> list[str]:
         result = []
 
-        for field in self.all_fields():
-            if for_diff is True and not self.include_field_for_diff_computation(field):
+        table = self._field_table()
+        check_diff = for_diff is True and table.has_diff_filter
+        check_patch = for_patch is True and table.has_patch_filter
+
+        for field in table.all_fields:
+            if check_diff and not self.include_field_for_diff_computation(field):
                 continue
 
-            if for_patch is True and not self.include_field_for_patch_computation(field):
+            if check_patch and not self.include_field_for_patch_computation(field):
                 continue
 
             if exclude_unset_keys:
@@ -326,21 +334,20 @@ class EmbeddedModelObject(_DefaultValuesMixin, ABC):
 
     @classmethod
     def from_model_data(cls, data: dict[str, Any]) -> Self:
-        mapping = cls.get_mapping_from_model()
-        return cls(**bend(mapping, data))  # type: ignore
+        return cls(**get_model_converter(cls)(data))  # type: ignore
 
     @classmethod
     def get_mapping_from_model(cls) -> dict[str, Any]:
-        return {k: OptionalS(k, default=UNSET) for k in (x.name for x in cls.all_fields())}
+        return get_field_selectors(cls)
 
     @classmethod
     def from_provider_data(cls, org_id: str, data: dict[str, Any]) -> Self:
-        mapping = cls.get_mapping_from_provider(org_id, data)
-        return cls(**bend(mapping, data))  # type: ignore
+        static = cls.get_mapping_from_provider.__func__ is EmbeddedModelObject.get_mapping_from_provider.__func__  # type: ignore
+        return cls(**get_provider_converter(cls, org_id, data, static)(data))  # type: ignore
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        return {k: OptionalS(k, default=UNSET) for k in (x.name for x in cls.all_fields())}
+        return get_field_selectors(cls)
 
     @classmethod
     async def dict_to_provider_data(cls, org_id: str, data: dict[str, Any], provider: GitHubProvider) -> dict[str, Any]:
@@ -351,7 +358,11 @@ class EmbeddedModelObject(_DefaultValuesMixin, ABC):
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
-        return {field.name: S(field.name) for field in cls.all_fields() if not is_unset(data.get(field.name, UNSET))}
+        return {
+            field.name: S(field.name)
+            for field in cls._field_table().all_fields
+            if not is_unset(data.get(field.name, UNSET))
+        }
 
 
 @dataclasses.dataclass
@@ -366,19 +377,15 @@ class ModelObject(_DefaultValuesMixin, ABC):
 
     def is_keyed(self) -> bool:
         """Indicates whether the ModelObject is keyed by a property"""
-        return any(field.metadata.get("key", False) for field in self.all_fields())
+        return self._field_table().key_field is not None
 
     def get_key(self) -> str:
         """Returns the key property of this ModelObject if it keyed"""
-        if not self.is_keyed():
+        key = self._field_table().key_field
+        if key is None:
             raise RuntimeError("model object is not keyed")
 
-        return next(
-            filter(
-                lambda field: field.metadata.get("key", False) is True,
-                self.all_fields(),
-            )
-        ).name
+        return key
 
     def get_key_value(self) -> Any:
         """Returns the value of the key property"""
@@ -394,9 +401,7 @@ class ModelObject(_DefaultValuesMixin, ABC):
     # noinspection PyMethodMayBeStatic
     def execute_custom_validation_if_present(self, context: ValidationContext, filename: str) -> None:
         validate_script = os.path.join(context.template_dir, filename)
-        if os.path.exists(validate_script):
-            with open(validate_script) as file:
-                exec(file.read())
+        get_hook_registry().execute_if_present(validate_script, globals(), locals())
 
     def get_difference_from(self, other: Self) -> dict[str, Change[T]]:
         if not isinstance(other, self.__class__):
@@ -461,36 +466,29 @@ class ModelObject(_DefaultValuesMixin, ABC):
 
         return patch_result
 
+    @classmethod
+    def _field_table(cls) -> FieldTable:
+        return get_field_table(cls, ModelObject)
+
     @classmethod
     def all_fields(cls) -> list[dataclasses.Field]:
-        return list(dataclasses.fields(cls))
+        return list(cls._field_table().all_fields)
 
     @classmethod
     def model_fields(cls) -> list[dataclasses.Field]:
-        return [field for field in dataclasses.fields(cls) if not cls.is_external_only(field)]
+        return list(cls._field_table().model_fields)
 
     @classmethod
     def model_only_fields(cls) -> list[dataclasses.Field]:
-        return [field for field in dataclasses.fields(cls) if cls.is_model_only(field)]
+        return list(cls._field_table().model_only_fields)
 
     @classmethod
     def provider_fields(cls) -> list[dataclasses.Field]:
-        return [
-            field
-            for field in dataclasses.fields(cls)
-            if not cls.is_external_only(field)
-            and not cls.is_model_only(field)
-            and not cls.is_read_only(field)
-            and not cls.is_nested_model(field)
-        ]
+        return list(cls._field_table().provider_fields)
 
     @classmethod
     def _get_field(cls, key: str) -> dataclasses.Field:
-        for field in dataclasses.fields(cls):
-            if field.name == key:
-                return field
-
-        raise ValueError(f"unknown key {key}")
+        return cls._field_table().get_field(key)
 
     @staticmethod
     def is_external_only(field: dataclasses.Field) -> bool:
@@ -554,22 +552,21 @@ class ModelObject(_DefaultValuesMixin, ABC):
     @classmethod
     @final
     def from_model_data(cls, data: Mapping[str, Any]) -> Self:
-        mapping = cls.get_mapping_from_model()
-        return cls(**bend(mapping, data))  # type: ignore
+        return cls(**get_model_converter(cls)(data))  # type: ignore
 
     @classmethod
     def get_mapping_from_model(cls) -> dict[str, Any]:
-        return {k: OptionalS(k, default=UNSET) for k in (x.name for x in cls.all_fields())}
+        return get_field_selectors(cls)
 
     @classmethod
     @final
     def from_provider_data(cls, org_id: str, data: dict[str, Any]) -> Self:
-        mapping = cls.get_mapping_from_provider(org_id, data)
-        return cls(**bend(mapping, data))  # type: ignore
+        static = cls.get_mapping_from_provider.__func__ is ModelObject.get_mapping_from_provider.__func__  # type: ignore
+        return cls(**get_provider_converter(cls, org_id, data, static)(data))  # type: ignore
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        return {k: OptionalS(k, default=UNSET) for k in (x.name for x in cls.all_fields())}
+        return get_field_selectors(cls)
 
     async def to_provider_data(self, org_id: str, provider: GitHubProvider) -> dict[str, Any]:
         return await self.dict_to_provider_data(org_id, self.to_model_dict(), provider)
@@ -629,17 +626,17 @@ class ModelObject(_DefaultValuesMixin, ABC):
     ) -> list[str]:
         result = []
 
-        for field in self.model_fields():
-            if for_diff is True and not self.include_field_for_diff_computation(field):
-                continue
+        table = self._field_table()
+        check_diff = for_diff is True and table.has_diff_filter
+        check_patch = for_patch is True and table.has_patch_filter
 
-            if for_patch is True and not self.include_field_for_patch_computation(field):
-                continue
-
-            if (for_diff or for_patch) and not include_model_only_fields and self.is_model_only(field):
+        for field in table.key_candidates(
+            bool(for_diff or for_patch), include_model_only_fields, include_nested_models
+        ):
+            if check_diff and not self.include_field_for_diff_computation(field):
                 continue
 
-            if include_nested_models is False and self.is_nested_model(field):
+            if check_patch and not self.include_field_for_patch_computation(field):
                 continue
 
             if exclude_unset_keys:
@@ -658,7 +655,7 @@ class ModelObject(_DefaultValuesMixin, ABC):
         include_nested_models: bool = False,
         exclude_none_values: bool = False,
     ) -> dict[str, Any]:
-        result = {}
+        result: dict[str, Any] = {}
 
         for key in self.keys(
             for_diff=for_diff,
@@ -670,7 +667,15 @@ class ModelObject(_DefaultValuesMixin, ABC):
             if exclude_none_values and not is_set_and_valid(value):
                 continue
             elif self.is_nested_model_key(key):
-                result[key] = cast("ModelObject", value).to_model_dict(for_diff, include_nested_models)
+                result[key] = [
+                    cast("ModelObject", x).to_model_dict(
+                        for_diff,
+                        include_model_only_fields,
+                        include_nested_models,
+                        exclude_none_values,
+                    )
+                    for x in value
+                ]
             elif self.is_embedded_model_key(key) and is_set_and_valid(value):
                 result[key] = cast("EmbeddedModelObject", value).to_model_dict()
             else:
@@ -767,15 +772,15 @@ class ModelObject(_DefaultValuesMixin, ABC):
         expected_objects_by_key = associate_by_key(expected_objects, lambda x: x.get_key_value())
         expected_objects_by_all_keys = multi_associate_by_key(expected_objects, lambda x: x.get_all_key_values())
 
-        has_wildcard_keys = any(x.get_key_value().endswith("*") for x in expected_objects)
+        has_wildcard_keys = any(x.endswith("*") for x in expected_objects_by_key)
+        stripped_keys = [(x.get_key_value().rstrip("*"), x) for x in expected_objects] if has_wildcard_keys else []
 
         for current_object in current_objects:
             key = current_object.get_key_value()
 
             expected_object = expected_objects_by_all_keys.get(key)
             if expected_object is None and has_wildcard_keys:
-                for obj in expected_objects:
-                    stripped_key = obj.get_key_value().rstrip("*")
+                for stripped_key, obj in stripped_keys:
                     if stripped_key and key.startswith(stripped_key):
                         expected_object = obj
                         break
@@ -0,0 +1,143 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import marshal
+import os
+import uuid
+from typing import TYPE_CHECKING
+
+from otterdog import __version__
+from otterdog.logging import get_logger
+from otterdog.utils import get_jsonnet_import_roots, is_within_jsonnet_import_roots
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+_CONFIG_CACHE_DIR = ".cache/config"
+_ENTRY_SUFFIX = ".bin"
+
+# entries written by a different version of otterdog might have been validated against a different schema
+_CACHE_VERSION = f"{__version__}-{marshal.version}"
+
+_logger = get_logger(__name__)
+
+
+def _hash_file(path: str) -> str | None:
+    try:
+        with open(path, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class OrgConfigCache:
+    """
+    Stores the evaluated and validated model data of organization configurations on disk.
+
+    Entries are keyed by the hash of the configuration file and record the hashes of all
+    files imported during evaluation relative to the directory of the configuration file.
+    An entry is only used as long as none of these files changed, which allows sharing
+    entries between copies of the same configuration in different working directories.
+    """
+
+    def __init__(self, cache_dir: str = _CONFIG_CACHE_DIR, max_entries: int = 256):
+        self._cache_dir = cache_dir
+        self._max_entries = max_entries
+
+    def _get_path(self, digest: str) -> str:
+        return os.path.join(self._cache_dir, f"{digest}{_ENTRY_SUFFIX}")
+
+    def get(self, config_file: str, import_root: str | None = None) -> dict[str, Any] | None:
+        """
+        Returns the cached model data for the given configuration file if still valid.
+        If import_root is given, the entry is only used if all files involved are located inside it.
+        """
+        digest = _hash_file(config_file)
+        if digest is None:
+            return None
+
+        try:
+            with open(self._get_path(digest), "rb") as file:
+                # the cache directory is as trusted as the configuration files themselves
+                entry = marshal.load(file)  # noqa: S302
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("version") != _CACHE_VERSION:
+            return None
+
+        config_dir = os.path.dirname(os.path.realpath(config_file))
+        import_roots = get_jsonnet_import_roots(import_root) if import_root is not None else None
+
+        for relative_path, file_digest in entry["files"].items():
+            path = os.path.normpath(os.path.join(config_dir, relative_path))
+
+            if import_roots is not None and not is_within_jsonnet_import_roots(path, import_roots):
+                _logger.debug("cached configuration for file '%s' imports files outside of allowed root", config_file)
+                return None
+
+            if _hash_file(path) != file_digest:
+                _logger.debug("cached configuration for file '%s' is outdated, '%s' changed", config_file, path)
+                return None
+
+        _logger.debug("using cached configuration for file '%s'", config_file)
+        return entry["data"]
+
+    def put(self, config_file: str, data: dict[str, Any], files: Mapping[str, str]) -> None:
+        """
+        Caches the model data of the given configuration file, files maps the real path of the
+        configuration file and all files imported during evaluation to their sha256 hash.
+        """
+        real_config_file = os.path.realpath(config_file)
+        config_dir = os.path.dirname(real_config_file)
+
+        digest = files.get(real_config_file)
+        if digest is None:
+            return
+
+        entry = {
+            "version": _CACHE_VERSION,
+            "files": {os.path.relpath(path, config_dir): file_digest for path, file_digest in files.items()},
+            "data": data,
+        }
+
+        path = self._get_path(digest)
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+        # write to a temporary file first to avoid readers seeing partially written entries
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as file:
+                marshal.dump(entry, file)
+
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as ex:
+            _logger.warning("failed to cache configuration for file '%s': %s", config_file, ex)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            return
+
+        self._evict_entries()
+
+    def _evict_entries(self) -> None:
+        with os.scandir(self._cache_dir) as it:
+            entries = [entry for entry in it if entry.name.endswith(_ENTRY_SUFFIX)]
+
+        if len(entries) > self._max_entries:
+            entries.sort(key=lambda x: x.stat().st_mtime_ns)
+            for entry in entries[: len(entries) - self._max_entries]:
+                with contextlib.suppress(OSError):
+                    os.remove(entry.path)
+
+    def __str__(self):
+        return f"config-cache('{self._cache_dir}')"
@@ -0,0 +1,111 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from jsonbender import Bender, OptionalS, bend  # type: ignore
+from jsonbender.core import BendingException  # type: ignore
+
+from otterdog.utils import UNSET
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    Converter = Callable[[Any], dict[str, Any]]
+
+_FIELD_SELECTORS: dict[type, dict[str, Any]] = {}
+_MODEL_CONVERTERS: dict[type, Converter] = {}
+_PROVIDER_CONVERTERS: dict[type, Converter] = {}
+
+
+def get_field_selectors(cls: Any) -> dict[str, Any]:
+    """
+    Returns a mapping that selects every field of cls by its name, defaulting to UNSET.
+
+    The selectors are created once per class, a new dict is returned on each call so that
+    callers are free to update it.
+    """
+    selectors = _FIELD_SELECTORS.get(cls)
+    if selectors is None:
+        selectors = {k: OptionalS(k, default=UNSET) for k in (x.name for x in cls.all_fields())}
+        _FIELD_SELECTORS[cls] = selectors
+
+    return dict(selectors)
+
+
+def compile_mapping(mapping: Mapping[str, Any]) -> Converter:
+    """
+    Compiles a mapping of benders into a function that is equivalent to bend(mapping, data).
+
+    Entries that select a single key, like OptionalS(key, default=...), are performed with a plain
+    dictionary lookup while all other entries are delegated to their bender.
+    """
+    lookups: list[tuple[str, Any, Any, bool]] = []
+    benders: list[tuple[str, Any]] = []
+
+    for key, value in mapping.items():
+        if type(value) is OptionalS and len(value._path) == 1 and isinstance(value._path[0], str):
+            default = value.default
+            lookups.append((key, value._path[0], default, isinstance(default, list | dict)))
+        else:
+            benders.append((key, value))
+
+    def convert(data: Any) -> dict[str, Any]:
+        if not isinstance(data, Mapping):
+            return bend(mapping, data)
+
+        result = {}
+        for key, source_key, default, copy_default in lookups:
+            if source_key in data:
+                result[key] = data[source_key]
+            else:
+                result[key] = copy.copy(default) if copy_default else default
+
+        for key, value in benders:
+            try:
+                result[key] = value(data) if isinstance(value, Bender) else bend(value, data)
+            except Exception as ex:
+                raise BendingException(f"Error for key {key}: {ex}") from ex
+
+        return result
+
+    return convert
+
+
+def get_model_converter(cls: Any) -> Converter:
+    """
+    Returns the compiled converter for the mapping returned by cls.get_mapping_from_model(),
+    the mapping is built once per class as it does not depend on the converted data.
+    """
+    converter = _MODEL_CONVERTERS.get(cls)
+    if converter is None:
+        converter = compile_mapping(cls.get_mapping_from_model())
+        _MODEL_CONVERTERS[cls] = converter
+
+    return converter
+
+
+def get_provider_converter(cls: Any, org_id: str, data: dict[str, Any], static: bool) -> Converter:
+    """
+    Returns the compiled converter for the mapping returned by cls.get_mapping_from_provider(org_id, data).
+    If static is True, the mapping does not depend on org_id / data and is built once per class.
+    """
+    if not static:
+        return compile_mapping(cls.get_mapping_from_provider(org_id, data))
+
+    converter = _PROVIDER_CONVERTERS.get(cls)
+    if converter is None:
+        converter = compile_mapping(cls.get_mapping_from_provider(org_id, data))
+        _PROVIDER_CONVERTERS[cls] = converter
+
+    return converter
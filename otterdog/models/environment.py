@@ -35,6 +35,7 @@ from otterdog.utils import (
 
 from .environment_secret import EnvironmentSecret
 from .environment_variable import EnvironmentVariable
+from .index import find_by_key
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
@@ -74,7 +75,7 @@ class Environment(ModelObject):
         self.secrets.append(secret)
 
     def get_secret(self, name: str) -> EnvironmentSecret | None:
-        return next(filter(lambda x: x.name == name, self.secrets), None)
+        return find_by_key(self, "secrets", "name", name)
 
     def set_secrets(self, secrets: list[EnvironmentSecret]) -> None:
         self.secrets = secrets
@@ -83,7 +84,7 @@ class Environment(ModelObject):
         self.variables.append(variable)
 
     def get_variable(self, name: str) -> EnvironmentVariable | None:
-        return next(filter(lambda x: x.name == name, self.variables), None)
+        return find_by_key(self, "variables", "name", name)
 
     def set_variables(self, variables: list[EnvironmentVariable]) -> None:
         self.variables = variables
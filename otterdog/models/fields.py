@@ -0,0 +1,118 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+
+_FIELD_TABLES: dict[type, FieldTable] = {}
+
+
+def _has_flag(field: dataclasses.Field, flag: str) -> bool:
+    return field.metadata.get(flag, False) is True
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldTable:
+    """
+    The field metadata of a model class, computed once per class.
+    """
+
+    all_fields: tuple[dataclasses.Field, ...]
+    fields_by_name: dict[str, dataclasses.Field]
+    defaults: tuple[tuple[str, Any, Any], ...]
+    key_field: str | None
+    model_fields: tuple[dataclasses.Field, ...]
+    model_only_fields: tuple[dataclasses.Field, ...]
+    provider_fields: tuple[dataclasses.Field, ...]
+    has_diff_filter: bool
+    has_patch_filter: bool
+    _key_candidates: dict[tuple[bool, bool, bool], tuple[dataclasses.Field, ...]] = dataclasses.field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    @classmethod
+    def of(cls, model_class: type, base_class: type) -> FieldTable:
+        """
+        Builds the table for model_class, base_class is the class defining the default
+        include_field_for_diff_computation / include_field_for_patch_computation methods.
+        """
+        all_fields = tuple(dataclasses.fields(model_class))
+        model_fields = tuple(f for f in all_fields if not _has_flag(f, "external_only"))
+
+        defaults: list[tuple[str, Any, Any]] = []
+        for field in all_fields:
+            if field.default is not dataclasses.MISSING:
+                defaults.append((field.name, field.default, None))
+            elif field.default_factory is not dataclasses.MISSING:
+                defaults.append((field.name, None, field.default_factory))
+
+        diff_filter = getattr(model_class, "include_field_for_diff_computation", None)
+        patch_filter = getattr(model_class, "include_field_for_patch_computation", None)
+        has_diff_filter = diff_filter is not getattr(base_class, "include_field_for_diff_computation", None)
+        has_patch_filter = has_diff_filter or patch_filter is not getattr(
+            base_class, "include_field_for_patch_computation", None
+        )
+
+        return cls(
+            all_fields=all_fields,
+            fields_by_name={f.name: f for f in all_fields},
+            defaults=tuple(defaults),
+            key_field=next((f.name for f in all_fields if _has_flag(f, "key")), None),
+            model_fields=model_fields,
+            model_only_fields=tuple(f for f in all_fields if _has_flag(f, "model_only")),
+            provider_fields=tuple(
+                f
+                for f in model_fields
+                if not _has_flag(f, "model_only") and not _has_flag(f, "read_only") and not _has_flag(f, "nested_model")
+            ),
+            has_diff_filter=has_diff_filter,
+            has_patch_filter=has_patch_filter,
+        )
+
+    def get_field(self, key: str) -> dataclasses.Field:
+        field = self.fields_by_name.get(key)
+        if field is None:
+            raise ValueError(f"unknown key {key}")
+        return field
+
+    def key_candidates(
+        self,
+        for_diff_or_patch: bool,
+        include_model_only_fields: bool,
+        include_nested_models: bool,
+    ) -> tuple[dataclasses.Field, ...]:
+        """
+        Returns the model fields that are considered as keys for the given options before
+        applying any include_field_for_diff_computation / include_field_for_patch_computation filter.
+        """
+        selector = (for_diff_or_patch, include_model_only_fields, include_nested_models)
+        candidates = self._key_candidates.get(selector)
+        if candidates is None:
+            candidates = tuple(
+                f
+                for f in self.model_fields
+                if (include_model_only_fields or not for_diff_or_patch or not _has_flag(f, "model_only"))
+                and (include_nested_models or not _has_flag(f, "nested_model"))
+            )
+            self._key_candidates[selector] = candidates
+
+        return candidates
+
+
+def get_field_table(model_class: type, base_class: type) -> FieldTable:
+    """
+    Returns the FieldTable of model_class, building it on first access.
+    """
+    table = _FIELD_TABLES.get(model_class)
+    if table is None:
+        table = FieldTable.of(model_class, base_class)
+        _FIELD_TABLES[model_class] = table
+
+    return table
@@ -10,16 +10,14 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
-import json
 import os
 import re
 from io import StringIO
 from typing import TYPE_CHECKING, Any
 
-from importlib_resources import as_file, files
-from jsonbender import F, Forall, OptionalS, S, bend  # type: ignore
+from jsonbender import F, Forall, OptionalS, S  # type: ignore
 
-from otterdog import resources
+from otterdog.cache import get_config_cache, get_live_snapshot_store
 from otterdog.logging import get_logger
 from otterdog.models import (
     FailureType,
@@ -30,10 +28,12 @@ from otterdog.models import (
     ValidationContext,
 )
 from otterdog.models.branch_protection_rule import BranchProtectionRule
+from otterdog.models.converter import get_model_converter
 from otterdog.models.custom_property import CustomProperty
 from otterdog.models.environment import Environment
 from otterdog.models.environment_secret import EnvironmentSecret
 from otterdog.models.environment_variable import EnvironmentVariable
+from otterdog.models.index import find_by_key
 from otterdog.models.organization_role import OrganizationRole
 from otterdog.models.organization_ruleset import OrganizationRuleset
 from otterdog.models.organization_secret import OrganizationSecret
@@ -47,18 +47,28 @@ from otterdog.models.repo_variable import RepositoryVariable
 from otterdog.models.repo_webhook import RepositoryWebhook
 from otterdog.models.repo_workflow_settings import RepositoryWorkflowSettings
 from otterdog.models.repository import Repository
+from otterdog.models.schemas import get_schema_validator
 from otterdog.models.team import Team
-from otterdog.utils import IndentingPrinter, associate_by_key, debug_times, is_set_and_present, jsonnet_evaluate_file
+from otterdog.utils import (
+    IndentingPrinter,
+    associate_by_key,
+    current_jsonnet_import_root,
+    debug_times,
+    gather_or_cancel,
+    is_set_and_present,
+    jsonnet_evaluate_file,
+    jsonnet_evaluate_file_async,
+    jsonnet_evaluate_file_with_imports,
+    jsonnet_evaluate_file_with_imports_async,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable, Iterator
+    from collections.abc import AsyncIterator, Callable, Collection, Iterator
     from re import Pattern
 
     from otterdog.config import JsonnetConfig, OtterdogConfig, SecretResolver
     from otterdog.providers.github import GitHubProvider
 
-_ORG_SCHEMA = json.loads(files(resources).joinpath("schemas/organization.json").read_text())
-
 _logger = get_logger(__name__)
 
 
@@ -89,7 +99,7 @@ class GitHubOrganization:
         self.roles.append(role)
 
     def get_role(self, name: str) -> OrganizationRole | None:
-        return next(filter(lambda x: x.name == name, self.roles), None)  # type: ignore
+        return find_by_key(self, "roles", "name", name)
 
     def set_roles(self, roles: list[OrganizationRole]) -> None:
         self.roles = roles
@@ -98,7 +108,7 @@ class GitHubOrganization:
         self.teams.append(team)
 
     def get_team(self, name: str) -> Team | None:
-        return next(filter(lambda x: x.name == name, self.teams), None)  # type: ignore
+        return find_by_key(self, "teams", "name", name)
 
     def set_teams(self, teams: list[Team]) -> None:
         self.teams = teams
@@ -107,7 +117,7 @@ class GitHubOrganization:
         self.webhooks.append(webhook)
 
     def get_webhook(self, url: str) -> OrganizationWebhook | None:
-        return next(filter(lambda x: x.url == url, self.webhooks), None)  # type: ignore
+        return find_by_key(self, "webhooks", "url", url)
 
     def set_webhooks(self, webhooks: list[OrganizationWebhook]) -> None:
         self.webhooks = webhooks
@@ -116,7 +126,7 @@ class GitHubOrganization:
         self.secrets.append(secret)
 
     def get_secret(self, name: str) -> OrganizationSecret | None:
-        return next(filter(lambda x: x.name == name, self.secrets), None)  # type: ignore
+        return find_by_key(self, "secrets", "name", name)
 
     def set_secrets(self, secrets: list[OrganizationSecret]) -> None:
         self.secrets = secrets
@@ -125,7 +135,7 @@ class GitHubOrganization:
         self.variables.append(variable)
 
     def get_variable(self, name: str) -> OrganizationVariable | None:
-        return next(filter(lambda x: x.name == name, self.variables), None)  # type: ignore
+        return find_by_key(self, "variables", "name", name)
 
     def set_variables(self, variables: list[OrganizationVariable]) -> None:
         self.variables = variables
@@ -134,7 +144,7 @@ class GitHubOrganization:
         self.rulesets.append(ruleset)
 
     def get_ruleset(self, name: str) -> OrganizationRuleset | None:
-        return next(filter(lambda x: x.name == name, self.rulesets), None)  # type: ignore
+        return find_by_key(self, "rulesets", "name", name)
 
     def set_rulesets(self, rulesets: list[OrganizationRuleset]) -> None:
         self.rulesets = rulesets
@@ -143,7 +153,7 @@ class GitHubOrganization:
         self.repositories.append(repo)
 
     def get_repository(self, repo_name: str) -> Repository | None:
-        return next(filter(lambda x: x.name == repo_name, self.repositories), None)  # type: ignore
+        return find_by_key(self, "repositories", "name", repo_name)
 
     def set_repositories(self, repos: list[Repository]) -> None:
         self.repositories = repos
@@ -226,36 +236,22 @@ class GitHubOrganization:
         return context
 
     @staticmethod
+    @debug_times("validation")
     def _validate_org_config(data: dict[str, Any]) -> None:
-        from jsonschema import Draft202012Validator
-        from referencing import Registry, Resource
-        from referencing.exceptions import NoSuchResource
-
-        with as_file(files(resources).joinpath("schemas")) as resource_dir:
-
-            def retrieve_from_filesystem(uri: str):
-                path = resource_dir.joinpath(uri)
-                if not path.exists():
-                    raise NoSuchResource(ref=uri)  # type: ignore
-
-                contents = json.loads(path.read_text())
-                return Resource.from_contents(contents)
-
-            registry = Registry(retrieve=retrieve_from_filesystem)  # type: ignore
-            validator = Draft202012Validator(_ORG_SCHEMA, registry=registry)
-
-            blocking_errors = []
-            for error in validator.iter_errors(data):
-                if error.validator == "additionalProperties":
-                    _logger.warning(
-                        "ignoring unknown properties found while validating organization config: %s",
-                        error.message,
-                    )
-                else:
-                    blocking_errors.append(error)
+        validator = get_schema_validator("organization.json")
+
+        blocking_errors = []
+        for error in validator.iter_errors(data):
+            if error.validator == "additionalProperties":
+                _logger.warning(
+                    "ignoring unknown properties found while validating organization config: %s",
+                    error.message,
+                )
+            else:
+                blocking_errors.append(error)
 
-            if blocking_errors:
-                raise blocking_errors[0]
+        if blocking_errors:
+            raise blocking_errors[0]
 
     def get_model_objects(self) -> Iterator[tuple[ModelObject, ModelObject | None]]:
         yield self.settings, None
@@ -293,8 +289,11 @@ class GitHubOrganization:
     def from_model_data(cls, data: dict[str, Any]) -> GitHubOrganization:
         # validate the input data with the json schema.
         cls._validate_org_config(data)
+        return cls._from_validated_model_data(data)
 
-        mapping = {
+    @classmethod
+    def get_mapping_from_model(cls) -> dict[str, Any]:
+        return {
             "project_name": S("project_name"),
             "github_id": S("github_id"),
             "settings": S("settings") >> F(lambda x: OrganizationSettings.from_model_data(x)),
@@ -308,10 +307,36 @@ class GitHubOrganization:
             "repositories": OptionalS("repositories", default=[]) >> Forall(lambda x: Repository.from_model_data(x)),
         }
 
-        org = cls(**bend(mapping, data))
+    @classmethod
+    def _from_validated_model_data(cls, data: dict[str, Any]) -> GitHubOrganization:
+        org = cls(**get_model_converter(cls)(data))
         org.repositories = [x.coerce_from_org_settings(org.settings) for x in org.repositories]
         return org
 
+    def to_model_data(self) -> dict[str, Any]:
+        """
+        Returns the model data of this organization including all nested model objects.
+
+        The result is not validated again when converted back, which is only
+        safe for data that has been produced by this method.
+        """
+
+        def to_dict(model_object: ModelObject) -> dict[str, Any]:
+            return model_object.to_model_dict(include_model_only_fields=True, include_nested_models=True)
+
+        return {
+            "project_name": self.project_name,
+            "github_id": self.github_id,
+            "settings": to_dict(self.settings),
+            "roles": [to_dict(x) for x in self.roles],
+            "teams": [to_dict(x) for x in self.teams],
+            "webhooks": [to_dict(x) for x in self.webhooks],
+            "secrets": [to_dict(x) for x in self.secrets],
+            "variables": [to_dict(x) for x in self.variables],
+            "rulesets": [to_dict(x) for x in self.rulesets],
+            "repositories": [to_dict(x) for x in self.repositories],
+        }
+
     def resolve_secrets(self, secret_resolver: Callable[[str], str]) -> None:
         for webhook in self.webhooks:
             webhook.resolve_secrets(secret_resolver)
@@ -514,9 +539,42 @@ class GitHubOrganization:
             raise RuntimeError(msg)
 
         _logger.debug("loading configuration for organization '%s' from file '%s'", github_id, config_file)
-        data = jsonnet_evaluate_file(config_file)
 
-        return cls.from_model_data(data)
+        config_cache = get_config_cache()
+        if config_cache is None:
+            return cls.from_model_data(jsonnet_evaluate_file(config_file))
+
+        data = config_cache.get(config_file, current_jsonnet_import_root())
+        if data is None:
+            data, files = jsonnet_evaluate_file_with_imports(config_file)
+            cls._validate_org_config(data)
+            config_cache.put(config_file, data, files)
+
+        return cls._from_validated_model_data(data)
+
+    @classmethod
+    async def load_from_file_async(cls, github_id: str, config_file: str) -> GitHubOrganization:
+        """
+        Same as load_from_file, but evaluates the configuration using the configured JsonnetEngine
+        if available to not block the event loop.
+        """
+        if not os.path.exists(config_file):
+            msg = f"configuration file '{config_file}' for organization '{github_id}' does not exist"
+            raise RuntimeError(msg)
+
+        _logger.debug("loading configuration for organization '%s' from file '%s'", github_id, config_file)
+
+        config_cache = get_config_cache()
+        if config_cache is None:
+            return cls.from_model_data(await jsonnet_evaluate_file_async(config_file))
+
+        data = await asyncio.to_thread(config_cache.get, config_file, current_jsonnet_import_root())
+        if data is None:
+            data, files = await jsonnet_evaluate_file_with_imports_async(config_file)
+            cls._validate_org_config(data)
+            await asyncio.to_thread(config_cache.put, config_file, data, files)
+
+        return cls._from_validated_model_data(data)
 
     @classmethod
     async def load_from_provider(
@@ -529,9 +587,86 @@ class GitHubOrganization:
         concurrency: int | None = None,
         repo_filter: str | None = None,
         exclude_teams: Pattern | None = None,
+        bulk_repo_loading: bool = True,
+        max_age: float | None = None,
+        scope: OrganizationScope | None = None,
+    ) -> GitHubOrganization:
+        """
+        Loads the live state of an organization from GitHub.
+
+        If a live snapshot store is configured, the loaded organization is stored as snapshot.
+        If max_age is given, a stored snapshot not older than max_age seconds is used if available
+        instead of retrieving the organization from GitHub again.
+
+        If a scope is given, only the parts of the organization included in the scope are loaded,
+        snapshots are neither used nor stored in that case.
+        """
+        snapshot_store = get_live_snapshot_store()
+        if snapshot_store is None or scope is not None:
+            return await cls._load_from_provider(
+                project_name,
+                github_id,
+                jsonnet_config,
+                provider,
+                no_web_ui,
+                concurrency,
+                repo_filter,
+                exclude_teams,
+                bulk_repo_loading,
+                scope,
+            )
+
+        def get_snapshot_key() -> str:
+            return snapshot_store.get_key(
+                project_name,
+                jsonnet_config.template_hash,
+                no_web_ui,
+                repo_filter,
+                exclude_teams.pattern if exclude_teams is not None else None,
+            )
+
+        snapshot_key = await asyncio.to_thread(get_snapshot_key)
+
+        if max_age is not None:
+            data = await asyncio.to_thread(snapshot_store.get, github_id, snapshot_key, max_age)
+            if data is not None:
+                return cls(**get_model_converter(cls)(data))
+
+        org = await cls._load_from_provider(
+            project_name,
+            github_id,
+            jsonnet_config,
+            provider,
+            no_web_ui,
+            concurrency,
+            repo_filter,
+            exclude_teams,
+            bulk_repo_loading,
+            None,
+        )
+
+        await asyncio.to_thread(snapshot_store.put, github_id, snapshot_key, org.to_model_data())
+        return org
+
+    @classmethod
+    async def _load_from_provider(
+        cls,
+        project_name: str,
+        github_id: str,
+        jsonnet_config: JsonnetConfig,
+        provider: GitHubProvider,
+        no_web_ui: bool,
+        concurrency: int | None,
+        repo_filter: str | None,
+        exclude_teams: Pattern | None,
+        bulk_repo_loading: bool,
+        scope: OrganizationScope | None,
     ) -> GitHubOrganization:
         import asyncer
 
+        if scope is None:
+            scope = OrganizationScope()
+
         app_installations = {
             str(installation["app_id"]): installation["app_slug"]
             for installation in await provider.rest_api.org.get_app_installations(github_id)
@@ -569,6 +704,9 @@ class GitHubOrganization:
 
         @debug_times("roles")
         async def _load_roles() -> None:
+            if not scope.roles:
+                return
+
             if jsonnet_config.default_org_role_config is not None and org.settings.plan == "enterprise":
                 github_roles = await provider.get_org_custom_roles(github_id)
                 for role in github_roles:
@@ -578,6 +716,9 @@ class GitHubOrganization:
 
         @debug_times("teams")
         async def _load_teams() -> None:
+            if not scope.teams:
+                return
+
             if jsonnet_config.default_team_config is not None:
                 default_org = GitHubOrganization.from_model_data(
                     jsonnet_config.default_org_config_for_org_id(project_name, github_id)
@@ -603,6 +744,9 @@ class GitHubOrganization:
 
         @debug_times("webhooks")
         async def _load_webhooks() -> None:
+            if not scope.webhooks:
+                return
+
             if jsonnet_config.default_org_webhook_config is not None:
                 github_webhooks = await provider.get_org_webhooks(github_id)
                 for webhook in github_webhooks:
@@ -612,6 +756,9 @@ class GitHubOrganization:
 
         @debug_times("secrets")
         async def _load_secrets() -> None:
+            if not scope.secrets:
+                return
+
             if jsonnet_config.default_org_secret_config is not None:
                 github_secrets = await provider.get_org_secrets(github_id)
                 for secret in github_secrets:
@@ -621,6 +768,9 @@ class GitHubOrganization:
 
         @debug_times("variables")
         async def _load_variables() -> None:
+            if not scope.variables:
+                return
+
             if jsonnet_config.default_org_variable_config is not None:
                 github_variables = await provider.get_org_variables(github_id)
                 for variable in github_variables:
@@ -630,6 +780,9 @@ class GitHubOrganization:
 
         @debug_times("rulesets")
         async def _load_rulesets() -> None:
+            if not scope.rulesets:
+                return
+
             if jsonnet_config.default_org_ruleset_config is not None:
                 _logger.debug("loading org rulesets for org '%s' (plan=%s)", github_id, org.settings.plan)
                 github_rulesets = await provider.get_org_rulesets(github_id)
@@ -654,6 +807,9 @@ class GitHubOrganization:
 
         @debug_times("repos")
         async def _load_repos() -> None:
+            if scope.repositories is not None and len(scope.repositories) == 0:
+                return
+
             if jsonnet_config.default_repo_config is not None:
                 async for repo in _load_repos_from_provider(
                     github_id,
@@ -662,6 +818,8 @@ class GitHubOrganization:
                     app_installations,
                     concurrency,
                     repo_filter,
+                    bulk_repo_loading,
+                    scope.repositories,
                 ):
                     org.add_repository(repo)
             else:
@@ -679,6 +837,96 @@ class GitHubOrganization:
         return org
 
 
+@dataclasses.dataclass(frozen=True)
+class OrganizationScope:
+    """
+    Describes the parts of an organization that are loaded from GitHub and compared.
+
+    All parts except repositories are either included as a whole or not at all, repositories
+    are included by name with None including all of them. The settings of an organization
+    are always loaded as other parts depend on them, but only compared if included.
+    """
+
+    settings: bool = True
+    roles: bool = True
+    teams: bool = True
+    webhooks: bool = True
+    secrets: bool = True
+    variables: bool = True
+    rulesets: bool = True
+    repositories: frozenset[str] | None = None
+
+    def includes_repository(self, repo_name: str) -> bool:
+        return self.repositories is None or repo_name in self.repositories
+
+    @classmethod
+    def of_changes(cls, base_org: GitHubOrganization, head_org: GitHubOrganization) -> OrganizationScope:
+        """
+        Returns a scope that includes all parts that differ between the two organizations.
+        Changed repositories are included by all their names, including aliases.
+        """
+        repositories: set[str] = set()
+
+        for base_repo in base_org.repositories:
+            head_repo = head_org.get_repository(base_repo.name)
+            if head_repo != base_repo:
+                repositories.update(base_repo.get_all_names())
+                if head_repo is not None:
+                    repositories.update(head_repo.get_all_names())
+
+        for head_repo in head_org.repositories:
+            if base_org.get_repository(head_repo.name) is None:
+                repositories.update(head_repo.get_all_names())
+
+        return cls(
+            settings=base_org.settings != head_org.settings,
+            roles=base_org.roles != head_org.roles,
+            teams=base_org.teams != head_org.teams,
+            webhooks=base_org.webhooks != head_org.webhooks,
+            secrets=base_org.secrets != head_org.secrets,
+            variables=base_org.variables != head_org.variables,
+            rulesets=base_org.rulesets != head_org.rulesets,
+            repositories=frozenset(repositories),
+        )
+
+    def restrict(self, expected_org: GitHubOrganization, current_org: GitHubOrganization) -> None:
+        """
+        Removes all parts that are not included in this scope from both organizations,
+        so that only the included parts are compared.
+        """
+        if not self.settings:
+            current_org.settings = expected_org.settings
+
+        for org in (expected_org, current_org):
+            if not self.roles:
+                org.set_roles([])
+            if not self.teams:
+                org.set_teams([])
+            if not self.webhooks:
+                org.set_webhooks([])
+            if not self.secrets:
+                org.set_secrets([])
+            if not self.variables:
+                org.set_variables([])
+            if not self.rulesets:
+                org.set_rulesets([])
+            if self.repositories is not None:
+                org.set_repositories([x for x in org.repositories if self.includes_repository(x.name)])
+
+    def __str__(self) -> str:
+        parts = [
+            name
+            for name in ("settings", "roles", "teams", "webhooks", "secrets", "variables", "rulesets")
+            if getattr(self, name)
+        ]
+        if self.repositories is None:
+            parts.append("repositories")
+        elif len(self.repositories) > 0:
+            parts.append(f"repositories[{', '.join(sorted(self.repositories))}]")
+
+        return f"scope({', '.join(parts)})"
+
+
 async def _process_single_repo(
     gh_client: GitHubProvider,
     github_id: str,
@@ -687,31 +935,40 @@ async def _process_single_repo(
     teams: dict[str, Any],
     repo_permissions: dict[str, list[dict[str, Any]]] | None,
     app_installations: dict[str, str],
+    prefetched_data: dict[str, Any] | None = None,
 ) -> tuple[str, Repository]:
     rest_api = gh_client.rest_api
 
-    # get repo data
-    github_repo_data = await rest_api.repo.get_repo_data(github_id, repo_name)
-    repo = Repository.from_provider_data(github_id, github_repo_data)
+    # the different parts of a repo are retrieved concurrently, only the workflow
+    # settings depend on the repo data as they differ for private repos.
 
-    is_private = github_repo_data.get("private", False)
-    github_repo_workflow_data = await rest_api.repo.get_workflow_settings(github_id, repo_name, is_private=is_private)
-    repo.workflows = RepositoryWorkflowSettings.from_provider_data(github_id, github_repo_workflow_data)
-    if repo_permissions is not None:
-        repo_permission = repo_permissions.get(repo_name, [])
-        repo.set_team_permissions({entry["name"]: entry["permission"] for entry in repo_permission})
-    else:
-        repo.unset_team_permissions()
+    async def _get_repo_data() -> tuple[dict[str, Any], dict[str, Any]]:
+        github_repo_data = await rest_api.repo.get_repo_data(github_id, repo_name, prefetched_data)
+
+        is_private = github_repo_data.get("private", False)
+        github_repo_workflow_data = await rest_api.repo.get_workflow_settings(
+            github_id, repo_name, is_private=is_private
+        )
+        return github_repo_data, github_repo_workflow_data
+
+    async def _get_branch_protection_rules() -> list[BranchProtectionRule]:
+        if jsonnet_config.default_branch_protection_rule_config is None:
+            _logger.debug("not reading branch protection rules, no default config available")
+            return []
 
-    if jsonnet_config.default_branch_protection_rule_config is not None:
         # get branch protection rules of the repo
-        rules = await gh_client.get_branch_protection_rules(github_id, repo_name)
-        for github_rule in rules:
-            repo.add_branch_protection_rule(BranchProtectionRule.from_provider_data(github_id, github_rule))
-    else:
-        _logger.debug("not reading branch protection rules, no default config available")
+        if prefetched_data is not None and "branch_protection_rules" in prefetched_data:
+            rules = prefetched_data["branch_protection_rules"]
+        else:
+            rules = await gh_client.get_branch_protection_rules(github_id, repo_name)
+
+        return [BranchProtectionRule.from_provider_data(github_id, github_rule) for github_rule in rules]
+
+    async def _get_rulesets() -> list[RepositoryRuleset]:
+        if jsonnet_config.default_repo_ruleset_config is None:
+            _logger.debug("not reading repo rulesets, no default config available")
+            return []
 
-    if jsonnet_config.default_repo_ruleset_config is not None:
         # get rulesets of the repo
         rulesets = await rest_api.repo.get_rulesets(github_id, repo_name)
         for github_ruleset in rulesets:
@@ -736,60 +993,123 @@ async def _process_single_repo(
                         if integration_id in app_installations:
                             status_check["app_slug"] = app_installations[integration_id]
 
-            repo.add_ruleset(RepositoryRuleset.from_provider_data(github_id, github_ruleset))
-    else:
-        _logger.debug("not reading repo rulesets, no default config available")
+        return [RepositoryRuleset.from_provider_data(github_id, github_ruleset) for github_ruleset in rulesets]
+
+    async def _get_webhooks() -> list[RepositoryWebhook]:
+        if jsonnet_config.default_org_webhook_config is None:
+            _logger.debug("not reading repo webhooks, no default config available")
+            return []
 
-    if jsonnet_config.default_org_webhook_config is not None:
         # get webhooks of the repo
         webhooks = await rest_api.repo.get_webhooks(github_id, repo_name)
-        for github_webhook in webhooks:
-            repo.add_webhook(RepositoryWebhook.from_provider_data(github_id, github_webhook))
-    else:
-        _logger.debug("not reading repo webhooks, no default config available")
+        return [RepositoryWebhook.from_provider_data(github_id, github_webhook) for github_webhook in webhooks]
+
+    async def _get_secrets() -> list[RepositorySecret]:
+        if jsonnet_config.default_repo_secret_config is None:
+            _logger.debug("not reading repo secrets, no default config available")
+            return []
 
-    if jsonnet_config.default_repo_secret_config is not None:
         # get secrets of the repo
         secrets = await rest_api.repo.get_secrets(github_id, repo_name)
-        for github_secret in secrets:
-            repo.add_secret(RepositorySecret.from_provider_data(github_id, github_secret))
-    else:
-        _logger.debug("not reading repo secrets, no default config available")
+        return [RepositorySecret.from_provider_data(github_id, github_secret) for github_secret in secrets]
+
+    async def _get_variables() -> list[RepositoryVariable]:
+        if jsonnet_config.default_repo_variable_config is None:
+            _logger.debug("not reading repo variables, no default config available")
+            return []
 
-    if jsonnet_config.default_repo_variable_config is not None:
         # get variables of the repo
         variables = await rest_api.repo.get_variables(github_id, repo_name)
-        for github_variable in variables:
-            repo.add_variable(RepositoryVariable.from_provider_data(github_id, github_variable))
-    else:
-        _logger.debug("not reading repo variables, no default config available")
+        return [RepositoryVariable.from_provider_data(github_id, github_variable) for github_variable in variables]
+
+    async def _get_environment_secrets(env_name: str) -> list[EnvironmentSecret]:
+        if jsonnet_config.default_environment_secret_config is None:
+            _logger.debug("not reading environment secrets, no default config available")
+            return []
+
+        # get secrets of the environment
+        env_secrets = await rest_api.repo.get_environment_secrets(github_id, repo_name, env_name)
+        return [EnvironmentSecret.from_provider_data(github_id, github_secret) for github_secret in env_secrets]
+
+    async def _get_environment_variables(env_name: str) -> list[EnvironmentVariable]:
+        if jsonnet_config.default_environment_variable_config is None:
+            _logger.debug("not reading environment variables, no default config available")
+            return []
+
+        # get variables of the environment
+        env_variables = await rest_api.repo.get_environment_variables(github_id, repo_name, env_name)
+        return [EnvironmentVariable.from_provider_data(github_id, github_variable) for github_variable in env_variables]
+
+    async def _get_environment(github_environment: dict[str, Any]) -> Environment:
+        env = Environment.from_provider_data(github_id, github_environment)
+        env.repo_name = repo_name
+
+        env_secrets, env_variables = await gather_or_cancel(
+            _get_environment_secrets(env.name),
+            _get_environment_variables(env.name),
+        )
+
+        for env_secret in env_secrets:
+            env.add_secret(env_secret)
+
+        for env_variable in env_variables:
+            env.add_variable(env_variable)
+
+        return env
+
+    async def _get_environments() -> list[Environment]:
+        if jsonnet_config.default_environment_config is None:
+            _logger.debug("not reading environments, no default config available")
+            return []
 
-    if jsonnet_config.default_environment_config is not None:
         # get environments of the repo
         environments = await rest_api.repo.get_environments(github_id, repo_name)
-        for github_environment in environments:
-            env = Environment.from_provider_data(github_id, github_environment)
-            env.repo_name = repo_name
-
-            if jsonnet_config.default_environment_secret_config is not None:
-                # get secrets of the environment
-                env_secrets = await rest_api.repo.get_environment_secrets(github_id, repo_name, env.name)
-                for github_secret in env_secrets:
-                    env.add_secret(EnvironmentSecret.from_provider_data(github_id, github_secret))
-            else:
-                _logger.debug("not reading environment secrets, no default config available")
+        return await gather_or_cancel(*[_get_environment(github_environment) for github_environment in environments])
+
+    (
+        (github_repo_data, github_repo_workflow_data),
+        branch_protection_rules,
+        rulesets,
+        webhooks,
+        secrets,
+        variables,
+        environments,
+    ) = await gather_or_cancel(
+        _get_repo_data(),
+        _get_branch_protection_rules(),
+        _get_rulesets(),
+        _get_webhooks(),
+        _get_secrets(),
+        _get_variables(),
+        _get_environments(),
+    )
 
-            if jsonnet_config.default_environment_variable_config is not None:
-                # get variables of the environment
-                env_variables = await rest_api.repo.get_environment_variables(github_id, repo_name, env.name)
-                for github_variable in env_variables:
-                    env.add_variable(EnvironmentVariable.from_provider_data(github_id, github_variable))
-            else:
-                _logger.debug("not reading environment variables, no default config available")
+    repo = Repository.from_provider_data(github_id, github_repo_data)
+    repo.workflows = RepositoryWorkflowSettings.from_provider_data(github_id, github_repo_workflow_data)
 
-            repo.add_environment(env)
+    if repo_permissions is not None:
+        repo_permission = repo_permissions.get(repo_name, [])
+        repo.set_team_permissions({entry["name"]: entry["permission"] for entry in repo_permission})
     else:
-        _logger.debug("not reading environments, no default config available")
+        repo.unset_team_permissions()
+
+    for branch_protection_rule in branch_protection_rules:
+        repo.add_branch_protection_rule(branch_protection_rule)
+
+    for ruleset in rulesets:
+        repo.add_ruleset(ruleset)
+
+    for webhook in webhooks:
+        repo.add_webhook(webhook)
+
+    for secret in secrets:
+        repo.add_secret(secret)
+
+    for variable in variables:
+        repo.add_variable(variable)
+
+    for env in environments:
+        repo.add_environment(env)
 
     _logger.debug("done retrieving data for repo '%s'", repo_name)
 
@@ -827,14 +1147,11 @@ async def _load_repos_from_provider(
     app_installations: dict[str, str],
     concurrency: int | None = None,
     repo_filter: str | None = None,
+    bulk: bool = True,
+    repo_names: Collection[str] | None = None,
 ) -> AsyncIterator[Repository]:
     import fnmatch
 
-    repo_names = await provider.get_repos(github_id)
-
-    if repo_filter is not None:
-        repo_names = fnmatch.filter(repo_names, repo_filter)
-
     teams = {str(team["id"]): f"{github_id}/{team['slug']}" for team in await provider.get_org_teams(github_id)}
 
     default_org_repo = Repository.from_model_data(jsonnet_config.default_repo_config)
@@ -843,10 +1160,11 @@ async def _load_repos_from_provider(
     else:
         repo_permissions = None
 
-    # limit the number of repos that are processed concurrently to avoid hitting secondary rate limits
+    # limit the number of repos that are processed concurrently, the actual request rate
+    # is governed by the rate limit aware scheduler of the rest api requester.
     sem = asyncio.Semaphore(50 if concurrency is None else concurrency)
 
-    async def safe_process(repo_name):
+    async def safe_process(repo_name, prefetched_data):
         async with sem:
             return await _process_single_repo(
                 provider,
@@ -856,26 +1174,48 @@ async def _load_repos_from_provider(
                 teams,
                 repo_permissions,
                 app_installations,
+                prefetched_data,
             )
 
-    if concurrency is not None:
-        chunk_size = 50
-        result = []
-        for chunk in divide_chunks(repo_names, chunk_size):
-            result.extend(await asyncio.gather(*[safe_process(repo_name) for repo_name in chunk]))
-
-            # after processing a full chunk, wait for 30s to avoid hitting secondary rate limits
-            if len(chunk) == chunk_size:
-                await asyncio.sleep(30)
-    else:
-        result = await asyncio.gather(*[safe_process(repo_name) for repo_name in repo_names])
+    tasks: dict[str, asyncio.Task] = {}
+
+    def schedule(repo_name: str, prefetched_data: dict[str, Any] | None = None) -> None:
+        if (
+            repo_name not in tasks
+            and (repo_filter is None or fnmatch.fnmatch(repo_name, repo_filter))
+            and (repo_names is None or repo_name in repo_names)
+        ):
+            tasks[repo_name] = asyncio.create_task(safe_process(repo_name, prefetched_data))
+
+    # a filter without wildcards or a list of repo names targets only a few repos,
+    # loading all repos in bulk does not pay off then
+    if repo_names is not None or (repo_filter is not None and not any(c in repo_filter for c in "*?[")):
+        bulk = False
+
+    # start processing repos while the list of repos is still being retrieved
+    try:
+        if bulk:
+            try:
+                with_branch_protection_rules = jsonnet_config.default_branch_protection_rule_config is not None
+                async for repo_name, prefetched_data in provider.iter_repos_with_data(
+                    github_id, with_branch_protection_rules
+                ):
+                    schedule(repo_name, prefetched_data)
+            except RuntimeError as ex:
+                # repos that have not been scheduled yet are loaded without any prefetched data
+                _logger.warning("failed loading repos in bulk, falling back to loading them one by one: %s", ex)
+                bulk = False
+
+        if not bulk:
+            async for repo_name in provider.iter_repos(github_id):
+                schedule(repo_name)
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    result = await asyncio.gather(*tasks.values())
 
     for data in result:
         _, repo_data = data
         yield repo_data
-
-
-def divide_chunks(input_list, n):
-    # looping till length of input_list
-    for i in range(0, len(input_list), n):
-        yield input_list[i : i + n]
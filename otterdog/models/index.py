@@ -0,0 +1,71 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+from typing import Any
+
+_INDEXES_ATTRIBUTE = "_key_indexes"
+
+
+class KeyIndex:
+    """
+    A lazily built index of a list of objects by the value of one of their attributes.
+
+    The index is rebuilt when the indexed list has been replaced or its length changed,
+    or when the object found for a key does not carry that key anymore.
+    If several objects share the same key, the first one is returned.
+    """
+
+    __slots__ = ("_index", "_key_attr", "_objects", "_size")
+
+    def __init__(self, key_attr: str) -> None:
+        self._key_attr = key_attr
+        self._objects: list[Any] | None = None
+        self._size = 0
+        self._index: dict[Any, Any] = {}
+
+    def get(self, objects: list[Any], key: Any) -> Any | None:
+        if objects is not self._objects or len(objects) != self._size:
+            self._rebuild(objects)
+
+        obj = self._index.get(key)
+        if obj is not None and getattr(obj, self._key_attr) != key:
+            self._rebuild(objects)
+            obj = self._index.get(key)
+
+        return obj
+
+    def _rebuild(self, objects: list[Any]) -> None:
+        index: dict[Any, Any] = {}
+        for obj in objects:
+            index.setdefault(getattr(obj, self._key_attr), obj)
+
+        self._objects = objects
+        self._size = len(objects)
+        self._index = index
+
+
+def find_by_key(owner: Any, children_attr: str, key_attr: str, key: Any) -> Any | None:
+    """
+    Returns the first object in the list owner.<children_attr> whose attribute key_attr equals key.
+
+    The index is stored on the owner outside its dataclass fields, so it does not take part
+    in comparison or field iteration.
+    """
+    indexes = owner.__dict__.get(_INDEXES_ATTRIBUTE)
+    if indexes is None:
+        indexes = {}
+        owner.__dict__[_INDEXES_ATTRIBUTE] = indexes
+
+    index = indexes.get(children_attr)
+    if index is None:
+        index = KeyIndex(key_attr)
+        indexes[children_attr] = index
+
+    return index.get(getattr(owner, children_attr), key)
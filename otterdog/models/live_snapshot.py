@@ -0,0 +1,134 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+from otterdog import __version__
+from otterdog.logging import get_logger
+
+if TYPE_CHECKING:
+    from typing import Any
+
+_LIVE_SNAPSHOT_DIR = ".cache/live"
+_ENTRY_SUFFIX = ".json.gz"
+
+# increase when the layout of a snapshot changes, snapshots of other otterdog versions
+# are never used as the model might have changed in between
+_SNAPSHOT_FORMAT = 1
+_SNAPSHOT_VERSION = f"{_SNAPSHOT_FORMAT}-{__version__}"
+
+_logger = get_logger(__name__)
+
+
+class LiveSnapshotStore:
+    """
+    Stores snapshots of the live state of organizations as retrieved from GitHub on disk.
+
+    A snapshot is the model data of an organization together with the time it has been retrieved,
+    written as gzip compressed json. Snapshots are keyed by the organization and by all parameters
+    that influence what is retrieved, see get_key, and are only used if they are not older than
+    the maximum age requested by the caller.
+    """
+
+    def __init__(self, snapshot_dir: str = _LIVE_SNAPSHOT_DIR, max_entries_per_org: int = 8):
+        self._snapshot_dir = snapshot_dir
+        self._max_entries_per_org = max_entries_per_org
+
+    @staticmethod
+    def get_key(*parameters: Any) -> str:
+        """
+        Returns the key of a snapshot retrieved with the given parameters.
+        """
+        return hashlib.sha256(json.dumps(parameters, default=str).encode("utf-8")).hexdigest()
+
+    def _get_org_dir(self, github_id: str) -> str:
+        return os.path.join(self._snapshot_dir, github_id)
+
+    def _get_path(self, github_id: str, key: str) -> str:
+        return os.path.join(self._get_org_dir(github_id), f"{key}{_ENTRY_SUFFIX}")
+
+    def get(self, github_id: str, key: str, max_age: float) -> dict[str, Any] | None:
+        """
+        Returns the model data of the snapshot for the given organization and key,
+        or None if no such snapshot exists or if it is older than max_age seconds.
+        """
+        try:
+            with gzip.open(self._get_path(github_id, key), "rt", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, EOFError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("version") != _SNAPSHOT_VERSION:
+            return None
+
+        age = time.time() - entry["timestamp"]
+        if age > max_age:
+            _logger.debug("live snapshot of organization '%s' is outdated (age %.0fs)", github_id, age)
+            return None
+
+        _logger.debug("using live snapshot of organization '%s' (age %.0fs)", github_id, age)
+        return entry["data"]
+
+    def put(self, github_id: str, key: str, data: dict[str, Any]) -> None:
+        """
+        Stores the model data of the given organization as its current snapshot for the given key.
+        """
+        entry = {
+            "version": _SNAPSHOT_VERSION,
+            "github_id": github_id,
+            "timestamp": time.time(),
+            "data": data,
+        }
+
+        path = self._get_path(github_id, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # write to a temporary file first to avoid readers seeing partially written entries
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as file:
+                json.dump(entry, file, separators=(",", ":"))
+
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as ex:
+            _logger.warning("failed to store live snapshot of organization '%s': %s", github_id, ex)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            return
+
+        self._evict_entries(github_id)
+
+    def invalidate(self, github_id: str) -> None:
+        """
+        Removes all snapshots of the given organization, e.g. after changes have been applied to it.
+        """
+        _logger.debug("invalidating live snapshots of organization '%s'", github_id)
+        shutil.rmtree(self._get_org_dir(github_id), ignore_errors=True)
+
+    def _evict_entries(self, github_id: str) -> None:
+        with os.scandir(self._get_org_dir(github_id)) as it:
+            entries = [entry for entry in it if entry.name.endswith(_ENTRY_SUFFIX)]
+
+        if len(entries) > self._max_entries_per_org:
+            entries.sort(key=lambda x: x.stat().st_mtime_ns)
+            for entry in entries[: len(entries) - self._max_entries_per_org]:
+                with contextlib.suppress(OSError):
+                    os.remove(entry.path)
+
+    def __str__(self):
+        return f"live-snapshot-store('{self._snapshot_dir}')"
@@ -37,6 +37,7 @@ from otterdog.utils import (
 
 from .branch_protection_rule import BranchProtectionRule
 from .environment import Environment
+from .index import find_by_key
 from .repo_ruleset import RepositoryRuleset
 from .repo_secret import RepositorySecret
 from .repo_variable import RepositoryVariable
@@ -239,7 +240,7 @@ class Repository(ModelObject):
         self.webhooks.append(webhook)
 
     def get_webhook(self, url: str) -> RepositoryWebhook | None:
-        return next(filter(lambda x: x.url == url, self.webhooks), None)  # type: ignore
+        return find_by_key(self, "webhooks", "url", url)
 
     def set_webhooks(self, webhooks: list[RepositoryWebhook]) -> None:
         self.webhooks = webhooks
@@ -248,7 +249,7 @@ class Repository(ModelObject):
         self.secrets.append(secret)
 
     def get_secret(self, name: str) -> RepositorySecret | None:
-        return next(filter(lambda x: x.name == name, self.secrets), None)  # type: ignore
+        return find_by_key(self, "secrets", "name", name)
 
     def set_secrets(self, secrets: list[RepositorySecret]) -> None:
         self.secrets = secrets
@@ -257,7 +258,7 @@ class Repository(ModelObject):
         self.variables.append(variable)
 
     def get_variable(self, name: str) -> RepositoryVariable | None:
-        return next(filter(lambda x: x.name == name, self.variables), None)  # type: ignore
+        return find_by_key(self, "variables", "name", name)
 
     def set_variables(self, variables: list[RepositoryVariable]) -> None:
         self.variables = variables
@@ -266,7 +267,7 @@ class Repository(ModelObject):
         self.environments.append(environment)
 
     def get_environment(self, name: str) -> Environment | None:
-        return next(filter(lambda x: x.name == name, self.environments), None)
+        return find_by_key(self, "environments", "name", name)
 
     def set_environments(self, environments: list[Environment]) -> None:
         self.environments = environments
@@ -0,0 +1,68 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+
+from importlib_resources import files
+
+from otterdog import resources
+
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+    from referencing import Registry
+
+_lock = threading.Lock()
+_registry: Registry | None = None
+_validators: dict[str, Draft202012Validator] = {}
+
+
+def _load_registry() -> Registry:
+    from referencing import Registry, Resource
+    from referencing.jsonschema import DRAFT202012
+
+    schema_dir = files(resources).joinpath("schemas")
+    schemas = []
+    for path in schema_dir.iterdir():
+        if path.name.endswith(".json"):
+            contents = json.loads(path.read_text())
+            schemas.append((path.name, Resource.from_contents(contents, default_specification=DRAFT202012)))
+
+    return Registry().with_resources(schemas).crawl()  # type: ignore
+
+
+def get_schema_validator(schema_file: str) -> Draft202012Validator:
+    """
+    Returns a validator for the given schema file from the bundled schemas.
+
+    All bundled schemas are loaded into a single registry once per process so that
+    references between them are resolved without accessing the filesystem again.
+    Validators are created once per schema file and shared afterward.
+    """
+    validator = _validators.get(schema_file)
+    if validator is not None:
+        return validator
+
+    from jsonschema import Draft202012Validator
+
+    global _registry
+
+    with _lock:
+        validator = _validators.get(schema_file)
+        if validator is None:
+            if _registry is None:
+                _registry = _load_registry()
+
+            schema = _registry.contents(schema_file)
+            validator = Draft202012Validator(schema, registry=_registry)
+            _validators[schema_file] = validator
+
+    return validator
@@ -8,9 +8,10 @@
 
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Self
 
 from rich.markup import escape
 
@@ -68,6 +69,21 @@ class Operation(ABC):
     def post_execute(self) -> None:
         return
 
+    def fork(self, printer: IndentingPrinter) -> Self:
+        """
+        Returns a copy of this operation that writes to the given printer,
+        used to execute multiple organizations concurrently.
+        """
+        forked = copy.copy(self)
+        forked.printer = printer
+        return forked
+
+    def join(self, forked: Self) -> None:
+        """
+        Collects the results of a forked operation, called in the order of organizations.
+        """
+        return
+
     async def check_config_file_exists(self, file_name: str) -> bool:
         from aiofiles import ospath
 
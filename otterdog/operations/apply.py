@@ -10,9 +10,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from otterdog.cache import get_live_snapshot_store
+from otterdog.hooks import get_hook_registry
 from otterdog.models import LivePatch, LivePatchType
 from otterdog.utils import Change, IndentingPrinter, get_approval
 
+from .apply_engine import apply_patches, build_dependencies, order_patches
 from .plan import PlanOperation
 
 if TYPE_CHECKING:
@@ -38,12 +41,16 @@ class ApplyOperation(PlanOperation):
         delete_resources: bool,
         resolve_secrets: bool = True,
         include_resources_with_secrets: bool = True,
+        serial: bool = False,
+        apply_concurrency: int = 8,
     ):
         super().__init__(no_web_ui, repo_filter, update_webhooks, update_secrets, only_secrets, update_filter)
         self._force_processing = force_processing
         self._delete_resources = delete_resources
         self._resolve_secrets = resolve_secrets
         self._include_resources_with_secrets = include_resources_with_secrets
+        self._serial = serial
+        self._apply_concurrency = apply_concurrency
 
     def init(self, config: OtterdogConfig, printer: IndentingPrinter) -> None:
         super().init(config, printer)
@@ -127,30 +134,40 @@ class ApplyOperation(PlanOperation):
 
         self.printer.println("\nApplying changes:")
 
-        # order patches by readonly status:
-        # - first: the patches that do not make a resource readonly
-        # - second: remaining patches
-        # this is necessary as readonly resources can't be modified afterward, so we perform first
-        # any necessary modification on them, and make them readonly at the end
-        patches_ordered_by_readonly_status = [p for p in patches if p.changes_object_to_readonly is False] + [
-            p for p in patches if p.changes_object_to_readonly is True
-        ]
+        patches_ordered_by_readonly_status = order_patches(patches)
 
         with Progress(console=self.printer.console) as progress:
             task = progress.add_task(self.printer.current_indentation, total=len(patches_ordered_by_readonly_status))
-            for patch in patches_ordered_by_readonly_status:
+
+            async def apply_patch(patch: LivePatch) -> None:
+                nonlocal errors
+
                 if patch.patch_type == LivePatchType.REMOVE and not self._delete_resources:
                     progress.advance(task)
-                    continue
-                else:
-                    try:
-                        await patch.apply(org_id, self.gh_client)
-                    except RuntimeError as ex:
-                        errors += 1
-                        self.printer.println()
-                        self.printer.print_error(f"failed to apply patch: {patch!r}\n{ex}")
-                    finally:
-                        progress.advance(task)
+                    return
+
+                try:
+                    await patch.apply(org_id, self.gh_client)
+                except RuntimeError as ex:
+                    errors += 1
+                    self.printer.println()
+                    self.printer.print_error(f"failed to apply patch: {patch!r}\n{ex}")
+                finally:
+                    progress.advance(task)
+
+            if self._serial:
+                for patch in patches_ordered_by_readonly_status:
+                    await apply_patch(patch)
+            else:
+                dependencies = build_dependencies(org_id, patches_ordered_by_readonly_status)
+                await apply_patches(
+                    patches_ordered_by_readonly_status, dependencies, apply_patch, self._apply_concurrency
+                )
+
+        # any stored snapshot of the live state of the organization is outdated now
+        snapshot_store = get_live_snapshot_store()
+        if snapshot_store is not None:
+            snapshot_store.invalidate(org_id)
 
         delete_snippet = "deleted" if self._delete_resources else "live resources ignored"
 
@@ -175,9 +192,7 @@ class ApplyOperation(PlanOperation):
         import os
 
         hook_script = os.path.join(self.template_dir, filename)
-        if os.path.exists(hook_script):
-            with open(hook_script) as file:
-                exec(file.read())
+        get_hook_registry().execute_if_present(hook_script, globals(), locals())
 
     def execute_custom_hook_if_present_with_patches(
         self, org_config: OrganizationConfig, patches: list[LivePatch], filename: str
@@ -185,6 +200,4 @@ class ApplyOperation(PlanOperation):
         import os
 
         hook_script = os.path.join(self.template_dir, filename)
-        if os.path.exists(hook_script):
-            with open(hook_script) as file:
-                exec(file.read())
+        get_hook_registry().execute_if_present(hook_script, globals(), locals())
@@ -0,0 +1,180 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from otterdog.logging import get_logger
+from otterdog.models import LivePatchType
+from otterdog.models.environment import Environment
+from otterdog.models.repository import Repository
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+    from otterdog.models import LivePatch
+
+_logger = get_logger(__name__)
+
+
+def order_patches(patches: Sequence[LivePatch]) -> list[LivePatch]:
+    """
+    Orders patches by their readonly status, patches that make a resource readonly come last.
+
+    Readonly resources can't be modified afterward, so any necessary modification is performed first.
+    """
+    return [p for p in patches if p.changes_object_to_readonly is False] + [
+        p for p in patches if p.changes_object_to_readonly is True
+    ]
+
+
+def _get_repo_name(patch: LivePatch) -> str | None:
+    model_object = patch.expected_object if patch.expected_object is not None else patch.current_object
+
+    if isinstance(model_object, Repository):
+        return model_object.name.lower()
+    elif isinstance(patch.parent_object, Repository):
+        return patch.parent_object.name.lower()
+    elif isinstance(patch.parent_object, Environment):
+        return patch.parent_object.repo_name.lower()
+    else:
+        return None
+
+
+def _get_source_repo_name(org_id: str, patch: LivePatch) -> str | None:
+    if patch.patch_type != LivePatchType.ADD or not isinstance(patch.expected_object, Repository):
+        return None
+
+    repository = patch.expected_object
+    for source in (repository.template_repository, repository.forked_repository):
+        if isinstance(source, str) and "/" in source:
+            owner, name = source.split("/", 1)
+            if owner.lower() == org_id.lower():
+                return name.lower()
+
+    return None
+
+
+def build_dependencies(org_id: str, patches: Sequence[LivePatch]) -> list[set[int]]:
+    """
+    Returns for each patch the indices of the patches that need to be applied before it.
+
+    The patches are expected to be ordered as returned by order_patches:
+
+    - organization level patches are applied in order and before / after any repository patch preceding / following it
+    - patches of the same repository, including its environments, are applied in order
+    - a repository created from a template or fork is added after the source repository if added as well
+    - patches that make a resource readonly are applied after all other patches
+
+    If the resulting dependencies contain a cycle, the patches are applied in the given order.
+    """
+    added_repos = {
+        patch.expected_object.name.lower(): index
+        for index, patch in enumerate(patches)
+        if patch.patch_type == LivePatchType.ADD and isinstance(patch.expected_object, Repository)
+    }
+
+    dependencies: list[set[int]] = []
+    last_patch_of_repo: dict[str, int] = {}
+    last_org_patch: int | None = None
+    readonly_barrier: set[int] | None = None
+
+    for index, patch in enumerate(patches):
+        patch_dependencies: set[int] = set()
+
+        if patch.changes_object_to_readonly is True and readonly_barrier is None:
+            # the last patch of each repo and organization transitively covers all preceding patches
+            readonly_barrier = set(last_patch_of_repo.values())
+            if last_org_patch is not None:
+                readonly_barrier.add(last_org_patch)
+
+        if readonly_barrier is not None:
+            patch_dependencies.update(readonly_barrier)
+
+        repo_name = _get_repo_name(patch)
+        if repo_name is None:
+            patch_dependencies.update(last_patch_of_repo.values())
+            if last_org_patch is not None:
+                patch_dependencies.add(last_org_patch)
+
+            last_patch_of_repo.clear()
+            last_org_patch = index
+        else:
+            if repo_name in last_patch_of_repo:
+                patch_dependencies.add(last_patch_of_repo[repo_name])
+            if last_org_patch is not None:
+                patch_dependencies.add(last_org_patch)
+
+            source_repo_name = _get_source_repo_name(org_id, patch)
+            if source_repo_name is not None and source_repo_name in added_repos:
+                patch_dependencies.add(added_repos[source_repo_name])
+
+            last_patch_of_repo[repo_name] = index
+
+        patch_dependencies.discard(index)
+        dependencies.append(patch_dependencies)
+
+    if _has_cycle(dependencies):
+        _logger.warning("dependencies between patches contain a cycle, applying patches in order")
+        return [{index - 1} if index > 0 else set() for index in range(len(patches))]
+
+    return dependencies
+
+
+def _has_cycle(dependencies: list[set[int]]) -> bool:
+    in_degree = [len(d) for d in dependencies]
+    dependents: list[list[int]] = [[] for _ in dependencies]
+    for index, patch_dependencies in enumerate(dependencies):
+        for dependency in patch_dependencies:
+            dependents[dependency].append(index)
+
+    ready = [index for index, degree in enumerate(in_degree) if degree == 0]
+    visited = 0
+    while ready:
+        index = ready.pop()
+        visited += 1
+        for dependent in dependents[index]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                ready.append(dependent)
+
+    return visited != len(dependencies)
+
+
+async def apply_patches(
+    patches: Sequence[LivePatch],
+    dependencies: list[set[int]],
+    apply_fn: Callable[[LivePatch], Awaitable[None]],
+    concurrency: int,
+) -> None:
+    """
+    Applies the given patches using apply_fn, independent patches are applied concurrently
+    with at most concurrency patches being applied at the same time.
+
+    A patch is applied once all patches it depends on have been processed, regardless of their outcome,
+    errors are expected to be handled by apply_fn. The requests issued while applying a patch
+    are additionally subject to the rate limit scheduler of the provider.
+    """
+    processed = [asyncio.Event() for _ in patches]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _apply(index: int) -> None:
+        for dependency in dependencies[index]:
+            await processed[dependency].wait()
+
+        try:
+            async with semaphore:
+                await apply_fn(patches[index])
+        finally:
+            processed[index].set()
+
+    async with asyncio.TaskGroup() as task_group:
+        for index in range(len(patches)):
+            task_group.create_task(_apply(index))
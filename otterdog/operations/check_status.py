@@ -9,7 +9,7 @@
 from __future__ import annotations
 
 from json import dumps as json_dumps
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Self
 
 from .diff_operation import DiffOperation, DiffStatus
 
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
     from typing import Any
 
     from otterdog.models import LivePatch, ModelObject
-    from otterdog.utils import Change
+    from otterdog.utils import Change, IndentingPrinter
 
     from .validate import ValidationStatus
 
@@ -32,13 +32,23 @@ class CheckStatusOperation(DiffOperation):
         no_web_ui: bool,
         repo_filter: str,
         output_json: str | None = None,
+        max_age: float | None = None,
     ):
         super().__init__(no_web_ui, repo_filter, False, False, False, "*")
+        self.max_age = max_age
         self.orgs_status: list[Any] = []
         self.output_json = output_json
 
     def pre_execute(self) -> None: ...
 
+    def fork(self, printer: IndentingPrinter) -> Self:
+        forked = super().fork(printer)
+        forked.orgs_status = []
+        return forked
+
+    def join(self, forked: Self) -> None:
+        self.orgs_status.extend(forked.orgs_status)
+
     def post_execute(self) -> None:
         if self.output_json and self.orgs_status:
             with open(self.output_json, "w", encoding="utf-8") as f:
@@ -9,7 +9,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Protocol, Self
 
 import aiofiles.ospath
 
@@ -27,6 +27,7 @@ if TYPE_CHECKING:
     from otterdog.config import OrganizationConfig, OtterdogConfig
     from otterdog.jsonnet import JsonnetConfig
     from otterdog.models import ModelObject
+    from otterdog.models.github_organization import OrganizationScope
 
 
 class DiffStatus:
@@ -72,6 +73,8 @@ class DiffOperation(Operation):
         self._org_config: OrganizationConfig | None = None
         self._callback: CallbackFn | None = None
         self._concurrency: int | None = None
+        self.max_age: float | None = None
+        self.scope: OrganizationScope | None = None
 
     @property
     def template_dir(self) -> str:
@@ -96,6 +99,11 @@ class DiffOperation(Operation):
         super().init(config, printer)
         self._validator.init(config, printer)
 
+    def fork(self, printer: IndentingPrinter) -> Self:
+        forked = super().fork(printer)
+        forked._validator = self._validator.fork(printer)
+        return forked
+
     async def execute(
         self,
         org_config: OrganizationConfig,
@@ -159,7 +167,7 @@ class DiffOperation(Operation):
             return 1
 
         try:
-            expected_org = self.load_expected_org(github_id, org_file_name)
+            expected_org = await self.load_expected_org(github_id, org_file_name)
         except RuntimeError as e:
             self.printer.print_error(f"failed to load configuration\n{e!s}")
             return 1
@@ -175,6 +183,9 @@ class DiffOperation(Operation):
                 self.printer.print_error(f"failed to load current configuration\n{e!s}")
                 return 1
 
+            if self.scope is not None:
+                self.scope.restrict(expected_org, current_org)
+
             expected_org, current_org = self.preprocess_orgs(expected_org, current_org)
 
             def handle(patch: LivePatch) -> None:
@@ -229,8 +240,8 @@ class DiffOperation(Operation):
 
         return status
 
-    def load_expected_org(self, github_id: str, org_file_name: str) -> GitHubOrganization:
-        return GitHubOrganization.load_from_file(github_id, org_file_name)
+    async def load_expected_org(self, github_id: str, org_file_name: str) -> GitHubOrganization:
+        return await GitHubOrganization.load_from_file_async(github_id, org_file_name)
 
     def coerce_current_org(self) -> bool:
         return False
@@ -257,6 +268,8 @@ class DiffOperation(Operation):
             self.concurrency,
             self.repo_filter,
             exclude_teams=self.config.exclude_teams_pattern,
+            max_age=self.max_age,
+            scope=self.scope,
         )
 
     def preprocess_orgs(
@@ -35,6 +35,8 @@ class LocalApplyOperation(ApplyOperation):
         delete_resources: bool,
         resolve_secrets: bool = True,
         include_resources_with_secrets: bool = True,
+        serial: bool = False,
+        apply_concurrency: int = 8,
     ) -> None:
         super().__init__(
             force_processing=force_processing,
@@ -47,6 +49,8 @@ class LocalApplyOperation(ApplyOperation):
             delete_resources=delete_resources,
             resolve_secrets=resolve_secrets,
             include_resources_with_secrets=include_resources_with_secrets,
+            serial=serial,
+            apply_concurrency=apply_concurrency,
         )
 
         self._suffix = suffix
@@ -78,7 +82,7 @@ class LocalApplyOperation(ApplyOperation):
         if not await ospath.exists(other_org_file_name):
             raise RuntimeError(f"configuration file '{other_org_file_name}' does not exist")
 
-        github_organization = GitHubOrganization.load_from_file(github_id, other_org_file_name)
+        github_organization = await GitHubOrganization.load_from_file_async(github_id, other_org_file_name)
 
         if self.no_web_ui is True:
             github_organization.unset_settings_requiring_web_ui()
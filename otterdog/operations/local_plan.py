@@ -73,7 +73,7 @@ class LocalPlanOperation(PlanOperation):
         if not await ospath.exists(other_org_file_name):
             raise RuntimeError(f"configuration file '{other_org_file_name}' does not exist")
 
-        return GitHubOrganization.load_from_file(github_id, other_org_file_name)
+        return await GitHubOrganization.load_from_file_async(github_id, other_org_file_name)
 
     def preprocess_orgs(
         self, expected_org: GitHubOrganization, current_org: GitHubOrganization
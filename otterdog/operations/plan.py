@@ -37,8 +37,10 @@ class PlanOperation(DiffOperation):
         update_secrets: bool,
         only_secrets: bool,
         update_filter: str,
+        max_age: float | None = None,
     ):
         super().__init__(no_web_ui, repo_filter, update_webhooks, update_secrets, only_secrets, update_filter)
+        self.max_age = max_age
 
     def init(self, config: OtterdogConfig, printer: IndentingPrinter) -> None:
         super().init(config, printer)
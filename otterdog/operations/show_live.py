@@ -24,9 +24,10 @@ class ShowLiveOperation(Operation):
     Shows the current live configuration of organizations.
     """
 
-    def __init__(self, no_web_ui: bool):
+    def __init__(self, no_web_ui: bool, max_age: float | None = None):
         super().__init__()
         self._no_web_ui = no_web_ui
+        self._max_age = max_age
 
     @property
     def no_web_ui(self) -> bool:
@@ -69,6 +70,7 @@ class ShowLiveOperation(Operation):
                     provider,
                     self.no_web_ui,
                     exclude_teams=self.config.exclude_teams_pattern,
+                    max_age=self._max_age,
                 )
 
             for model_object, parent_object in organization.get_model_objects():
@@ -10,7 +10,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from otterdog.logging import is_info_enabled
+from otterdog.hooks import get_hook_registry
+from otterdog.logging import is_debug_enabled, is_info_enabled
 from otterdog.models import FailureType
 from otterdog.models.github_organization import GitHubOrganization
 from otterdog.providers.github import GitHubProvider
@@ -62,7 +63,7 @@ class ValidateOperation(Operation):
                 return 1
 
             try:
-                organization = GitHubOrganization.load_from_file(github_id, org_file_name)
+                organization = await GitHubOrganization.load_from_file_async(github_id, org_file_name)
             except RuntimeError as ex:
                 self.printer.print_error(f"Validation failed\nfailed to load configuration: {ex!s}")
                 return 1
@@ -114,6 +115,9 @@ class ValidateOperation(Operation):
 
         context = await organization.validate(self.config, jsonnet_config, self.credential_resolver, provider)
 
+        if is_debug_enabled():
+            get_hook_registry().log_timings()
+
         validation_status = ValidationStatus()
 
         for failure_type, message in context.validation_failures:
@@ -19,6 +19,7 @@ from otterdog import resources
 from otterdog.utils import get_logger, is_ghsa_repo, is_set_and_present
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from typing import Any
 
     from otterdog.credentials import Credentials
@@ -229,12 +230,45 @@ class GitHubProvider:
         await self.rest_api.org.delete_ruleset(org_id, ruleset_id, name)
 
     async def get_repos(self, org_id: str) -> list[str]:
+        return [repo_name async for repo_name in self.iter_repos(org_id)]
+
+    async def iter_repos(self, org_id: str) -> AsyncIterator[str]:
         # filter out repos which are created to work on GitHub Security Advisories
         # they should not be part of the visible configuration
-        return list(filter(lambda name: not is_ghsa_repo(name), await self.rest_api.org.get_repos(org_id)))
-
-    async def get_repo_data(self, org_id: str, repo_name: str) -> dict[str, Any]:
-        return await self.rest_api.repo.get_repo_data(org_id, repo_name)
+        async for repo_name in self.rest_api.org.iter_repos(org_id):
+            if not is_ghsa_repo(repo_name):
+                yield repo_name
+
+    async def iter_repos_with_data(
+        self, org_id: str, with_branch_protection_rules: bool = True
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Yields the names of all repos of an organization together with the part of their data
+        that can be retrieved in bulk via GraphQL, using the same keys as the REST api.
+        """
+        async for repo in self.graphql_client.iter_repositories(org_id, with_branch_protection_rules):
+            repo_name = repo["name"]
+            if is_ghsa_repo(repo_name):
+                continue
+
+            prefetched_data: dict[str, Any] = {
+                "topics": [node["topic"]["name"] for node in repo["repositoryTopics"]["nodes"]],
+            }
+
+            # vulnerability alerts are only retrieved for active repos
+            vulnerability_alerts = repo.get("hasVulnerabilityAlertsEnabled")
+            if not repo["isArchived"] and vulnerability_alerts is not None:
+                prefetched_data["dependabot_alerts_enabled"] = vulnerability_alerts
+
+            if with_branch_protection_rules:
+                prefetched_data["branch_protection_rules"] = repo["branchProtectionRules"]
+
+            yield repo_name, prefetched_data
+
+    async def get_repo_data(
+        self, org_id: str, repo_name: str, prefetched_data: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        return await self.rest_api.repo.get_repo_data(org_id, repo_name, prefetched_data)
 
     async def get_repo_by_id(self, repo_id: int) -> dict[str, Any]:
         return await self.rest_api.repo.get_repo_by_id(repo_id)
@@ -0,0 +1,183 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+from otterdog.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright
+
+_logger = get_logger(__name__)
+
+
+async def launch_browser(playwright: Playwright, headless: bool = True) -> Browser:
+    try:
+        return await playwright.firefox.launch(headless=headless)
+    except Exception as e:
+        tb = e.__traceback__
+        raise RuntimeError(
+            "unable to launch browser, make sure you have installed required dependencies using: "
+            "'otterdog install-deps'"
+        ).with_traceback(tb) from None
+
+
+class BrowserPool:
+    """
+    Keeps a single headless browser alive and hands out browser contexts that reuse the
+    authenticated session of an account, so that a login to the web UI is only needed
+    once per account rather than once per operation.
+
+    The number of concurrently used contexts is limited to max_contexts. The browser is
+    closed once it has not been used for idle_timeout seconds and launched again when needed,
+    the sessions of the accounts survive that. Sessions that have expired are detected by
+    the user of a context which has to log in again, the new session is kept afterward.
+
+    Like http sessions, a browser is bound to the event loop it has been launched in,
+    so a pool should only be used by a single event loop.
+    """
+
+    def __init__(self, max_contexts: int = 4, idle_timeout: float = 300.0):
+        self._semaphore = asyncio.Semaphore(max_contexts)
+        self._idle_timeout = idle_timeout
+        self._lock = asyncio.Lock()
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._storage_states: dict[str, Any] = {}
+        self._logout_handlers: dict[str, Callable[[Page], Awaitable[None]]] = {}
+        self._active_contexts = 0
+        self._eviction_task: asyncio.Task | None = None
+
+        self.browsers_launched = 0
+        self.contexts_created = 0
+
+    @asynccontextmanager
+    async def new_context(
+        self,
+        account: str,
+        logout: Callable[[Page], Awaitable[None]],
+        **context_options: Any,
+    ) -> AsyncIterator[BrowserContext]:
+        """
+        Yields a new browser context initialized with the last known session of the given account.
+
+        The session of the context is stored for the account when the context is released, the
+        logout callback is used to end the session of the account when the pool is closed.
+        """
+        async with self._semaphore:
+            self._cancel_eviction()
+            self._active_contexts += 1
+            try:
+                browser = await self._get_browser()
+                context = await browser.new_context(storage_state=self._storage_states.get(account), **context_options)
+                self.contexts_created += 1
+                self._logout_handlers[account] = logout
+
+                try:
+                    yield context
+                finally:
+                    try:
+                        self._storage_states[account] = await context.storage_state()
+                    except Exception as e:
+                        _logger.debug("failed to store session of account '%s': %s", account, e)
+
+                    await context.close()
+            finally:
+                self._active_contexts -= 1
+                if self._active_contexts == 0:
+                    self._schedule_eviction()
+
+    async def _get_browser(self) -> Browser:
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                from playwright.async_api import async_playwright
+
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+
+                _logger.debug("launching pooled browser")
+                self._browser = await launch_browser(self._playwright)
+                self.browsers_launched += 1
+
+            return self._browser
+
+    def _schedule_eviction(self) -> None:
+        if self._browser is not None and self._eviction_task is None:
+            self._eviction_task = asyncio.create_task(self._evict_when_idle())
+
+    def _cancel_eviction(self) -> None:
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            self._eviction_task = None
+
+    async def _evict_when_idle(self) -> None:
+        await asyncio.sleep(self._idle_timeout)
+
+        self._eviction_task = None
+        if self._active_contexts == 0:
+            _logger.debug("closing idle pooled browser")
+            await self._close_browser()
+
+    async def _close_browser(self) -> None:
+        async with self._lock:
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def close(self) -> None:
+        """
+        Logs out all accounts with a known session and closes the browser.
+        """
+        self._cancel_eviction()
+
+        for account, storage_state in list(self._storage_states.items()):
+            logout = self._logout_handlers.get(account)
+            if logout is None:
+                continue
+
+            try:
+                browser = await self._get_browser()
+                context = await browser.new_context(storage_state=storage_state)
+                page = await context.new_page()
+                await logout(page)
+                await context.close()
+            except Exception as e:
+                _logger.warning(f"failed to logout account '{account}' from web ui: {e!s}")
+
+        self._storage_states.clear()
+        self._logout_handlers.clear()
+
+        await self._close_browser()
+
+
+_BROWSER_POOL: BrowserPool | None = None
+
+
+def get_browser_pool() -> BrowserPool | None:
+    return _BROWSER_POOL
+
+
+def set_browser_pool(browser_pool: BrowserPool | None) -> None:
+    """
+    Sets the browser pool to use for web UI operations, if no pool is set, each operation
+    launches its own browser and logs in and out again.
+    """
+    global _BROWSER_POOL
+
+    _logger.trace("setting browser pool %s", browser_pool)
+    _BROWSER_POOL = browser_pool
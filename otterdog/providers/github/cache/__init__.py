@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 
     from aiohttp_client_cache import CacheBackend
 
+    from .etag import ConditionalCache
+
 
 class CacheStrategy(ABC):
     @abstractmethod
@@ -29,3 +31,6 @@ class CacheStrategy(ABC):
 
     @abstractmethod
     def get_request_parameters(self) -> dict[str, Any]: ...
+
+    def get_conditional_cache(self) -> ConditionalCache | None:
+        return None
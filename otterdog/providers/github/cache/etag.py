@@ -0,0 +1,153 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from . import CacheStrategy
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+_ETAG_CACHE_DIR = ".cache/etag"
+# entries that have not been written for that long are discarded
+_ETAG_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+
+@dataclasses.dataclass
+class ConditionalEntry:
+    """
+    A cached response that can be revalidated using its ETag.
+    """
+
+    etag: str
+    body: str
+    next_url: str | None = None
+    last_url: str | None = None
+    scopes: str = ""
+
+
+class ConditionalCache(ABC):
+    """
+    Stores the ETag and body of responses to serve them again when the server
+    responds with a '304 Not Modified' to a conditional request.
+    """
+
+    @staticmethod
+    def create_key(method: str, url: str, params: Mapping[str, Any] | None, authorization: str | None) -> str:
+        # the authorization header is part of the key so that responses are never shared
+        # between different identities, only its hash is stored though.
+        key = hashlib.sha256()
+        key.update(method.upper().encode("utf-8"))
+        key.update(url.encode("utf-8"))
+        key.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+        key.update((authorization or "").encode("utf-8"))
+        return key.hexdigest()
+
+    @abstractmethod
+    async def get(self, key: str) -> ConditionalEntry | None: ...
+
+    @abstractmethod
+    async def put(self, key: str, entry: ConditionalEntry) -> None: ...
+
+
+def etag_cache(cache_dir: str = _ETAG_CACHE_DIR, max_age: float = _ETAG_CACHE_MAX_AGE) -> CacheStrategy:
+    return _ETagCache(_FileConditionalCache(cache_dir, max_age), f"etag-cache('{cache_dir}')")
+
+
+class _ETagCache(CacheStrategy):
+    def __init__(self, conditional_cache: ConditionalCache, description: str):
+        self._conditional_cache = conditional_cache
+        self._description = description
+
+    def get_cache_backend(self) -> None:
+        return None
+
+    def is_external(self) -> bool:
+        return False
+
+    def get_request_parameters(self) -> dict[str, Any]:
+        return {}
+
+    def get_conditional_cache(self) -> ConditionalCache:
+        return self._conditional_cache
+
+    def __str__(self):
+        return self._description
+
+
+class _FileConditionalCache(ConditionalCache):
+    """
+    Stores entries as json files in cache_dir. Entries older than max_age seconds are
+    not used anymore and are removed from the cache directory once per process when
+    the first entry is written.
+    """
+
+    def __init__(self, cache_dir: str, max_age: float):
+        self._cache_dir = cache_dir
+        self._max_age = max_age
+        self._pruned = False
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key[:2], f"{key}.json")
+
+    async def get(self, key: str) -> ConditionalEntry | None:
+        import aiofiles
+        import aiofiles.os
+
+        path = self._get_path(key)
+
+        try:
+            stat = await aiofiles.os.stat(path)
+            if time.time() - stat.st_mtime > self._max_age:
+                return None
+
+            async with aiofiles.open(path) as file:
+                return ConditionalEntry(**json.loads(await file.read()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    async def put(self, key: str, entry: ConditionalEntry) -> None:
+        import asyncio
+
+        import aiofiles
+        import aiofiles.os
+
+        if not self._pruned:
+            self._pruned = True
+            await asyncio.to_thread(self._prune)
+
+        path = self._get_path(key)
+        await aiofiles.os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # write to a temporary file first to avoid readers seeing partially written entries
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        async with aiofiles.open(tmp_path, "w") as file:
+            await file.write(json.dumps(dataclasses.asdict(entry)))
+
+        await aiofiles.os.replace(tmp_path, path)
+
+    def _prune(self) -> None:
+        expired_before = time.time() - self._max_age
+
+        for root, _, files in os.walk(self._cache_dir):
+            for file in files:
+                path = os.path.join(root, file)
+                with contextlib.suppress(OSError):
+                    if os.stat(path).st_mtime < expired_before:
+                        os.remove(path)
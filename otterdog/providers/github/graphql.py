@@ -16,10 +16,12 @@ from aiohttp.client import ClientSession, ClientTimeout, TCPConnector
 from aiohttp_retry import ExponentialRetry, RetryClient
 
 from otterdog.logging import get_logger, is_trace_enabled
+from otterdog.providers.github.rest.requester import get_session_pool
 from otterdog.providers.github.stats import RequestStatistics
 from otterdog.utils import query_json
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from typing import Any
 
     from otterdog.providers.github.auth import AuthStrategy
@@ -49,10 +51,16 @@ class GraphQLClient:
             self._base_url = f"https://{self._GH_GRAPHQL_URL_ROOT}"
             self._use_proxy = False
 
-        self._session = ClientSession(
-            timeout=ClientTimeout(connect=3, sock_connect=3),
-            connector=TCPConnector(limit=10),
-        )
+        session_pool = get_session_pool()
+        if session_pool is not None:
+            self._session = session_pool.get_session(self._base_url)
+            self._owns_session = False
+        else:
+            self._session = ClientSession(
+                timeout=ClientTimeout(connect=3, sock_connect=3),
+                connector=TCPConnector(limit=10),
+            )
+            self._owns_session = True
 
         self._client = RetryClient(
             retry_options=ExponentialRetry(3, exceptions={Exception}),
@@ -66,7 +74,8 @@ class GraphQLClient:
         await self.close()
 
     async def close(self) -> None:
-        await self._session.close()
+        if self._owns_session:
+            await self._session.close()
 
     @property
     def statistics(self) -> RequestStatistics:
@@ -91,36 +100,89 @@ class GraphQLClient:
         branch_protection_rules = await self._run_paged_query(variables, "get-branch-protection-rules.gql")
 
         for branch_protection_rule in branch_protection_rules:
-            await self._fill_paged_results_if_needed(
-                branch_protection_rule,
-                "pushAllowances",
-                "pushRestrictions",
-                "get-push-allowances.gql",
-            )
+            await self._fill_actors(branch_protection_rule)
 
-            await self._fill_paged_results_if_needed(
-                branch_protection_rule,
-                "reviewDismissalAllowances",
-                "reviewDismissalAllowances",
-                "get-review-dismissal-allowances.gql",
-            )
+        return branch_protection_rules
 
-            await self._fill_paged_results_if_needed(
-                branch_protection_rule,
-                "bypassPullRequestAllowances",
-                "bypassPullRequestAllowances",
-                "get-bypass-pull-request-allowances.gql",
-            )
+    async def iter_repositories(
+        self,
+        org_id: str,
+        with_branch_protection_rules: bool = True,
+        page_size: int = 50,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Retrieves the data of all repositories of an organization that is available via GraphQL
+        with a single query per page of repositories.
+        """
+        _logger.debug(f"retrieving repositories in bulk for org '{org_id}'")
+
+        variables = {
+            "organization": org_id,
+            "pageSize": page_size,
+            "withBranchProtectionRules": with_branch_protection_rules,
+        }
 
-            await self._fill_paged_results_if_needed(
-                branch_protection_rule,
-                "bypassForcePushAllowances",
-                "bypassForcePushAllowances",
-                "get-bypass-force-push-allowances.gql",
+        async for repos in self._iter_paged_query(variables, "get-repositories.gql", "data.organization.repositories"):
+            for repo in repos:
+                # nodes are nulled by GitHub if any of their fields could not be resolved
+                if repo is None:
+                    raise RuntimeError(f"failed retrieving repositories in bulk for org '{org_id}'")
+
+                if with_branch_protection_rules:
+                    repo["branchProtectionRules"] = await self._complete_branch_protection_rules(
+                        org_id, repo["name"], repo["branchProtectionRules"]
+                    )
+
+                yield repo
+
+    async def _complete_branch_protection_rules(
+        self, org_id: str, repo_name: str, value: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        branch_protection_rules = value["nodes"]
+
+        page_info = value["pageInfo"]
+        if page_info["hasNextPage"]:
+            variables = {"organization": org_id, "repository": repo_name}
+            branch_protection_rules.extend(
+                await self._run_paged_query(
+                    variables, "get-branch-protection-rules.gql", end_cursor=page_info["endCursor"]
+                )
             )
 
+        for branch_protection_rule in branch_protection_rules:
+            await self._fill_actors(branch_protection_rule)
+
         return branch_protection_rules
 
+    async def _fill_actors(self, branch_protection_rule: dict[str, Any]) -> None:
+        await self._fill_paged_results_if_needed(
+            branch_protection_rule,
+            "pushAllowances",
+            "pushRestrictions",
+            "get-push-allowances.gql",
+        )
+
+        await self._fill_paged_results_if_needed(
+            branch_protection_rule,
+            "reviewDismissalAllowances",
+            "reviewDismissalAllowances",
+            "get-review-dismissal-allowances.gql",
+        )
+
+        await self._fill_paged_results_if_needed(
+            branch_protection_rule,
+            "bypassPullRequestAllowances",
+            "bypassPullRequestAllowances",
+            "get-bypass-pull-request-allowances.gql",
+        )
+
+        await self._fill_paged_results_if_needed(
+            branch_protection_rule,
+            "bypassForcePushAllowances",
+            "bypassForcePushAllowances",
+            "get-bypass-force-push-allowances.gql",
+        )
+
     async def _fill_paged_results_if_needed(
         self,
         branch_protection_rule: dict[str, Any],
@@ -136,7 +198,12 @@ class GraphQLClient:
 
         if has_more is True:
             variables = {"branchProtectionRuleId": branch_protection_rule["id"]}
-            more_actors = await self._run_paged_query(variables, query_file, f"data.node.{input_key}")
+            more_actors = await self._run_paged_query(
+                variables,
+                query_file,
+                f"data.node.{input_key}",
+                end_cursor=query_json("pageInfo.endCursor", value),
+            )
             all_actors.extend(self._transform_actors(more_actors))
 
         branch_protection_rule[output_key] = all_actors
@@ -273,17 +340,16 @@ class GraphQLClient:
             page_info = team["repositories"]["pageInfo"]
             if not page_info["hasNextPage"]:
                 continue
-            repo_cursor = page_info["endCursor"]
             sub_vars = {
                 "org": org_id,
                 "teamSlug": team["slug"],
-                "endCursor": repo_cursor,
             }
             sub_result = await self._run_paged_query(
                 input_variables=sub_vars,
                 query_file="get-repository-permissions-of-team.gql",
                 prefix_selector="data.organization.team.repositories",
                 selector_type=".edges",
+                end_cursor=page_info["endCursor"],
             )
             repos.extend(sub_result)
 
@@ -295,18 +361,33 @@ class GraphQLClient:
         query_file: str,
         prefix_selector: str = "data.repository.branchProtectionRules",
         selector_type: str = ".nodes",
+        end_cursor: str | None = None,
     ) -> list[dict[str, Any]]:
+        result = []
+        async for page in self._iter_paged_query(
+            input_variables, query_file, prefix_selector, selector_type, end_cursor
+        ):
+            result.extend(page)
+
+        return result
+
+    async def _iter_paged_query(
+        self,
+        input_variables: dict[str, Any],
+        query_file: str,
+        prefix_selector: str = "data.repository.branchProtectionRules",
+        selector_type: str = ".nodes",
+        end_cursor: str | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
         _logger.debug(f"running graphql query '{query_file}' with input '{json.dumps(input_variables)}'")
 
         query = _get_query_from_file(query_file)
 
         finished = False
-        end_cursor = None
-        result = []
 
         while not finished:
-            variables = {"endCursor": end_cursor}
-            variables.update(input_variables)
+            variables = dict(input_variables)
+            variables["endCursor"] = end_cursor
 
             status, body = await self._request_raw("POST", query, variables)
             json_data = json.loads(body)
@@ -315,9 +396,7 @@ class GraphQLClient:
                 _logger.trace("graphql result = %s", json.dumps(json_data, indent=2))
 
             if status < 400 and "data" in json_data:
-                rules_result = query_json(prefix_selector + selector_type, json_data)
-
-                result.extend(rules_result)
+                yield query_json(prefix_selector + selector_type, json_data)
 
                 page_info = query_json(prefix_selector + ".pageInfo", json_data)
 
@@ -328,8 +407,6 @@ class GraphQLClient:
             else:
                 raise RuntimeError(f"failed running graphql query '{query_file}': {body}")
 
-        return result
-
     async def _request_raw(self, method: str, query: str, variables: dict[str, Any]) -> tuple[int, str]:
         _logger.trace("'%s', query = %s, variables = %s", method, query[0:300] + "...", variables)
 
@@ -64,6 +64,12 @@ class RestApi:
     def requester(self) -> Requester:
         return self._requester
 
+    @cached_property
+    def secret_encryptor(self):
+        from .secret_encryptor import SecretEncryptor
+
+        return SecretEncryptor()
+
     @cached_property
     def action(self):
         from .action_client import ActionClient
@@ -7,12 +7,13 @@
 #  *******************************************************************************
 
 import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 from otterdog.providers.github.exception import GitHubException
-from otterdog.utils import get_logger
+from otterdog.utils import gather_or_cancel, get_logger
 
-from . import RestApi, RestClient, encrypt_value
+from . import RestApi, RestClient
 
 _logger = get_logger(__name__)
 
@@ -300,12 +301,15 @@ class OrgClient(RestClient):
         _logger.debug("removed org webhook with url '%s'", url)
 
     async def get_repos(self, org_id: str) -> list[str]:
+        return [repo_name async for repo_name in self.iter_repos(org_id)]
+
+    async def iter_repos(self, org_id: str) -> AsyncIterator[str]:
         _logger.debug("retrieving repos for org '%s'", org_id)
 
         params = {"type": "all"}
         try:
-            repos = await self.requester.request_paged_json("GET", f"/orgs/{org_id}/repos", params=params)
-            return [repo["name"] for repo in repos]
+            async for repo in self.requester.iter_paged_json("GET", f"/orgs/{org_id}/repos", params=params):
+                yield repo["name"]
         except GitHubException as ex:
             raise RuntimeError(f"failed to retrieve repos for org '{org_id}':\n{ex}") from ex
 
@@ -316,15 +320,15 @@ class OrgClient(RestClient):
             response = await self.requester.request_json("GET", f"/orgs/{org_id}/actions/secrets")
 
             secrets = response["secrets"]
-            for secret in secrets:
-                if secret["visibility"] == "selected":
-                    secret["selected_repositories"] = await self._get_selected_repositories_for_secret(
-                        org_id, secret["name"]
-                    )
+            await gather_or_cancel(*(self._fill_selected_repositories_for_secret(org_id, secret) for secret in secrets))
             return secrets
         except GitHubException as ex:
             raise RuntimeError(f"failed getting secrets for org '{org_id}':\n{ex}") from ex
 
+    async def _fill_selected_repositories_for_secret(self, org_id: str, secret: dict[str, Any]) -> None:
+        if secret["visibility"] == "selected":
+            secret["selected_repositories"] = await self._get_selected_repositories_for_secret(org_id, secret["name"])
+
     async def _get_selected_repositories_for_secret(self, org_id: str, secret_name: str) -> list[dict[str, Any]]:
         _logger.debug("retrieving selected repositories for secret '%s' in org '%s'", secret_name, org_id)
 
@@ -339,11 +343,7 @@ class OrgClient(RestClient):
         secret_name = data.pop("name")
         _logger.debug("adding org secret '%s' in org '%s'", secret_name, org_id)
 
-        await self._encrypt_secret_inplace(org_id, data)
-
-        status, _ = await self.requester.request_raw(
-            "PUT", f"/orgs/{org_id}/actions/secrets/{secret_name}", json.dumps(data)
-        )
+        status = await self._put_secret(org_id, secret_name, data)
 
         if status != 201:
             raise RuntimeError(f"failed to add org secret '{secret_name}'")
@@ -356,23 +356,21 @@ class OrgClient(RestClient):
         if "name" in secret:
             secret.pop("name")
 
-        await self._encrypt_secret_inplace(org_id, secret)
-
-        status, _ = await self.requester.request_raw(
-            "PUT", f"/orgs/{org_id}/actions/secrets/{secret_name}", json.dumps(secret)
-        )
+        status = await self._put_secret(org_id, secret_name, secret)
 
         if status != 204:
             raise RuntimeError(f"failed to update org secret '{secret_name}'")
 
         _logger.debug("updated org secret '%s'", secret_name)
 
-    async def _encrypt_secret_inplace(self, org_id: str, data: dict[str, Any]) -> None:
-        if "value" in data:
-            value = data.pop("value")
-            key_id, public_key = await self.get_public_key(org_id)
-            data["encrypted_value"] = encrypt_value(public_key, value)
-            data["key_id"] = key_id
+    async def _put_secret(self, org_id: str, secret_name: str, data: dict[str, Any]) -> int:
+        return await self.rest_api.secret_encryptor.put_secret(
+            self.requester,
+            f"/orgs/{org_id}/actions/secrets/{secret_name}",
+            data,
+            ("org", org_id),
+            lambda: self.get_public_key(org_id),
+        )
 
     async def delete_secret(self, org_id: str, secret_name: str) -> None:
         _logger.debug("deleting org secret '%s' in org '%s'", secret_name, org_id)
@@ -390,15 +388,19 @@ class OrgClient(RestClient):
             response = await self.requester.request_json("GET", f"/orgs/{org_id}/actions/variables")
 
             secrets = response["variables"]
-            for secret in secrets:
-                if secret["visibility"] == "selected":
-                    secret["selected_repositories"] = await self._get_selected_repositories_for_variable(
-                        org_id, secret["name"]
-                    )
+            await gather_or_cancel(
+                *(self._fill_selected_repositories_for_variable(org_id, secret) for secret in secrets)
+            )
             return secrets
         except GitHubException as ex:
             raise RuntimeError(f"failed getting variables for org '{org_id}':\n{ex}") from ex
 
+    async def _fill_selected_repositories_for_variable(self, org_id: str, variable: dict[str, Any]) -> None:
+        if variable["visibility"] == "selected":
+            variable["selected_repositories"] = await self._get_selected_repositories_for_variable(
+                org_id, variable["name"]
+            )
+
     async def _get_selected_repositories_for_variable(self, org_id: str, variable_name: str) -> list[dict[str, Any]]:
         _logger.debug("retrieving selected repositories for variable '%s' in org '%s'", variable_name, org_id)
 
@@ -668,11 +670,15 @@ class OrgClient(RestClient):
                 ) from ex
 
     async def list_members(self, org_id: str, two_factor_disabled: bool = False) -> list[dict[str, Any]]:
+        return [member async for member in self.iter_members(org_id, two_factor_disabled)]
+
+    async def iter_members(self, org_id: str, two_factor_disabled: bool = False) -> AsyncIterator[dict[str, Any]]:
         _logger.debug("retrieving list of org members for org '%s'", org_id)
 
         try:
             params = {"filter": "2fa_disabled"} if two_factor_disabled is True else None
-            return await self.requester.request_paged_json("GET", f"/orgs/{org_id}/members", params=params)
+            async for member in self.requester.iter_paged_json("GET", f"/orgs/{org_id}/members", params=params):
+                yield member
         except GitHubException as ex:
             raise RuntimeError(f"failed retrieving members:\n{ex}") from ex
 
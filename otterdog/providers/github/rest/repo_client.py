@@ -20,9 +20,10 @@ import chevron
 
 from otterdog.logging import is_trace_enabled
 from otterdog.providers.github.exception import GitHubException
-from otterdog.providers.github.rest import RestApi, RestClient, encrypt_value
+from otterdog.providers.github.rest import RestApi, RestClient
 from otterdog.utils import (
     associate_by_key,
+    gather_or_cancel,
     get_logger,
     is_set_and_present,
     query_json,
@@ -70,24 +71,42 @@ class RepoClient(RestClient):
         except GitHubException as ex:
             raise RuntimeError(f"failed renaming branch '{branch}' in repo '{org_id}/{repo_name}':\n{ex}") from ex
 
-    async def get_repo_data(self, org_id: str, repo_name: str) -> dict[str, Any]:
+    async def get_repo_data(
+        self, org_id: str, repo_name: str, prefetched_data: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         _logger.debug("retrieving repo data for '%s/%s'", org_id, repo_name)
 
+        # data that has already been retrieved in bulk is not requested again
+        prefetched_data = prefetched_data or {}
+
         try:
             repo_data = await self.get_simple_repo_data(org_id, repo_name)
 
+            # the remaining data is independent of each other and retrieved concurrently,
+            # the number of requests in flight is governed by the rate limit scheduler.
+            fills = [
+                self._fill_github_pages_config(org_id, repo_name, repo_data),
+                self._fill_code_scanning_config(org_id, repo_name, repo_data),
+                self._fill_custom_properties(org_id, repo_name, repo_data),
+            ]
+
             archived = repo_data.get("archived", False)
             if not archived:
-                await self._fill_vulnerability_alerts(org_id, repo_name, repo_data)
+                if "dependabot_alerts_enabled" in prefetched_data:
+                    repo_data["dependabot_alerts_enabled"] = prefetched_data["dependabot_alerts_enabled"]
+                else:
+                    fills.append(self._fill_vulnerability_alerts(org_id, repo_name, repo_data))
 
                 private = repo_data.get("private", False)
                 if not private:
-                    await self._fill_private_vulnerability_reporting(org_id, repo_name, repo_data)
+                    fills.append(self._fill_private_vulnerability_reporting(org_id, repo_name, repo_data))
+
+            if "topics" in prefetched_data:
+                repo_data["topics"] = prefetched_data["topics"]
+            else:
+                fills.append(self._fill_topics(org_id, repo_name, repo_data))
 
-            await self._fill_github_pages_config(org_id, repo_name, repo_data)
-            await self._fill_topics(org_id, repo_name, repo_data)
-            await self._fill_code_scanning_config(org_id, repo_name, repo_data)
-            await self._fill_custom_properties(org_id, repo_name, repo_data)
+            await gather_or_cancel(*fills)
 
             return repo_data
         except GitHubException as ex:
@@ -772,13 +791,7 @@ class RepoClient(RestClient):
         if "name" in secret:
             secret.pop("name")
 
-        await self._encrypt_environment_secret_inplace(org_id, repo_name, env_name, secret)
-
-        status, _ = await self.requester.request_raw(
-            "PUT",
-            f"/repos/{org_id}/{repo_name}/environments/{env_name}/secrets/{secret_name}",
-            json.dumps(secret),
-        )
+        status = await self._put_environment_secret(org_id, repo_name, env_name, secret_name, secret)
 
         if status != 204:
             raise RuntimeError(f"failed to update environment secret '{secret_name}'")
@@ -791,26 +804,23 @@ class RepoClient(RestClient):
             "adding secret '%s' for environment '%s' of repo '%s/%s'", secret_name, env_name, org_id, repo_name
         )
 
-        await self._encrypt_environment_secret_inplace(org_id, repo_name, env_name, data)
-
-        status, _ = await self.requester.request_raw(
-            "PUT",
-            f"/repos/{org_id}/{repo_name}/environments/{env_name}/secrets/{secret_name}",
-            json.dumps(data),
-        )
+        status = await self._put_environment_secret(org_id, repo_name, env_name, secret_name, data)
 
         if status != 201:
             raise RuntimeError(f"failed to add environment secret '{secret_name}'")
 
         _logger.debug("added environment secret '%s'", secret_name)
 
-    async def _encrypt_environment_secret_inplace(
-        self, org_id: str, repo_name: str, env_name: str, data: dict[str, Any]
-    ) -> None:
-        value = data.pop("value")
-        key_id, public_key = await self.get_environment_public_key(org_id, repo_name, env_name)
-        data["encrypted_value"] = encrypt_value(public_key, value)
-        data["key_id"] = key_id
+    async def _put_environment_secret(
+        self, org_id: str, repo_name: str, env_name: str, secret_name: str, data: dict[str, Any]
+    ) -> int:
+        return await self.rest_api.secret_encryptor.put_secret(
+            self.requester,
+            f"/repos/{org_id}/{repo_name}/environments/{env_name}/secrets/{secret_name}",
+            data,
+            ("environment", org_id, repo_name, env_name),
+            lambda: self.get_environment_public_key(org_id, repo_name, env_name),
+        )
 
     async def delete_environment_secret(self, org_id: str, repo_name: str, env_name: str, secret_name: str) -> None:
         _logger.debug(
@@ -1032,13 +1042,7 @@ class RepoClient(RestClient):
         if "name" in secret:
             secret.pop("name")
 
-        await self._encrypt_secret_inplace(org_id, repo_name, secret)
-
-        status, _ = await self.requester.request_raw(
-            "PUT",
-            f"/repos/{org_id}/{repo_name}/actions/secrets/{secret_name}",
-            json.dumps(secret),
-        )
+        status = await self._put_secret(org_id, repo_name, secret_name, secret)
 
         if status != 204:
             raise RuntimeError(f"failed to update repo secret '{secret_name}'")
@@ -1049,24 +1053,21 @@ class RepoClient(RestClient):
         secret_name = data.pop("name")
         _logger.debug("adding repo secret '%s' for repo '%s/%s'", secret_name, org_id, repo_name)
 
-        await self._encrypt_secret_inplace(org_id, repo_name, data)
-
-        status, _ = await self.requester.request_raw(
-            "PUT",
-            f"/repos/{org_id}/{repo_name}/actions/secrets/{secret_name}",
-            json.dumps(data),
-        )
+        status = await self._put_secret(org_id, repo_name, secret_name, data)
 
         if status != 201:
             raise RuntimeError(f"failed to add repo secret '{secret_name}'")
 
         _logger.debug("added repo secret '%s'", secret_name)
 
-    async def _encrypt_secret_inplace(self, org_id: str, repo_name: str, data: dict[str, Any]) -> None:
-        value = data.pop("value")
-        key_id, public_key = await self.get_public_key(org_id, repo_name)
-        data["encrypted_value"] = encrypt_value(public_key, value)
-        data["key_id"] = key_id
+    async def _put_secret(self, org_id: str, repo_name: str, secret_name: str, data: dict[str, Any]) -> int:
+        return await self.rest_api.secret_encryptor.put_secret(
+            self.requester,
+            f"/repos/{org_id}/{repo_name}/actions/secrets/{secret_name}",
+            data,
+            ("repo", org_id, repo_name),
+            lambda: self.get_public_key(org_id, repo_name),
+        )
 
     async def delete_secret(self, org_id: str, repo_name: str, secret_name: str) -> None:
         _logger.debug("deleting repo secret '%s' for repo '%s/%s'", secret_name, org_id, repo_name)
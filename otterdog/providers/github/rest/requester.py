@@ -6,27 +6,135 @@
 #  SPDX-License-Identifier: EPL-2.0
 #  *******************************************************************************
 
+import asyncio
+import dataclasses
 import json
-from collections.abc import AsyncIterable, Mapping
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
 from typing import Any
+from urllib.parse import urlparse
 
-from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig
 from aiohttp_client_cache.session import CachedSession as AsyncCachedSession
 from aiohttp_retry import ExponentialRetry, RetryClient
 
 from otterdog.logging import is_trace_enabled
 from otterdog.providers.github.auth import AuthStrategy
 from otterdog.providers.github.cache import CacheStrategy
+from otterdog.providers.github.cache.etag import ConditionalEntry
 from otterdog.providers.github.exception import (
     BadCredentialsException,
     GitHubException,
     InsufficientPermissionsException,
 )
+from otterdog.providers.github.rest.scheduler import RateLimitScheduler
 from otterdog.providers.github.stats import RequestStatistics
-from otterdog.utils import get_logger
+from otterdog.utils import get_logger, unwrap
 
 _logger = get_logger(__name__)
 
+_MAX_CONCURRENT_PAGES = 10
+
+
+@dataclasses.dataclass
+class PoolStatistics:
+    limit: int
+    sessions_reused: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    requests_in_flight: int = 0
+    max_requests_in_flight: int = 0
+
+    @property
+    def utilization(self) -> float:
+        # values above 1 indicate requests waiting for a free connection
+        return self.requests_in_flight / self.limit if self.limit > 0 else 0.0
+
+
+class SessionPool:
+    """
+    Provides long-lived http sessions that are shared by all clients talking to the same host,
+    keeping their connections alive in between. Any authorization is supplied with each request,
+    so a session can be reused by clients with different credentials.
+    """
+
+    def __init__(self, limit_per_host: int = 30, keepalive_timeout: float = 30.0):
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._sessions: dict[str, ClientSession] = {}
+        self._statistics: dict[str, PoolStatistics] = {}
+
+    @property
+    def statistics(self) -> dict[str, PoolStatistics]:
+        return self._statistics
+
+    def get_session(self, base_url: str) -> ClientSession:
+        host = urlparse(base_url).netloc
+
+        session = self._sessions.get(host)
+        if session is None or session.closed:
+            _logger.debug("creating pooled session for host '%s'", host)
+
+            statistics = PoolStatistics(self._limit_per_host)
+            session = ClientSession(
+                timeout=ClientTimeout(connect=3, sock_connect=3),
+                connector=TCPConnector(limit=self._limit_per_host, keepalive_timeout=self._keepalive_timeout),
+                trace_configs=[_create_trace_config(statistics)],
+            )
+            self._sessions[host] = session
+            self._statistics[host] = statistics
+        else:
+            self._statistics[host].sessions_reused += 1
+
+        return session
+
+    async def close(self) -> None:
+        for session in self._sessions.values():
+            await session.close()
+
+        self._sessions.clear()
+
+
+def _create_trace_config(statistics: PoolStatistics) -> TraceConfig:
+    async def on_request_start(*_) -> None:
+        statistics.requests_in_flight += 1
+        statistics.max_requests_in_flight = max(statistics.max_requests_in_flight, statistics.requests_in_flight)
+
+    async def on_request_done(*_) -> None:
+        statistics.requests_in_flight -= 1
+
+    async def on_connection_create_end(*_) -> None:
+        statistics.connections_created += 1
+
+    async def on_connection_reuseconn(*_) -> None:
+        statistics.connections_reused += 1
+
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_done)
+    trace_config.on_request_exception.append(on_request_done)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    return trace_config
+
+
+_SESSION_POOL: SessionPool | None = None
+
+
+def get_session_pool() -> SessionPool | None:
+    return _SESSION_POOL
+
+
+def set_session_pool(session_pool: SessionPool | None) -> None:
+    """
+    Sets the session pool to use for all clients created afterwards. Sessions are bound to
+    the event loop they have been created in, so a pool should only be used by long-running
+    processes with a single event loop.
+    """
+    global _SESSION_POOL
+
+    _logger.trace("setting http session pool %s", session_pool)
+    _SESSION_POOL = session_pool
+
 
 class Requester:
     def __init__(
@@ -35,6 +143,7 @@ class Requester:
         cache_strategy: CacheStrategy,
         base_url: str,
         api_version: str,
+        scheduler: RateLimitScheduler | None = None,
     ):
         self._auth = auth_strategy.get_auth() if auth_strategy is not None else None
 
@@ -46,19 +155,42 @@ class Requester:
 
         self._statistics = RequestStatistics()
         self._cache_strategy = cache_strategy
+        self._scheduler = scheduler if scheduler is not None else RateLimitScheduler()
+        self._conditional_cache = cache_strategy.get_conditional_cache()
+
+        session_pool = get_session_pool()
+        self._owns_session = True
 
         if self._cache_strategy.is_external():
             self._base_url = cache_strategy.replace_base_url(f"https://{base_url}")
-            self._session = ClientSession()
+            if session_pool is not None:
+                self._session = session_pool.get_session(self._base_url)
+                self._owns_session = False
+            else:
+                self._session = ClientSession()
         else:
             self._base_url = f"https://{base_url}"
-            self._session = AsyncCachedSession(
-                cache=self._cache_strategy.get_cache_backend(),
-                timeout=ClientTimeout(connect=3, sock_connect=3),
-                connector=TCPConnector(
-                    limit=30,
-                ),
-            )
+
+            cache_backend = self._cache_strategy.get_cache_backend()
+            if cache_backend is None:
+                if session_pool is not None:
+                    self._session = session_pool.get_session(self._base_url)
+                    self._owns_session = False
+                else:
+                    self._session = ClientSession(
+                        timeout=ClientTimeout(connect=3, sock_connect=3),
+                        connector=TCPConnector(
+                            limit=30,
+                        ),
+                    )
+            else:
+                self._session = AsyncCachedSession(
+                    cache=cache_backend,
+                    timeout=ClientTimeout(connect=3, sock_connect=3),
+                    connector=TCPConnector(
+                        limit=30,
+                    ),
+                )
 
         self._client = RetryClient(
             retry_options=ExponentialRetry(3, exceptions={Exception}),
@@ -69,8 +201,14 @@ class Requester:
     def statistics(self) -> RequestStatistics:
         return self._statistics
 
+    @property
+    def scheduler(self) -> RateLimitScheduler:
+        return self._scheduler
+
     async def close(self) -> None:
-        await self._session.close()
+        # pooled sessions are kept open to be reused by other clients
+        if self._owns_session:
+            await self._session.close()
 
     def _build_url(self, url_path: str) -> str:
         return f"{self._base_url}{url_path}"
@@ -83,35 +221,79 @@ class Requester:
         params: dict[str, str] | None = None,
         entries_key: str | None = None,
     ) -> list[dict[str, Any]]:
-        from urllib import parse
+        return [entry async for entry in self.iter_paged_json(method, url_path, data, params, entries_key)]
+
+    async def iter_paged_json(
+        self,
+        method: str,
+        url_path: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, str] | None = None,
+        entries_key: str | None = None,
+        max_concurrent_pages: int = _MAX_CONCURRENT_PAGES,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yields the entries of a paged resource as soon as each page has been received.
+
+        If the first response contains a link to the last page, all remaining pages are
+        retrieved concurrently, otherwise the next links are followed one page at a time.
+        Entries are always yielded in the order of their pages.
+        """
 
         json_data = None
         if data is not None:
             json_data = json.dumps(data)
 
-        result = []
-        query_params: dict[str, str] | None = {"per_page": "100"}
-
-        while query_params is not None:
-            if params is not None:
-                query_params.update(params)
-
-            status, body, next_url, _ = await self._request_raw_with_next_link(
-                method, url_path, json_data, query_params
-            )
-            self._check_response(url_path, status, body)
-            response = json.loads(body)
-
-            entries = response[entries_key] if entries_key is not None else response
-
-            if next_url is None:
-                query_params = None
-            else:
-                query_params = {k: v[0] for k, v in parse.parse_qs(parse.urlparse(next_url).query).items()}
+        query_params = {"per_page": "100"}
+        if params is not None:
+            query_params.update(params)
 
-            result.extend(entries)
+        status, body, next_url, last_url, _ = await self._request_raw_with_links(
+            method, url_path, json_data, query_params
+        )
+        self._check_response(url_path, status, body)
+        for entry in self._get_entries(body, entries_key):
+            yield entry
+
+        last_page = _get_page_number(last_url)
+        if next_url is not None and last_page is not None and _get_page_number(next_url) == 2:
+            page_params = _get_query_params(unwrap(last_url))
+            semaphore = asyncio.Semaphore(max_concurrent_pages)
+
+            async def fetch_page(page: int) -> list[dict[str, Any]]:
+                async with semaphore:
+                    status, body, _, _, _ = await self._request_raw_with_links(
+                        method, url_path, json_data, {**page_params, "page": str(page)}
+                    )
+                    self._check_response(url_path, status, body)
+                    return self._get_entries(body, entries_key)
+
+            tasks = [asyncio.create_task(fetch_page(page)) for page in range(2, last_page + 1)]
+            try:
+                for task in tasks:
+                    for entry in await task:
+                        yield entry
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            while next_url is not None:
+                query_params = _get_query_params(next_url)
+                if params is not None:
+                    query_params.update(params)
+
+                status, body, next_url, _, _ = await self._request_raw_with_links(
+                    method, url_path, json_data, query_params
+                )
+                self._check_response(url_path, status, body)
+                for entry in self._get_entries(body, entries_key):
+                    yield entry
 
-        return result
+    @staticmethod
+    def _get_entries(body: str, entries_key: str | None) -> list[dict[str, Any]]:
+        response = json.loads(body)
+        return response[entries_key] if entries_key is not None else response
 
     async def request_json(
         self,
@@ -138,7 +320,7 @@ class Requester:
         data: str | None = None,
         params: dict[str, Any] | None = None,
     ) -> tuple[int, str]:
-        status, body, _, _ = await self._request_raw_with_next_link(method, url_path, data, params)
+        status, body, _, _, _ = await self._request_raw_with_links(method, url_path, data, params)
         _logger.trace("'%s' url = %s, result = (%d)", method, url_path, status)
         return status, body
 
@@ -149,17 +331,17 @@ class Requester:
         data: str | None = None,
         params: dict[str, Any] | None = None,
     ) -> tuple[int, str, str]:
-        status, body, _, scopes = await self._request_raw_with_next_link(method, url_path, data, params)
+        status, body, _, _, scopes = await self._request_raw_with_links(method, url_path, data, params)
         _logger.trace("'%s' url = %s, result = (%d)", method, url_path, status)
         return status, body, scopes
 
-    async def _request_raw_with_next_link(
+    async def _request_raw_with_links(
         self,
         method: str,
         url_path: str,
         data: str | None = None,
         params: dict[str, Any] | None = None,
-    ) -> tuple[int, str, str | None, str]:
+    ) -> tuple[int, str, str | None, str | None, str]:
         _logger.trace("'%s' url = %s, data = %s, params = %s", method, url_path, data, params)
 
         headers = self._headers.copy()
@@ -167,37 +349,69 @@ class Requester:
             self._auth.update_headers_with_authorization(headers)
 
         url = self._build_url(url_path)
-        async with self._client.request(
-            method,
-            url=url,
-            headers=headers,
-            params=params,
-            data=data,
-            **self._cache_strategy.get_request_parameters(),
-        ) as response:
-            self._statistics.sent_request()
-
-            text = await response.text()
-            status = response.status
-            links = response.links
-            next_link = links.get("next", None) if links is not None else None
-            next_url = next_link.get("url", None) if next_link is not None else None
-
-            self._check_permissions(url_path, status, text, response.headers)
-
-            if (hasattr(response, "from_cache") and response.from_cache) or response.headers.get(
-                "X-From-Cache", 0
-            ) == "1":
-                self._statistics.received_cached_response()
-            else:
-                self._statistics.update_remaining_rate_limit(int(response.headers.get("x-ratelimit-remaining", -1)))
 
-            return (
-                status,
-                text,
-                str(next_url) if next_url is not None else None,
-                response.headers.get("X-OAuth-Scopes", ""),
-            )
+        # for GET requests, use a conditional request if a response has been cached previously
+        cache_key = None
+        cached_entry = None
+        if self._conditional_cache is not None and method.upper() == "GET" and data is None:
+            cache_key = self._conditional_cache.create_key(method, url, params, headers.get("Authorization"))
+            cached_entry = await self._conditional_cache.get(cache_key)
+            if cached_entry is not None:
+                headers["If-None-Match"] = cached_entry.etag
+
+        attempt = 0
+        while True:
+            async with (
+                self._scheduler.limit(),
+                self._client.request(
+                    method,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    data=data,
+                    **self._cache_strategy.get_request_parameters(),
+                ) as response,
+            ):
+                self._statistics.sent_request()
+
+                text = await response.text()
+                status = response.status
+
+                if (hasattr(response, "from_cache") and response.from_cache) or response.headers.get(
+                    "X-From-Cache", 0
+                ) == "1":
+                    self._statistics.received_cached_response()
+                else:
+                    if self._scheduler.is_rate_limited(status, response.headers, text):
+                        self._statistics.throttled_request()
+                        if attempt < self._scheduler.max_retries:
+                            attempt += 1
+                            self._scheduler.backoff(response.headers)
+                            continue
+
+                    self._scheduler.update(response.headers)
+                    self._statistics.update_remaining_rate_limit(int(response.headers.get("x-ratelimit-remaining", -1)))
+
+                next_url = _get_link_url(response.links, "next")
+                last_url = _get_link_url(response.links, "last")
+                scopes = response.headers.get("X-OAuth-Scopes", "")
+
+                self._check_permissions(url_path, status, text, response.headers)
+
+                if cache_key is not None:
+                    if status == 304 and cached_entry is not None:
+                        self._statistics.received_not_modified_response()
+                        return 200, cached_entry.body, cached_entry.next_url, cached_entry.last_url, cached_entry.scopes
+
+                    self._statistics.missed_cached_response()
+                    etag = response.headers.get("ETag")
+                    if status == 200 and etag is not None:
+                        await unwrap(self._conditional_cache).put(
+                            cache_key,
+                            ConditionalEntry(etag, text, next_url, last_url, scopes),
+                        )
+
+                return status, text, next_url, last_url, scopes
 
     async def request_stream(
         self,
@@ -219,16 +433,51 @@ class Requester:
             self._auth.update_headers_with_authorization(headers)
 
         url = self._build_url(url_path)
-        async with self._client.request(
-            method,
-            url=url,
-            headers=headers,
-            params=params,
-            data=data,
-            **self._cache_strategy.get_request_parameters(),
-        ) as response:
-            async for chunk, _ in response.content.iter_chunks():
-                yield chunk
+
+        attempt = 0
+        while True:
+            async with (
+                self._scheduler.limit(),
+                self._client.request(
+                    method,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    data=data,
+                    **self._cache_strategy.get_request_parameters(),
+                ) as response,
+            ):
+                self._statistics.sent_request()
+
+                status = response.status
+
+                # the body of a rate limited response is needed to detect it, it is small though
+                body = await response.read() if status in (403, 429) else None
+
+                if (hasattr(response, "from_cache") and response.from_cache) or response.headers.get(
+                    "X-From-Cache", 0
+                ) == "1":
+                    self._statistics.received_cached_response()
+                else:
+                    if body is not None and self._scheduler.is_rate_limited(
+                        status, response.headers, body.decode("utf-8", errors="replace")
+                    ):
+                        self._statistics.throttled_request()
+                        if attempt < self._scheduler.max_retries:
+                            attempt += 1
+                            self._scheduler.backoff(response.headers)
+                            continue
+
+                    self._scheduler.update(response.headers)
+                    self._statistics.update_remaining_rate_limit(int(response.headers.get("x-ratelimit-remaining", -1)))
+
+                if body is not None:
+                    yield body
+                else:
+                    async for chunk, _ in response.content.iter_chunks():
+                        yield chunk
+
+                return
 
     def _check_response(self, url_path: str, status_code: int, body: str) -> None:
         if status_code >= 400:
@@ -250,3 +499,23 @@ class Requester:
             raise BadCredentialsException(url, body)
         else:
             raise GitHubException(url, status_code, body)
+
+
+def _get_link_url(links: Mapping[str, Mapping[str, Any]] | None, rel: str) -> str | None:
+    link = links.get(rel, None) if links is not None else None
+    url = link.get("url", None) if link is not None else None
+    return str(url) if url is not None else None
+
+
+def _get_query_params(url: str) -> dict[str, str]:
+    from urllib import parse
+
+    return {k: v[0] for k, v in parse.parse_qs(parse.urlparse(url).query).items()}
+
+
+def _get_page_number(url: str | None) -> int | None:
+    if url is None:
+        return None
+
+    page = _get_query_params(url).get("page")
+    return int(page) if page is not None and page.isdigit() else None
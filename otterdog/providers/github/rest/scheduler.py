@@ -0,0 +1,196 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING
+
+from otterdog.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
+_logger = get_logger(__name__)
+
+
+class RateLimitScheduler:
+    """
+    Schedules requests to the GitHub REST API based on the rate limit information
+    returned by GitHub with each response.
+
+    The remaining primary rate limit is treated as a token bucket that is refilled once
+    the current rate limit window resets. The number of requests that may be in flight
+    at the same time is derived from the number of remaining tokens, and is additionally
+    reduced whenever a secondary rate limit is hit.
+    """
+
+    # GitHub recommends to wait at least one minute if no retry-after header is provided
+    _DEFAULT_BACKOFF_SECONDS = 60.0
+
+    def __init__(
+        self,
+        max_concurrency: int = 50,
+        tokens_per_slot: int = 20,
+        max_retries: int = 3,
+        default_backoff: float = _DEFAULT_BACKOFF_SECONDS,
+    ):
+        self._max_concurrency = max_concurrency
+        self._concurrency_cap = max_concurrency
+        self._tokens_per_slot = tokens_per_slot
+        self._max_retries = max_retries
+        self._default_backoff = default_backoff
+
+        self._remaining: int | None = None
+        self._reset_at: float | None = None
+        self._blocked_until = 0.0
+        self._in_flight = 0
+
+        self._condition = asyncio.Condition()
+
+    @property
+    def max_retries(self) -> int:
+        return self._max_retries
+
+    @property
+    def remaining(self) -> int | None:
+        return self._remaining
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def concurrency_limit(self) -> int:
+        if self._remaining is None:
+            return self._concurrency_cap
+
+        return max(1, min(self._concurrency_cap, self._remaining // self._tokens_per_slot))
+
+    @contextlib.asynccontextmanager
+    async def limit(self) -> AsyncIterator[None]:
+        await self._acquire()
+        try:
+            yield
+        finally:
+            await self._release()
+
+    async def _acquire(self) -> None:
+        async with self._condition:
+            while True:
+                delay = self._get_blocking_delay()
+                if delay > 0:
+                    _logger.debug("rate limit exhausted, waiting %.1fs before sending further requests", delay)
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._condition.wait(), timeout=delay)
+                elif self._in_flight < self.concurrency_limit:
+                    break
+                else:
+                    await self._condition.wait()
+
+            self._in_flight += 1
+            if self._remaining is not None:
+                self._remaining -= 1
+
+    async def _release(self) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _get_blocking_delay(self) -> float:
+        now = time.time()
+
+        if self._blocked_until > now:
+            return self._blocked_until - now
+
+        if self._remaining is not None and self._remaining <= 0:
+            if self._reset_at is not None and self._reset_at > now:
+                return self._reset_at - now
+
+            # the rate limit window has been reset, the actual budget
+            # will be known again after the next response.
+            self._remaining = None
+            self._reset_at = None
+
+        return 0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Updates the available budget from the rate limit headers of a response.
+        """
+
+        remaining = _parse_int(headers.get("x-ratelimit-remaining"))
+        if remaining is None or remaining < 0:
+            return
+
+        reset_at = _parse_int(headers.get("x-ratelimit-reset"))
+
+        if self._remaining is None or reset_at is None or self._reset_at is None or reset_at > self._reset_at:
+            # a new rate limit window started
+            self._remaining = remaining
+        else:
+            # responses might arrive out of order, keep the more conservative value
+            self._remaining = min(self._remaining, remaining)
+
+        if reset_at is not None:
+            self._reset_at = float(reset_at)
+
+        # slowly recover from any previous secondary rate limit
+        if self._concurrency_cap < self._max_concurrency:
+            self._concurrency_cap += 1
+
+    @staticmethod
+    def is_rate_limited(status: int, headers: Mapping[str, str], body: str) -> bool:
+        if status not in (403, 429):
+            return False
+
+        if headers.get("retry-after") is not None:
+            return True
+
+        if _parse_int(headers.get("x-ratelimit-remaining")) == 0:
+            return True
+
+        return "rate limit" in body.lower()
+
+    def backoff(self, headers: Mapping[str, str]) -> float:
+        """
+        Blocks any further requests after hitting a primary or secondary rate limit
+        and returns the number of seconds to wait.
+        """
+
+        now = time.time()
+
+        retry_after = _parse_int(headers.get("retry-after"))
+        reset_at = _parse_int(headers.get("x-ratelimit-reset"))
+
+        if retry_after is not None:
+            delay = float(retry_after)
+        elif _parse_int(headers.get("x-ratelimit-remaining")) == 0 and reset_at is not None:
+            delay = max(0.0, reset_at - now)
+        else:
+            delay = self._default_backoff
+
+        self._blocked_until = max(self._blocked_until, now + delay)
+        self._concurrency_cap = max(1, self._concurrency_cap // 2)
+
+        _logger.warning(
+            "hit rate limit, backing off for %.1fs and reducing concurrency to %d", delay, self._concurrency_cap
+        )
+        return delay
+
+
+def _parse_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
@@ -0,0 +1,110 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+
+from otterdog.logging import get_logger
+
+from . import encrypt_value
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from .requester import Requester
+
+    KeyScope = tuple[str, ...]
+    PublicKeyRetriever = Callable[[], Awaitable[tuple[str, str]]]
+
+_logger = get_logger(__name__)
+
+
+class SecretEncryptor:
+    """
+    Encrypts and uploads secrets using the public key of their scope, e.g. an organization,
+    a repository or an environment.
+
+    Public keys are retrieved once per scope and cached for the lifetime of the encryptor,
+    concurrent requests for the same scope share a single retrieval. The encryption itself
+    is performed in a worker thread to keep the event loop responsive. If GitHub rejects
+    an upload with status 422, the cached key of the scope is discarded and the upload
+    is retried once with a freshly retrieved key.
+    """
+
+    def __init__(self) -> None:
+        self._public_keys: dict[KeyScope, tuple[str, str]] = {}
+        self._pending: dict[KeyScope, asyncio.Future[tuple[str, str]]] = {}
+
+    async def get_public_key(self, scope: KeyScope, retrieve: PublicKeyRetriever) -> tuple[str, str]:
+        public_key = self._public_keys.get(scope)
+        if public_key is not None:
+            return public_key
+
+        pending = self._pending.get(scope)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[tuple[str, str]] = asyncio.get_running_loop().create_future()
+        self._pending[scope] = future
+        try:
+            public_key = await retrieve()
+            self._public_keys[scope] = public_key
+            future.set_result(public_key)
+            return public_key
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as ex:
+            future.set_exception(ex)
+            # mark the exception as retrieved in case nobody else is waiting for it
+            future.exception()
+            raise
+        finally:
+            del self._pending[scope]
+
+    def invalidate(self, scope: KeyScope, key_id: str) -> None:
+        public_key = self._public_keys.get(scope)
+        if public_key is not None and public_key[0] == key_id:
+            _logger.debug("discarding public key '%s' for scope %s", key_id, scope)
+            del self._public_keys[scope]
+
+    async def encrypt(self, scope: KeyScope, retrieve: PublicKeyRetriever, value: str) -> dict[str, str]:
+        key_id, public_key = await self.get_public_key(scope, retrieve)
+        encrypted_value = await asyncio.to_thread(encrypt_value, public_key, value)
+        return {"encrypted_value": encrypted_value, "key_id": key_id}
+
+    async def put_secret(
+        self,
+        requester: Requester,
+        url_path: str,
+        data: dict[str, Any],
+        scope: KeyScope,
+        retrieve: PublicKeyRetriever,
+    ) -> int:
+        """
+        Uploads the secret described by data to url_path, encrypting its value if present.
+        Returns the status code of the response.
+        """
+        value = data.pop("value", None)
+
+        retried = False
+        while True:
+            if value is not None:
+                data.update(await self.encrypt(scope, retrieve, value))
+
+            status, _ = await requester.request_raw("PUT", url_path, json.dumps(data))
+
+            if status == 422 and value is not None and not retried:
+                retried = True
+                self.invalidate(scope, data["key_id"])
+                continue
+
+            return status
@@ -15,11 +15,17 @@ import dataclasses
 class RequestStatistics:
     total_requests: int = 0
     cached_responses: int = 0
+    not_modified_responses: int = 0
+    cache_misses: int = 0
+    throttled_requests: int = 0
     remaining_rate_limit: int = -1
 
     def merge(self, other: RequestStatistics) -> None:
         self.total_requests += other.total_requests
         self.cached_responses += other.cached_responses
+        self.not_modified_responses += other.not_modified_responses
+        self.cache_misses += other.cache_misses
+        self.throttled_requests += other.throttled_requests
 
         if self.remaining_rate_limit == -1:
             self.remaining_rate_limit = other.remaining_rate_limit
@@ -34,5 +40,14 @@ class RequestStatistics:
     def received_cached_response(self) -> None:
         self.cached_responses += 1
 
+    def received_not_modified_response(self) -> None:
+        self.not_modified_responses += 1
+
+    def missed_cached_response(self) -> None:
+        self.cache_misses += 1
+
+    def throttled_request(self) -> None:
+        self.throttled_requests += 1
+
     def update_remaining_rate_limit(self, remaining: int) -> None:
         self.remaining_rate_limit = remaining
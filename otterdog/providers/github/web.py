@@ -19,12 +19,15 @@ from playwright.async_api import Error as PlaywrightError
 from playwright.async_api import Page, async_playwright
 
 from otterdog import logging
+from otterdog.providers.github.browser_pool import get_browser_pool, launch_browser
 from otterdog.utils import unwrap
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
     from typing import Any
 
+    from playwright.async_api import BrowserContext
+
     from otterdog.credentials import Credentials
 
 _logger = logging.get_logger(__name__)
@@ -36,6 +39,12 @@ class WebClient:
     _REPO_DEFAULTS_PAGE_URL = "/settings/repository-defaults"
     _REPO_DEFAULTS_404_RETRIES = 5
     _REPO_DEFAULTS_404_RETRY_DELAY = 1
+    _BATCH_EXTRACTION_SCRIPT = """
+        (queries) => queries.map(([selector, property]) => {
+            const el = document.querySelector(selector);
+            return el === null ? [false, null] : [true, el[property]];
+        })
+    """
 
     def __init__(self, credentials: Credentials):
         self.credentials = credentials
@@ -57,21 +66,7 @@ class WebClient:
     async def get_org_settings(self, org_id: str, included_keys: set[str]) -> dict[str, Any]:
         _logger.debug("retrieving settings via web interface")
 
-        async with async_playwright() as playwright:
-            try:
-                browser = await playwright.firefox.launch()
-            except Exception as e:
-                tb = e.__traceback__
-                raise RuntimeError(
-                    "unable to launch browser, make sure you have installed required dependencies using: "
-                    "'otterdog install-deps'"
-                ).with_traceback(tb) from None
-
-            context = await browser.new_context()
-
-            login_page = await context.new_page()
-            login_page.set_default_timeout(self._DEFAULT_TIMEOUT)
-            await self._login_if_required(login_page)
+        async with self._logged_in_context() as (context, _):
 
             async def process_page(page_url, page_def) -> dict[str, Any]:
                 page = await context.new_page()
@@ -80,15 +75,7 @@ class WebClient:
 
             tasks = [process_page(page_url, page_def) for page_url, page_def in self._get_pages(included_keys)]
             settings_list = await gather(*tasks)
-            settings = {k: v for d in settings_list for k, v in d.items()}
-
-            await self._logout(login_page)
-
-            await login_page.close()
-            await context.close()
-            await browser.close()
-
-            return settings
+            return {k: v for d in settings_list for k, v in d.items()}
 
     def _get_pages(self, included_keys: set[str]) -> Iterator[tuple[str, Any]]:
         for page_url, page_def in self.web_settings_definition.items():
@@ -105,6 +92,9 @@ class WebClient:
 
         await self._goto(page, f"https://github.com/organizations/{org_id}/{page_url}")
 
+        # settings that do not require any interaction with the page are retrieved at once
+        prefetched_values = await self._retrieve_setting_values(page, page_def, included_keys)
+
         for setting_def in page_def:
             setting = setting_def["name"]
             optional = setting_def["optional"]
@@ -121,33 +111,23 @@ class WebClient:
                     continue
 
             try:
-                setting_type = setting_def["type"]
-                match setting_type:
-                    case "checkbox":
-                        selector = setting_def["selector"]
-
-                    case "radio":
-                        selector = f"{setting_def['selector']}:checked"
-
-                    case "select-menu":
-                        selector = f"{setting_def['selector']}"
-
-                    case "text":
-                        selector = setting_def["selector"]
+                if setting in prefetched_values:
+                    found, value = prefetched_values[setting]
+                    if not found:
+                        raise RuntimeError(f"no element found for selector '{self._get_selector(setting_def)}'")
+                else:
+                    selector = self._get_selector(setting_def)
 
-                    case _:
-                        raise RuntimeError(f"not supported setting type '{setting_type}'")
+                    pre_selector = setting_def["preSelector"]
+                    if pre_selector is not None:
+                        await page.click(pre_selector)
+                        await page.wait_for_selector(selector, state="attached")
 
-                pre_selector = setting_def["preSelector"]
-                if pre_selector is not None:
-                    await page.click(pre_selector)
-                    await page.wait_for_selector(selector, state="attached")
-
-                value = await page.eval_on_selector(
-                    selector,
-                    "(el, property) => el[property]",
-                    setting_def["valueSelector"],
-                )
+                    value = await page.eval_on_selector(
+                        selector,
+                        "(el, property) => el[property]",
+                        setting_def["valueSelector"],
+                    )
 
                 if isinstance(value, str):
                     value = value.strip()
@@ -164,29 +144,60 @@ class WebClient:
 
         return settings
 
-    async def update_org_settings(self, org_id: str, data: dict[str, Any]) -> None:
-        _logger.debug("updating settings via web interface")
+    @staticmethod
+    def _get_selector(setting_def: dict[str, Any]) -> str:
+        setting_type = setting_def["type"]
+        match setting_type:
+            case "checkbox" | "select-menu" | "text":
+                return setting_def["selector"]
+
+            case "radio":
+                return f"{setting_def['selector']}:checked"
+
+            case _:
+                raise RuntimeError(f"not supported setting type '{setting_type}'")
+
+    async def _retrieve_setting_values(
+        self, page: Page, page_def: Any, included_keys: set[str]
+    ) -> dict[str, tuple[bool, Any]]:
+        """
+        Reads the values of all requested settings of a page without a preSelector
+        with a single evaluation in the browser.
+
+        Returns a dict mapping the name of each setting to a tuple (found, value). Settings
+        that are missing in the result need to be retrieved individually.
+        """
+        queries: list[tuple[str, str, str]] = []
+        for setting_def in page_def:
+            if setting_def["name"] not in included_keys or setting_def["preSelector"] is not None:
+                continue
 
-        async with async_playwright() as playwright:
             try:
-                browser = await playwright.firefox.launch()
-            except Exception as e:
-                tb = e.__traceback__
-                raise RuntimeError(
-                    "unable to launch browser, make sure you have installed required dependencies using: "
-                    "'otterdog install-deps'"
-                ).with_traceback(tb) from None
+                selector = self._get_selector(setting_def)
+            except RuntimeError:
+                continue
 
-            page = await browser.new_page()
-            page.set_default_timeout(self._DEFAULT_TIMEOUT)
+            queries.append((setting_def["name"], selector, setting_def["valueSelector"]))
 
-            await self._login_if_required(page)
-            await self._update_settings(org_id, data, page)
-            await self._logout(page)
+        if len(queries) == 0:
+            return {}
 
-            await page.close()
-            await browser.close()
+        try:
+            results = await page.evaluate(
+                self._BATCH_EXTRACTION_SCRIPT,
+                [[selector, property] for _, selector, property in queries],
+            )
+        except PlaywrightError as e:
+            _logger.debug("failed to retrieve settings in batch, falling back to individual retrieval: %s", e)
+            return {}
+
+        return {name: (found, value) for (name, _, _), (found, value) in zip(queries, results, strict=True)}
+
+    async def update_org_settings(self, org_id: str, data: dict[str, Any]) -> None:
+        _logger.debug("updating settings via web interface")
 
+        async with self._logged_in_context() as (_, page):
+            await self._update_settings(org_id, data, page)
             _logger.debug(f"updated {len(data)} setting(s) via web interface")
 
     async def _update_settings(self, org_id: str, settings: dict[str, Any], page: Page) -> None:
@@ -255,14 +266,7 @@ class WebClient:
         _logger.trace("opening browser window")
 
         async with async_playwright() as playwright:
-            try:
-                browser = await playwright.firefox.launch(headless=False)
-            except Exception as e:
-                tb = e.__traceback__
-                raise RuntimeError(
-                    "unable to launch browser, make sure you have installed required dependencies using: "
-                    "'otterdog install-deps'"
-                ).with_traceback(tb) from None
+            browser = await launch_browser(playwright, headless=False)
 
             context = await browser.new_context(no_viewport=True)
 
@@ -286,23 +290,7 @@ class WebClient:
     async def install_github_app(self, org_int_id: str, app_slug: str) -> None:
         _logger.debug("installing github app '%s'", app_slug)
 
-        async with async_playwright() as playwright:
-            try:
-                browser = await playwright.firefox.launch(headless=True)
-            except Exception as e:
-                tb = e.__traceback__
-                raise RuntimeError(
-                    "unable to launch browser, make sure you have installed required dependencies using: "
-                    "'otterdog install-deps'"
-                ).with_traceback(tb) from None
-
-            context = await browser.new_context(no_viewport=True)
-
-            page = await context.new_page()
-            page.set_default_timeout(self._DEFAULT_TIMEOUT)
-
-            await self._login_if_required(page)
-
+        async with self._logged_in_context(no_viewport=True) as (_, page):
             await page.goto(
                 f"https://github.com/apps/{app_slug}/installations/new/permissions"
                 f"?target_id={org_int_id}&target_type=Organization"
@@ -310,31 +298,10 @@ class WebClient:
 
             await page.locator('button:text("Install")').click()
 
-            await self._logout(page)
-
-            await page.close()
-            await context.close()
-            await browser.close()
-
     async def uninstall_github_app(self, org_id: str, installation_id: str) -> None:
         _logger.debug("deleting app installation with id '%s'", installation_id)
 
-        async with async_playwright() as playwright:
-            try:
-                browser = await playwright.firefox.launch(headless=True)
-            except Exception as e:
-                tb = e.__traceback__
-                raise RuntimeError(
-                    "unable to launch browser, make sure you have installed required dependencies using: "
-                    "'otterdog install-deps'"
-                ).with_traceback(tb) from None
-
-            context = await browser.new_context(no_viewport=True)
-
-            page = await context.new_page()
-            page.set_default_timeout(self._DEFAULT_TIMEOUT)
-
-            await self._login_if_required(page)
+        async with self._logged_in_context(no_viewport=True) as (_, page):
 
             async def accept_dialog(dialog):
                 await dialog.accept()
@@ -343,52 +310,46 @@ class WebClient:
 
             await page.goto(f"https://github.com/organizations/{org_id}/settings/installations/{installation_id}")
             await page.locator('input:text("Uninstall")').click()
-            await self._logout(page)
-
-            await page.close()
-            await context.close()
-            await browser.close()
 
     @asynccontextmanager
     async def get_logged_in_page(self):
-        context_manager = async_playwright()
-
-        page = None
-        context = None
-        browser = None
-
-        try:
-            playwright = await context_manager.start()
-
-            try:
-                browser = await playwright.firefox.launch(headless=True)
-            except Exception as e:
-                tb = e.__traceback__
-                raise RuntimeError(
-                    "unable to launch browser, make sure you have installed required dependencies using: "
-                    "'otterdog install-deps'"
-                ).with_traceback(tb) from None
+        async with self._logged_in_context(no_viewport=True) as (_, page):
+            yield page
 
-            context = await browser.new_context(no_viewport=True)
+    @asynccontextmanager
+    async def _logged_in_context(self, **context_options: Any) -> AsyncIterator[tuple[BrowserContext, Page]]:
+        """
+        Yields a browser context together with a page in which the user is logged in.
 
-            page = await context.new_page()
-            page.set_default_timeout(self._DEFAULT_TIMEOUT)
+        If a browser pool is available, the session of the user is kept for subsequent calls,
+        otherwise a new browser is launched and the user is logged out again afterward.
+        """
+        browser_pool = get_browser_pool()
+        if browser_pool is not None:
+            async with browser_pool.new_context(self.credentials.username, self._logout, **context_options) as context:
+                page = await context.new_page()
+                page.set_default_timeout(self._DEFAULT_TIMEOUT)
+                await self._login_if_required(page)
 
-            await self._login_if_required(page)
+                yield context, page
 
-            yield page
-        finally:
-            if page is not None:
-                await self._logout(page)
                 await page.close()
+        else:
+            async with async_playwright() as playwright:
+                browser = await launch_browser(playwright)
+                context = await browser.new_context(**context_options)
 
-            if context is not None:
-                await context.close()
-
-            if browser is not None:
-                await browser.close()
+                page = await context.new_page()
+                page.set_default_timeout(self._DEFAULT_TIMEOUT)
 
-            await context_manager.__aexit__()
+                try:
+                    await self._login_if_required(page)
+                    yield context, page
+                finally:
+                    await self._logout(page)
+                    await page.close()
+                    await context.close()
+                    await browser.close()
 
     async def get_security_advisory_newest_comment_date(self, ghsa_link: str, page: Page) -> str | None:
         """Follow passed GHSA link, scrape for comments, and return the date of
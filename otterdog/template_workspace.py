@@ -0,0 +1,382 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import os
+import re
+import shutil
+import stat
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+import aiofiles.os
+import aiofiles.ospath
+
+from otterdog.logging import get_logger
+from otterdog.utils import add_jsonnet_workspace_dir, parse_github_url, run_command, unwrap
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_logger = get_logger(__name__)
+
+_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+_REFRESH_INTERVAL = 300.0
+
+# per checkout directory: the lock guarding it, and the sha and time of its last refresh
+_checkout_locks: dict[str, asyncio.Lock] = {}
+_checkout_refreshes: dict[str, tuple[str, float]] = {}
+
+
+def get_template_checkout_dir(base_dir: str, repo_url: str, ref: str) -> str:
+    """
+    Returns the directory in which the template repo with the given ref is checked out.
+    """
+    owner, repo = parse_github_url(repo_url)
+    return f"{base_dir}/templates/{owner}/{repo}/{ref}"
+
+
+async def _run_git(*args: str, cwd: str | None = None) -> str:
+    status, stdout, stderr = await run_command("git", *args, cwd=cwd)
+    if status != 0:
+        raise RuntimeError(f"failed to run 'git {args[0]}': {stderr.strip()}")
+
+    return stdout
+
+
+async def resolve_template_ref(repo_url: str, ref: str) -> str | None:
+    """
+    Resolves the given ref of the template repo to the sha of the commit it points to
+    without fetching the repo. Returns None if the ref could not be resolved remotely,
+    e.g. if it is an abbreviated sha.
+    """
+    if _SHA_PATTERN.match(ref):
+        return ref
+
+    output = await _run_git("ls-remote", repo_url, ref, f"{ref}^{{}}")
+
+    shas: dict[str, str] = {}
+    for line in output.splitlines():
+        sha, _, name = line.partition("\t")
+        shas[name] = sha
+
+    # prefer branches over tags, annotated tags are resolved to the commit they point to
+    for name in (ref, f"refs/heads/{ref}", f"refs/tags/{ref}^{{}}", f"refs/tags/{ref}"):
+        if name in shas:
+            return shas[name]
+
+    return None
+
+
+async def update_template_checkout(repo_url: str, ref: str, checkout_dir: str) -> str:
+    """
+    Updates the checkout of the template repo in checkout_dir to the commit the given ref
+    currently points to and returns its sha.
+
+    Only this commit is fetched, without history and blobs that are not needed for its checkout.
+    Nothing is fetched if the checkout is already at the resolved commit.
+    """
+    sha = await resolve_template_ref(repo_url, ref)
+
+    if not await aiofiles.ospath.exists(f"{checkout_dir}/.git"):
+        _logger.debug("initializing checkout of base template from url '%s'", repo_url)
+        await aiofiles.os.makedirs(checkout_dir, exist_ok=True)
+        await _run_git("init", "--quiet", cwd=checkout_dir)
+        await _run_git("remote", "add", "origin", repo_url, cwd=checkout_dir)
+    elif sha is not None:
+        # HEAD is unborn if the initial fetch did not complete, the fetch is retried then
+        status, head, _ = await run_command("git", "rev-parse", "--verify", "--quiet", "HEAD", cwd=checkout_dir)
+        if status == 0 and head.strip() == sha:
+            return sha
+
+    _logger.debug("fetching base template from url '%s' with ref '%s'", repo_url, ref)
+
+    if sha is not None:
+        await _run_git("fetch", "--quiet", "--depth=1", "--filter=blob:none", "origin", sha, cwd=checkout_dir)
+    else:
+        # the ref can only be resolved locally, fetch the history without any blobs
+        await _run_git("fetch", "--quiet", "--filter=blob:none", "--tags", "origin", cwd=checkout_dir)
+        sha = (await _run_git("rev-parse", "--verify", f"{ref}^{{commit}}", cwd=checkout_dir)).strip()
+
+    await _run_git("checkout", "--quiet", "--force", "--detach", sha, cwd=checkout_dir)
+    return sha
+
+
+async def refresh_template_checkout(
+    repo_url: str,
+    ref: str,
+    checkout_dir: str,
+    refresh_interval: float = _REFRESH_INTERVAL,
+) -> str:
+    """
+    Updates the checkout of the template repo in checkout_dir unless it has already been
+    updated within the last refresh_interval seconds, and returns the sha of its commit.
+
+    Concurrent callers for the same checkout wait for a single update, checkouts of other
+    templates or refs are updated independently.
+    """
+    async with get_template_checkout_lock(checkout_dir):
+        last_refresh = _checkout_refreshes.get(checkout_dir)
+        if last_refresh is not None and time.monotonic() - last_refresh[1] <= refresh_interval:
+            return last_refresh[0]
+
+        sha = await update_template_checkout(repo_url, ref, checkout_dir)
+        _checkout_refreshes[checkout_dir] = (sha, time.monotonic())
+        return sha
+
+
+def get_template_checkout_lock(checkout_dir: str) -> asyncio.Lock:
+    """
+    Returns the lock that guards the checkout in checkout_dir.
+    """
+    return _checkout_locks.setdefault(checkout_dir, asyncio.Lock())
+
+
+def _get_copy_filter(checkout_dir: str, template_file: str) -> Callable[[str, list[str]], set[str]]:
+    base_template_directory = os.path.dirname(template_file)
+    if len(base_template_directory) == 0:
+        return shutil.ignore_patterns(".git")
+
+    # if the base template is in a subdir, only copy this subdir
+    pattern = f"{base_template_directory}/**"
+
+    def _include_pattern(path: str, names: list[str]) -> set[str]:
+        from pathlib import PurePath
+
+        ignored_names = []
+        for name in names:
+            p = PurePath(os.path.join(path, name))
+            relative_path = p.relative_to(checkout_dir)
+            if not base_template_directory.startswith(str(relative_path)) and not p.match(pattern):
+                ignored_names.append(name)
+        return set(ignored_names)
+
+    return _include_pattern
+
+
+def copy_template(checkout_dir: str, template_file: str, target_dir: str) -> None:
+    """
+    Copies the files of the template checkout required for the given template file to target_dir.
+    """
+    shutil.copytree(checkout_dir, target_dir, ignore=_get_copy_filter(checkout_dir, template_file))
+
+
+def hash_template_dir(template_file: str, template_dir: str) -> str:
+    """
+    Returns the hash of the template file name and all files in the template directory.
+    """
+    digest = hashlib.sha256(template_file.encode("utf-8"))
+    for root, dirs, files in os.walk(template_dir):
+        dirs[:] = sorted(d for d in dirs if d != ".git")
+        for file in sorted(files):
+            path = os.path.join(root, file)
+            digest.update(os.path.relpath(path, template_dir).encode("utf-8"))
+            with open(path, "rb") as f:
+                digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def _make_read_only(directory: str) -> None:
+    for root, _, files in os.walk(directory):
+        for file in files:
+            path = os.path.join(root, file)
+            os.chmod(path, stat.S_IMODE(os.lstat(path).st_mode) & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+@dataclasses.dataclass(frozen=True)
+class TemplateWorkspace:
+    """
+    A prepared, read-only copy of a template at a specific commit.
+    """
+
+    path: str
+    sha: str
+    template_hash: str
+
+
+@dataclasses.dataclass
+class _CheckoutState:
+    lock: asyncio.Lock
+    sha: str | None = None
+    refreshed_at: float = 0.0
+    refresh_task: asyncio.Task | None = None
+    revisions: list[str] = dataclasses.field(default_factory=list)
+    template_files: set[str] = dataclasses.field(default_factory=set)
+    workspaces: dict[tuple[str, str], TemplateWorkspace] = dataclasses.field(default_factory=dict)
+
+
+class TemplateWorkspaceCache:
+    """
+    Prepares templates once per template repo, commit and template directory and shares
+    them between all organizations using them.
+
+    Instead of copying a template into each organization directory, the vendor directory
+    of an organization links to the prepared workspace, which must not be modified.
+    The template checkout is refreshed in the background once refresh_interval seconds
+    have passed since the last refresh, in the meantime the workspace of the last known
+    commit is used. Workspaces of older commits are removed, only the workspaces of the
+    last keep_revisions commits are retained to not pull them away from running tasks.
+    """
+
+    def __init__(self, refresh_interval: float = _REFRESH_INTERVAL, keep_revisions: int = 2):
+        self._refresh_interval = refresh_interval
+        self._keep_revisions = keep_revisions
+        self._checkouts: dict[str, _CheckoutState] = {}
+
+    async def get(self, base_dir: str, repo_url: str, ref: str, template_file: str) -> TemplateWorkspace:
+        """
+        Returns the prepared workspace of the given template, the template file is relative to the
+        root of the template repo.
+        """
+        checkout_dir = get_template_checkout_dir(base_dir, repo_url, ref)
+
+        state = self._checkouts.get(checkout_dir)
+        if state is None:
+            state = _CheckoutState(get_template_checkout_lock(checkout_dir))
+            self._checkouts[checkout_dir] = state
+
+        state.template_files.add(template_file)
+
+        if state.sha is None:
+            async with state.lock:
+                if state.sha is None:
+                    await self._refresh(state, base_dir, repo_url, ref, checkout_dir)
+        elif time.monotonic() - state.refreshed_at > self._refresh_interval and state.refresh_task is None:
+            state.refresh_task = asyncio.create_task(
+                self._refresh_in_background(state, base_dir, repo_url, ref, checkout_dir)
+            )
+
+        sha = unwrap(state.sha)
+        workspace = state.workspaces.get((sha, template_file))
+        if workspace is None:
+            async with state.lock:
+                # the checkout might have been refreshed in the meantime
+                sha = unwrap(state.sha)
+                workspace = state.workspaces.get((sha, template_file))
+                if workspace is None:
+                    workspace = await self._prepare(state, base_dir, repo_url, checkout_dir, sha, template_file)
+
+        return workspace
+
+    async def _refresh(self, state: _CheckoutState, base_dir: str, repo_url: str, ref: str, checkout_dir: str) -> None:
+        _logger.debug("refreshing base template '%s@%s'", repo_url, ref)
+
+        sha = await update_template_checkout(repo_url, ref, checkout_dir)
+        state.refreshed_at = time.monotonic()
+
+        if sha == state.sha:
+            return
+
+        state.sha = sha
+        if sha not in state.revisions:
+            state.revisions.append(sha)
+
+        for template_file in list(state.template_files):
+            try:
+                await self._prepare(state, base_dir, repo_url, checkout_dir, sha, template_file)
+            except Exception as ex:
+                _logger.warning("failed to prepare workspace for template '%s@%s': %s", repo_url, sha, ex)
+
+        await self._evict_revisions(state)
+
+    async def _refresh_in_background(
+        self, state: _CheckoutState, base_dir: str, repo_url: str, ref: str, checkout_dir: str
+    ) -> None:
+        try:
+            async with state.lock:
+                await self._refresh(state, base_dir, repo_url, ref, checkout_dir)
+        except Exception as ex:
+            # try again after the next refresh interval
+            state.refreshed_at = time.monotonic()
+            _logger.warning("failed to refresh base template '%s@%s': %s", repo_url, ref, ex)
+        finally:
+            state.refresh_task = None
+
+    async def _prepare(
+        self,
+        state: _CheckoutState,
+        base_dir: str,
+        repo_url: str,
+        checkout_dir: str,
+        sha: str,
+        template_file: str,
+    ) -> TemplateWorkspace:
+        owner, repo = parse_github_url(repo_url)
+        variant = hashlib.sha256(os.path.dirname(template_file).encode("utf-8")).hexdigest()[:12]
+        workspace_dir = f"{base_dir}/workspaces/{owner}/{repo}/{sha}-{variant}"
+
+        # allow jsonnet imports from the workspaces linked to by organizations
+        add_jsonnet_workspace_dir(f"{base_dir}/workspaces")
+
+        def prepare() -> str:
+            if not os.path.exists(workspace_dir):
+                _logger.debug("preparing workspace for template '%s@%s'", repo_url, sha)
+
+                # prepare the workspace in a temporary directory first, so that it never
+                # becomes visible in an incomplete state
+                tmp_dir = f"{workspace_dir}.{uuid.uuid4().hex}.tmp"
+                try:
+                    copy_template(checkout_dir, template_file, tmp_dir)
+                    _make_read_only(tmp_dir)
+                    try:
+                        os.rename(tmp_dir, workspace_dir)
+                    except OSError:
+                        # the workspace might have been prepared concurrently
+                        if not os.path.isdir(workspace_dir):
+                            raise
+                finally:
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+            return hash_template_dir(template_file, workspace_dir)
+
+        template_hash = await asyncio.to_thread(prepare)
+        workspace = TemplateWorkspace(workspace_dir, sha, template_hash)
+        state.workspaces[(sha, template_file)] = workspace
+        return workspace
+
+    async def _evict_revisions(self, state: _CheckoutState) -> None:
+        while len(state.revisions) > self._keep_revisions:
+            sha = state.revisions.pop(0)
+            for key in [key for key in state.workspaces if key[0] == sha]:
+                workspace = state.workspaces.pop(key)
+                _logger.debug("removing workspace '%s'", workspace.path)
+                await asyncio.to_thread(shutil.rmtree, workspace.path, True)
+
+    async def close(self) -> None:
+        for state in self._checkouts.values():
+            if state.refresh_task is not None:
+                state.refresh_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await state.refresh_task
+
+        self._checkouts.clear()
+
+
+_TEMPLATE_WORKSPACE_CACHE: TemplateWorkspaceCache | None = None
+
+
+def get_template_workspace_cache() -> TemplateWorkspaceCache | None:
+    return _TEMPLATE_WORKSPACE_CACHE
+
+
+def set_template_workspace_cache(cache: TemplateWorkspaceCache | None) -> None:
+    """
+    Sets the cache of template workspaces to use, if no cache is set, the template
+    is copied into the directory of each organization instead.
+    """
+    global _TEMPLATE_WORKSPACE_CACHE
+
+    _logger.trace("setting template workspace cache %s", cache)
+    _TEMPLATE_WORKSPACE_CACHE = cache
@@ -8,10 +8,13 @@
 
 from __future__ import annotations
 
+import contextlib
 import contextvars
+import hashlib
 import json
 import os
 import re
+import weakref
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
@@ -24,7 +27,9 @@ from otterdog.logging import _print_message, get_logger, is_info_enabled
 
 if TYPE_CHECKING:
     from argparse import Namespace
-    from collections.abc import Callable, Mapping, Sequence
+    from asyncio import AbstractEventLoop, Semaphore
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
+    from concurrent.futures import Executor
 
 T = TypeVar("T")
 
@@ -367,10 +372,31 @@ async def run_command(cmd: str, *args: str, **kwargs) -> tuple[int, str, str]:
     return process.returncode, stdout.decode("utf-8"), stderr.decode("utf-8")  # type: ignore
 
 
+async def gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """
+    Runs the given awaitables concurrently like asyncio.gather, but cancels
+    the remaining ones as soon as one of them fails.
+    """
+    import asyncio
+
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 _jsonnet_import_root: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "otterdog_jsonnet_import_root", default=None
 )
 
+# real paths of directories containing template workspaces shared via symlinks
+_jsonnet_workspace_dirs: set[str] = set()
+
 
 class restrict_jsonnet_imports:  # noqa: N801
     """Context manager confining jsonnet imports to a directory tree.
@@ -399,6 +425,10 @@ class restrict_jsonnet_imports:  # noqa: N801
     For direct ``jsonnet_evaluate_file`` / ``jsonnet_evaluate_snippet`` calls,
     prefer passing ``import_base_dir=...`` explicitly instead of relying on
     the surrounding context.
+
+    The vendored template may also be a symlink to a template workspace shared
+    between organizations. Imports from such a workspace are allowed as well,
+    see get_jsonnet_import_roots.
     """
 
     def __init__(self, base_dir: str) -> None:
@@ -415,54 +445,296 @@ class restrict_jsonnet_imports:  # noqa: N801
             self._token = None
 
 
-def _make_jsonnet_import_callback(allowed_root: str) -> Callable[[str, str], tuple[str, str | None]]:
-    real_root = os.path.realpath(allowed_root)
+def current_jsonnet_import_root() -> str | None:
+    """
+    Returns the directory jsonnet imports are currently restricted to, if any.
+    """
+    return _jsonnet_import_root.get()
+
+
+def add_jsonnet_workspace_dir(workspace_dir: str) -> None:
+    """
+    Registers a directory containing template workspaces that organizations may link to
+    from their vendor directory, see get_jsonnet_import_roots.
+    """
+    _jsonnet_workspace_dirs.add(os.path.realpath(workspace_dir))
+
+
+def get_jsonnet_import_roots(import_root: str) -> list[str]:
+    """
+    Returns the real paths of all directories that jsonnet files may be imported from
+    when imports are restricted to import_root.
+
+    Besides import_root itself, these are the targets of symlinks in its vendor directory
+    that point to a template workspace inside a registered workspace directory,
+    see add_jsonnet_workspace_dir. Any other symlink target is not allowed.
+    """
+    roots = [os.path.realpath(import_root)]
+
+    with contextlib.suppress(OSError), os.scandir(os.path.join(import_root, "vendor")) as it:
+        for entry in it:
+            if entry.is_symlink():
+                target = os.path.realpath(entry.path)
+                if any(
+                    target != workspace_dir and is_within_jsonnet_import_roots(target, [workspace_dir])
+                    for workspace_dir in _jsonnet_workspace_dirs
+                ):
+                    roots.append(target)
+
+    return roots
+
+
+def is_within_jsonnet_import_roots(path: str, roots: list[str]) -> bool:
+    """
+    Returns whether the given real path is located inside any of the given import roots.
+    """
+    for root in roots:
+        try:
+            if os.path.commonpath([path, root]) == root:
+                return True
+        except ValueError:
+            continue
+
+    return False
+
+
+def _make_jsonnet_import_callback(
+    allowed_roots: list[str] | None,
+    imports: dict[str, str] | None = None,
+) -> Callable[[str, str], tuple[str, str | None]]:
+    """
+    Creates an import callback that confines imports to the allowed roots if given and
+    records the sha256 hash of every imported file in imports if given.
+    """
 
     def callback(base: str, rel: str) -> tuple[str, str | None]:
         candidate = rel if os.path.isabs(rel) else os.path.join(base, rel)
         # resolve symlinks and ".." traversal before the containment check
         resolved = os.path.realpath(candidate)
-        try:
-            common = os.path.commonpath([resolved, real_root])
-        except ValueError:
-            raise RuntimeError(f"import of '{rel}' is not allowed") from None
-        if common != real_root:
+        if allowed_roots is not None and not is_within_jsonnet_import_roots(resolved, allowed_roots):
             raise RuntimeError(f"import of '{rel}' is not allowed")
         with open(resolved, "rb") as f:
-            return resolved, f.read().decode("utf-8")
+            content = f.read()
+        if imports is not None:
+            imports[resolved] = hashlib.sha256(content).hexdigest()
+        return resolved, content.decode("utf-8")
 
     return callback
 
 
-def _jsonnet_kwargs(import_base_dir: str | None) -> dict[str, Any]:
-    base = import_base_dir if import_base_dir is not None else _jsonnet_import_root.get()
-    if base is None:
+def _jsonnet_import_roots_for(import_base_dir: str | None) -> list[str] | None:
+    import_root = import_base_dir if import_base_dir is not None else _jsonnet_import_root.get()
+    return get_jsonnet_import_roots(import_root) if import_root is not None else None
+
+
+def _jsonnet_kwargs(import_roots: list[str] | None) -> dict[str, Any]:
+    if import_roots is None:
         return {}
-    return {"import_callback": _make_jsonnet_import_callback(base)}
+    return {"import_callback": _make_jsonnet_import_callback(import_roots)}
 
 
-def jsonnet_evaluate_file(file: str, import_base_dir: str | None = None) -> dict[str, Any]:
-    import rjsonnet
+# the following functions might be executed in a worker process, thus the import
+# roots, including any registered workspace dirs, have to be resolved by the caller
+# and passed explicitly.
 
-    _logger.trace("evaluating jsonnet file '%s'", file)
+
+def _evaluate_jsonnet_file(file: str, import_roots: list[str] | None) -> dict[str, Any]:
+    import rjsonnet
 
     try:
-        return json.loads(rjsonnet.evaluate_file(file, **_jsonnet_kwargs(import_base_dir)))
+        return json.loads(rjsonnet.evaluate_file(file, **_jsonnet_kwargs(import_roots)))
     except Exception as ex:
         raise RuntimeError(f"failed to evaluate jsonnet file: {ex!s}") from ex
 
 
-def jsonnet_evaluate_snippet(snippet: str, import_base_dir: str | None = None) -> dict[str, Any]:
+def _evaluate_jsonnet_file_with_imports(
+    file: str, import_roots: list[str] | None
+) -> tuple[dict[str, Any], dict[str, str]]:
     import rjsonnet
 
-    _logger.trace("evaluating jsonnet snippet '%s'", snippet)
+    imports: dict[str, str] = {}
+    try:
+        # hash the file before evaluating it, a concurrent modification will be detected later on
+        with open(file, "rb") as f:
+            imports[os.path.realpath(file)] = hashlib.sha256(f.read()).hexdigest()
+
+        data = json.loads(
+            rjsonnet.evaluate_file(file, import_callback=_make_jsonnet_import_callback(import_roots, imports))
+        )
+    except Exception as ex:
+        raise RuntimeError(f"failed to evaluate jsonnet file: {ex!s}") from ex
+
+    return data, imports
+
+
+def _evaluate_jsonnet_snippet(snippet: str, import_roots: list[str] | None) -> dict[str, Any]:
+    import rjsonnet
 
     try:
-        return json.loads(rjsonnet.evaluate_snippet("", snippet, **_jsonnet_kwargs(import_base_dir)))
+        return json.loads(rjsonnet.evaluate_snippet("", snippet, **_jsonnet_kwargs(import_roots)))
     except Exception as ex:
         raise RuntimeError(f"failed to evaluate snippet: {ex!s}") from ex
 
 
+def jsonnet_evaluate_file(file: str, import_base_dir: str | None = None) -> dict[str, Any]:
+    _logger.trace("evaluating jsonnet file '%s'", file)
+    return _evaluate_jsonnet_file(file, _jsonnet_import_roots_for(import_base_dir))
+
+
+def jsonnet_evaluate_file_with_imports(
+    file: str, import_base_dir: str | None = None
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """
+    Evaluates the given jsonnet file and additionally returns the sha256 hashes of
+    the file itself and all files imported during evaluation, keyed by their real path.
+    """
+    _logger.trace("evaluating jsonnet file '%s'", file)
+    return _evaluate_jsonnet_file_with_imports(file, _jsonnet_import_roots_for(import_base_dir))
+
+
+def jsonnet_evaluate_snippet(snippet: str, import_base_dir: str | None = None) -> dict[str, Any]:
+    _logger.trace("evaluating jsonnet snippet '%s'", snippet)
+    return _evaluate_jsonnet_snippet(snippet, _jsonnet_import_roots_for(import_base_dir))
+
+
+class JsonnetEngine:
+    """
+    Evaluates jsonnet files and snippets in a pool of workers to avoid blocking
+    the event loop while large configurations are evaluated.
+
+    rjsonnet holds the GIL during evaluation, so worker processes are used by default.
+    At most max_pending evaluations are submitted to the pool at the same time,
+    further evaluations wait until a slot becomes available.
+    """
+
+    def __init__(self, max_workers: int | None = None, max_pending: int | None = None, use_processes: bool = True):
+        self._max_workers = max_workers if max_workers is not None else min(4, os.cpu_count() or 1)
+        self._max_pending = max_pending if max_pending is not None else 2 * self._max_workers
+        self._use_processes = use_processes
+        self._executor: Executor | None = None
+        self._slots: weakref.WeakKeyDictionary[AbstractEventLoop, Semaphore] = weakref.WeakKeyDictionary()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def max_pending(self) -> int:
+        return self._max_pending
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._use_processes:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                # spawn the workers as forking a multi-threaded process is unsafe
+                self._executor = ProcessPoolExecutor(self._max_workers, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix="jsonnet")
+
+        return self._executor
+
+    def _get_slots(self) -> Semaphore:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self._max_pending)
+        return slots
+
+    async def _submit(
+        self, func: Callable[[str, list[str] | None], T], source: str, import_roots: list[str] | None
+    ) -> T:
+        import asyncio
+        from concurrent.futures import BrokenExecutor
+
+        async with self._get_slots():
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), func, source, import_roots
+                )
+            except BrokenExecutor as ex:
+                # a worker died, e.g. due to running out of memory, start with a fresh pool next time
+                self.close()
+                raise RuntimeError(f"failed to evaluate jsonnet: {ex!s}") from ex
+
+    async def evaluate_file(self, file: str, import_base_dir: str | None = None) -> dict[str, Any]:
+        _logger.trace("evaluating jsonnet file '%s' in worker pool", file)
+        return await self._submit(
+            _evaluate_jsonnet_file, os.path.abspath(file), _jsonnet_import_roots_for(import_base_dir)
+        )
+
+    async def evaluate_file_with_imports(
+        self, file: str, import_base_dir: str | None = None
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        _logger.trace("evaluating jsonnet file '%s' in worker pool", file)
+        return await self._submit(
+            _evaluate_jsonnet_file_with_imports, os.path.abspath(file), _jsonnet_import_roots_for(import_base_dir)
+        )
+
+    async def evaluate_snippet(self, snippet: str, import_base_dir: str | None = None) -> dict[str, Any]:
+        _logger.trace("evaluating jsonnet snippet '%s' in worker pool", snippet)
+        return await self._submit(_evaluate_jsonnet_snippet, snippet, _jsonnet_import_roots_for(import_base_dir))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_JSONNET_ENGINE: JsonnetEngine | None = None
+
+
+def get_jsonnet_engine() -> JsonnetEngine | None:
+    return _JSONNET_ENGINE
+
+
+def set_jsonnet_engine(engine: JsonnetEngine | None) -> None:
+    global _JSONNET_ENGINE
+    _JSONNET_ENGINE = engine
+
+
+async def jsonnet_evaluate_file_async(file: str, import_base_dir: str | None = None) -> dict[str, Any]:
+    """
+    Evaluates the given jsonnet file using the configured JsonnetEngine,
+    falls back to evaluating it on the calling thread if none is configured.
+    """
+    engine = get_jsonnet_engine()
+    if engine is None:
+        return jsonnet_evaluate_file(file, import_base_dir)
+    else:
+        return await engine.evaluate_file(file, import_base_dir)
+
+
+async def jsonnet_evaluate_file_with_imports_async(
+    file: str, import_base_dir: str | None = None
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """
+    Same as jsonnet_evaluate_file_with_imports, but uses the configured JsonnetEngine if available.
+    """
+    engine = get_jsonnet_engine()
+    if engine is None:
+        return jsonnet_evaluate_file_with_imports(file, import_base_dir)
+    else:
+        return await engine.evaluate_file_with_imports(file, import_base_dir)
+
+
+async def jsonnet_evaluate_snippet_async(snippet: str, import_base_dir: str | None = None) -> dict[str, Any]:
+    """
+    Evaluates the given jsonnet snippet using the configured JsonnetEngine,
+    falls back to evaluating it on the calling thread if none is configured.
+    """
+    engine = get_jsonnet_engine()
+    if engine is None:
+        return jsonnet_evaluate_snippet(snippet, import_base_dir)
+    else:
+        return await engine.evaluate_snippet(snippet, import_base_dir)
+
+
 def get_or_default(namespace: Namespace, key: str, default: T) -> T:
     if namespace.__contains__(key):
         return namespace.__getattribute__(key)
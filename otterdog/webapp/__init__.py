@@ -22,11 +22,21 @@ from quart.json.provider import DefaultJSONProvider
 from quart_auth import QuartAuth
 from quart_redis import RedisHandler  # type: ignore
 
-from otterdog.cache import set_github_cache
+from otterdog.cache import set_config_cache, set_github_cache
+from otterdog.models.config_cache import OrgConfigCache
+from otterdog.providers.github.rest.requester import set_session_pool
+from otterdog.template_workspace import TemplateWorkspaceCache, set_template_workspace_cache
+from otterdog.utils import set_jsonnet_engine
 
 from .db import Mongo, init_mongo_database
 from .filters import register_filters
-from .utils import close_rest_apis, get_github_ghproxy_cache, get_temporary_base_directory
+from .utils import (
+    close_rest_apis,
+    create_jsonnet_engine,
+    get_github_ghproxy_cache,
+    get_github_session_pool,
+    get_temporary_base_directory,
+)
 
 if TYPE_CHECKING:
     from .config import AppConfig
@@ -120,6 +130,14 @@ def create_app(app_config: AppConfig):
         return {"asset": asset}
 
     set_github_cache(get_github_ghproxy_cache(app.config))
+    set_config_cache(OrgConfigCache())
+    set_session_pool(get_github_session_pool(app.config))
+
+    jsonnet_engine = create_jsonnet_engine(app.config)
+    set_jsonnet_engine(jsonnet_engine)
+
+    template_workspace_cache = TemplateWorkspaceCache()
+    set_template_workspace_cache(template_workspace_cache)
 
     register_extensions(app)
     register_github_webhook(app)
@@ -142,7 +160,9 @@ def create_app(app_config: AppConfig):
 
         app.logger.info("shutting down app")
 
+        await template_workspace_cache.close()
         await rmtree(get_temporary_base_directory(app))
         await close_rest_apis()
+        jsonnet_engine.close()
 
     return app
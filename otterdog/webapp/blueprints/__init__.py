@@ -8,8 +8,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import StrEnum
 from functools import cached_property
 from logging import Logger, getLogger
@@ -18,14 +21,22 @@ from typing import TYPE_CHECKING, Any
 from pydantic import BaseModel
 
 from otterdog.models.github_organization import GitHubOrganization
+from otterdog.utils import gather_or_cancel
 
 if TYPE_CHECKING:
     from otterdog.models.repository import Repository
-    from otterdog.webapp.db.models import BlueprintModel, ConfigurationModel
+    from otterdog.webapp.db.models import BlueprintModel, BlueprintStatusModel, ConfigurationModel
     from otterdog.webapp.webhook.github_models import Commit
 
 BLUEPRINT_PATH = "otterdog/blueprints"
 
+# the maximum number of repos of an organization evaluated concurrently by a blueprint
+_MAX_CONCURRENT_REPOS = 8
+
+# parsed organization configs keyed by github_id and sha of the config
+_MAX_PARSED_ORGANIZATIONS = 32
+_parsed_organizations: OrderedDict[tuple[str, str], tuple[dict[str, Any], GitHubOrganization]] = OrderedDict()
+
 
 class BlueprintType(StrEnum):
     REQUIRED_FILE = "required_file"
@@ -34,6 +45,57 @@ class BlueprintType(StrEnum):
     SCORECARD_INTEGRATION = "scorecard_integration"
 
 
+async def get_organization_of_config(config_model: ConfigurationModel) -> GitHubOrganization:
+    """
+    Returns the organization described by the given configuration, parsing each configuration only once.
+
+    The returned organization is shared and must not be modified.
+    """
+    key = (config_model.github_id, config_model.sha)
+
+    cached = _parsed_organizations.get(key)
+    # the config might still differ for the same sha, e.g. if the template has changed
+    if cached is not None and cached[0] == config_model.config:
+        _parsed_organizations.move_to_end(key)
+        return cached[1]
+
+    github_organization = await asyncio.to_thread(GitHubOrganization.from_model_data, config_model.config)
+
+    _parsed_organizations[key] = (config_model.config, github_organization)
+    _parsed_organizations.move_to_end(key)
+    while len(_parsed_organizations) > _MAX_PARSED_ORGANIZATIONS:
+        _parsed_organizations.popitem(last=False)
+
+    return github_organization
+
+
+@dataclasses.dataclass(frozen=True)
+class BlueprintEvaluationContext:
+    """
+    The data of an organization required to evaluate its blueprints, retrieved once and shared
+    by all blueprints evaluated for the organization.
+    """
+
+    config_model: ConfigurationModel
+    github_organization: GitHubOrganization
+    blueprint_statuses: dict[tuple[str, str], BlueprintStatusModel]
+
+    @classmethod
+    async def load(cls, github_id: str) -> BlueprintEvaluationContext | None:
+        from otterdog.webapp.db.service import get_blueprints_status, get_configuration_by_github_id
+
+        config_model = await get_configuration_by_github_id(github_id)
+        if config_model is None:
+            return None
+
+        github_organization = await get_organization_of_config(config_model)
+        blueprint_statuses = {(x.id.repo_name, x.id.blueprint_id): x for x in await get_blueprints_status(github_id)}
+        return cls(config_model, github_organization, blueprint_statuses)
+
+    def get_blueprint_status(self, repo_name: str, blueprint_id: str) -> BlueprintStatusModel | None:
+        return self.blueprint_statuses.get((repo_name, blueprint_id))
+
+
 class Blueprint(ABC, BaseModel):
     id: str
     path: str
@@ -52,28 +114,32 @@ class Blueprint(ABC, BaseModel):
     def config(self) -> dict[str, Any]:
         return self.model_dump(exclude={"id", "path", "name", "description"})
 
-    async def _get_repositories(self, config_model: ConfigurationModel) -> list[Repository]:
-        github_organization = GitHubOrganization.from_model_data(config_model.config)
-        return github_organization.repositories
+    async def _get_repositories(self, context: BlueprintEvaluationContext) -> list[Repository]:
+        return context.github_organization.repositories
 
     @abstractmethod
     def _matches(self, repo: Repository) -> bool: ...
 
-    async def evaluate(self, installation_id: int, github_id: str, recheck: bool = False) -> None:
+    async def evaluate(
+        self,
+        installation_id: int,
+        github_id: str,
+        recheck: bool = False,
+        context: BlueprintEvaluationContext | None = None,
+    ) -> None:
         from otterdog.webapp.db.models import BlueprintStatus
-        from otterdog.webapp.db.service import (
-            cleanup_blueprint_status_of_repo,
-            find_blueprint_status,
-            get_configuration_by_github_id,
-        )
+        from otterdog.webapp.db.service import cleanup_blueprint_status_of_repos
 
-        config_model = await get_configuration_by_github_id(github_id)
-        if config_model is None:
-            return
+        if context is None:
+            context = await BlueprintEvaluationContext.load(github_id)
+            if context is None:
+                return
 
-        for repo in await self._get_repositories(config_model):
-            if repo.archived is False and self._matches(repo):
-                blueprint_status_model = await find_blueprint_status(github_id, repo.name, self.id)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REPOS)
+
+        async def evaluate_repo(repo: Repository) -> None:
+            async with semaphore:
+                blueprint_status_model = context.get_blueprint_status(repo.name, self.id)
 
                 if blueprint_status_model is not None and blueprint_status_model.status == BlueprintStatus.SUCCESS:
                     self.logger.debug(
@@ -88,14 +154,26 @@ class Blueprint(ABC, BaseModel):
                         BlueprintStatus.RECHECK,
                         BlueprintStatus.FAILURE,
                     ):
-                        continue
+                        return
 
                 self.logger.debug(f"checking blueprint with id '{self.id}' in repo '{github_id}/{repo.name}'")
-                await self.evaluate_repo(installation_id, github_id, repo.name, config_model)
+                await self.evaluate_repo(installation_id, github_id, repo.name, context.config_model)
+
+        matching_repos = []
+        non_matching_repos = []
+        for repo in await self._get_repositories(context):
+            if repo.archived is False and self._matches(repo):
+                matching_repos.append(repo)
             else:
-                # if a recheck is needed, cleanup status of non-matching repos if they exist
-                if recheck:
-                    await cleanup_blueprint_status_of_repo(github_id, repo.name, self.id)
+                non_matching_repos.append(repo.name)
+
+        await gather_or_cancel(*[evaluate_repo(repo) for repo in matching_repos])
+
+        # if a recheck is needed, cleanup status of non-matching repos if they exist
+        if recheck:
+            stale_repos = [x for x in non_matching_repos if context.get_blueprint_status(x, self.id) is not None]
+            if len(stale_repos) > 0:
+                await cleanup_blueprint_status_of_repos(github_id, stale_repos, self.id)
 
     @abstractmethod
     def should_reevaluate(self, commits: list[Commit]) -> bool: ...
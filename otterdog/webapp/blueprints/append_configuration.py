@@ -13,12 +13,12 @@ from typing import TYPE_CHECKING
 from pydantic import Field
 from quart import current_app
 
-from otterdog.models.github_organization import GitHubOrganization
 from otterdog.webapp.blueprints import Blueprint, BlueprintType
 from otterdog.webapp.db.service import get_configuration_by_github_id, get_installation_by_github_id
 
 if TYPE_CHECKING:
     from otterdog.models.repository import Repository
+    from otterdog.webapp.blueprints import BlueprintEvaluationContext
     from otterdog.webapp.db.models import ConfigurationModel
     from otterdog.webapp.webhook.github_models import Commit
 
@@ -32,11 +32,10 @@ class AppendConfigurationBlueprint(Blueprint):
     def type(self) -> BlueprintType:
         return BlueprintType.APPEND_CONFIGURATION
 
-    async def _get_repositories(self, config_model: ConfigurationModel) -> list[Repository]:
-        installation_model = await get_installation_by_github_id(config_model.github_id)
+    async def _get_repositories(self, context: BlueprintEvaluationContext) -> list[Repository]:
+        installation_model = await get_installation_by_github_id(context.config_model.github_id)
         if installation_model is not None and installation_model.config_repo is not None:
-            github_organization = GitHubOrganization.from_model_data(config_model.config)
-            repo = github_organization.get_repository(installation_model.config_repo)
+            repo = context.github_organization.get_repository(installation_model.config_repo)
             if repo is not None:
                 return [repo]
 
@@ -68,6 +68,14 @@ class AppConfig:
     REDIS_URI = config("REDIS_URI", default="redis://redis:6379")
     GHPROXY_URI = config("GHPROXY_URI", default="http://ghproxy:8888")
 
+    # Connections to GitHub / ghproxy shared by all tasks
+    GITHUB_POOL_LIMIT_PER_HOST = config("GITHUB_POOL_LIMIT_PER_HOST", default=30, cast=int)
+    GITHUB_POOL_KEEPALIVE_TIMEOUT = config("GITHUB_POOL_KEEPALIVE_TIMEOUT", default=30.0, cast=float)
+
+    # Worker processes evaluating jsonnet configurations off the event loop
+    JSONNET_WORKERS = config("JSONNET_WORKERS", default=2, cast=int)
+    JSONNET_MAX_PENDING = config("JSONNET_MAX_PENDING", default=8, cast=int)
+
     OTTERDOG_CONFIG_OWNER = config("OTTERDOG_CONFIG_OWNER", default=None)
     OTTERDOG_CONFIG_REPO = config("OTTERDOG_CONFIG_REPO", default=None)
     OTTERDOG_CONFIG_PATH = config("OTTERDOG_CONFIG_PATH", default=None)
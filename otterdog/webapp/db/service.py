@@ -901,6 +901,10 @@ async def save_blueprint(blueprint_model: BlueprintModel) -> None:
     await mongo.odm.save(blueprint_model)
 
 
+async def save_blueprints(blueprint_models: list[BlueprintModel]) -> None:
+    await mongo.odm.save_all(blueprint_models)
+
+
 async def cleanup_blueprints(valid_orgs: list[str]) -> None:
     await mongo.odm.remove(BlueprintModel, query.not_in(BlueprintModel.id.org_id, valid_orgs))
 
@@ -1111,11 +1115,11 @@ async def cleanup_blueprints_status_of_owner(owner: str, valid_ids: list[str]) -
     )
 
 
-async def cleanup_blueprint_status_of_repo(owner: str, repo_name: str, blueprint_id: str) -> None:
+async def cleanup_blueprint_status_of_repos(owner: str, repo_names: list[str], blueprint_id: str) -> None:
     await mongo.odm.remove(
         BlueprintStatusModel,
         BlueprintStatusModel.id.org_id == owner,
-        BlueprintStatusModel.id.repo_name == repo_name,
+        query.in_(BlueprintStatusModel.id.repo_name, repo_names),
         BlueprintStatusModel.id.blueprint_id == blueprint_id,
     )
 
@@ -297,7 +297,7 @@ def _get_branch_protection_data(org: GitHubOrganization) -> list[int]:
 
 @blueprint.route("/projects/<project_name>/defaults")
 async def defaults(project_name: str):
-    import contextlib
+    import asyncio
 
     import aiofiles
 
@@ -315,7 +315,7 @@ async def defaults(project_name: str):
         await jsonnet_config.init_template()
 
         default_elements.append(
-            _get_snippet(
+            await _get_snippet(
                 jsonnet_config,
                 "org",
                 "GitHub Organization",
@@ -350,10 +350,15 @@ async def defaults(project_name: str):
             ("ruleset-merge-queue", "Merge Queue Settings", f"{jsonnet_config.create_merge_queue}()"),
         ]
 
-        for element_id, name, function in elements:
-            # if evaluation fails, the default config might not define this resource
-            with contextlib.suppress(RuntimeError):
-                default_elements.append(_get_snippet(jsonnet_config, element_id, name, function))
+        async def _get_optional_snippet(element_id: str, name: str, function: str) -> dict[str, Any] | None:
+            try:
+                return await _get_snippet(jsonnet_config, element_id, name, function)
+            except RuntimeError:
+                # if evaluation fails, the default config might not define this resource
+                return None
+
+        snippets = await asyncio.gather(*[_get_optional_snippet(*element) for element in elements])
+        default_elements.extend(snippet for snippet in snippets if snippet is not None)
 
     return await render_home_template(
         "defaults.html",
@@ -362,14 +367,14 @@ async def defaults(project_name: str):
     )
 
 
-def _get_snippet(
+async def _get_snippet(
     jsonnet_config: JsonnetConfig,
     element_id: str,
     name: str,
     function: str,
     key: str | None = None,
 ) -> dict[str, Any]:
-    data = _evaluate_default(jsonnet_config, function)
+    data = await _evaluate_default(jsonnet_config, function)
     if key is not None:
         data = {key: data[key]}
 
@@ -384,12 +389,12 @@ def _format_model(data) -> str:
     return PrettyFormatter().format(data)
 
 
-def _evaluate_default(jsonnet_config: JsonnetConfig, function: str) -> dict[str, Any]:
-    from otterdog.utils import jsonnet_evaluate_snippet
+async def _evaluate_default(jsonnet_config: JsonnetConfig, function: str) -> dict[str, Any]:
+    from otterdog.utils import jsonnet_evaluate_snippet_async
 
     try:
         snippet = f"(import '{jsonnet_config.template_file}').{function}"
-        return jsonnet_evaluate_snippet(snippet)
+        return await jsonnet_evaluate_snippet_async(snippet)
     except RuntimeError as ex:
         raise RuntimeError(f"failed to evaluate snippet: {ex}") from ex
 
@@ -6,13 +6,15 @@
 #  SPDX-License-Identifier: EPL-2.0
 #  *******************************************************************************
 
+from typing import TYPE_CHECKING
+
 from otterdog.webapp.blueprints import create_blueprint_from_model
 from otterdog.webapp.db.service import (
     get_active_installations,
     get_blueprints_by_last_checked_time,
     get_installation_by_github_id,
     logger,
-    save_blueprint,
+    save_blueprints,
     update_data_for_installation,
     update_installations_from_config,
 )
@@ -26,12 +28,40 @@ from otterdog.webapp.utils import (
 
 from . import blueprint
 
+if TYPE_CHECKING:
+    from otterdog.webapp.db.models import BlueprintModel
+
 
 @blueprint.route("/health")
 async def health():
     return {}, 200
 
 
+@blueprint.route("/http-pool")
+async def http_pool():
+    import dataclasses
+
+    from otterdog.providers.github.rest.requester import get_session_pool
+
+    session_pool = get_session_pool()
+    if session_pool is None:
+        return {}, 200
+
+    return {
+        host: dataclasses.asdict(statistics) | {"utilization": statistics.utilization}
+        for host, statistics in session_pool.statistics.items()
+    }, 200
+
+
+@blueprint.route("/installation-tokens")
+async def installation_tokens():
+    import dataclasses
+
+    from otterdog.webapp.utils import get_installation_token_cache
+
+    return dataclasses.asdict(get_installation_token_cache().statistics), 200
+
+
 @blueprint.route("/init")
 async def init():
     config = await refresh_otterdog_config()
@@ -50,8 +80,12 @@ async def init():
 async def check(limit: int):
     from datetime import timedelta
 
+    from otterdog.webapp.blueprints import BlueprintEvaluationContext
+
     logger.info("checking blueprints...")
 
+    # group the blueprints by organization to retrieve the data of each organization only once
+    blueprint_models_by_org: dict[str, list[BlueprintModel]] = {}
     for blueprint_model in await get_blueprints_by_last_checked_time(limit=limit):
         org_id = blueprint_model.id.org_id
 
@@ -66,23 +100,43 @@ async def check(limit: int):
             )
             continue
 
+        blueprint_models_by_org.setdefault(org_id, []).append(blueprint_model)
+
+    for org_id, blueprint_models in blueprint_models_by_org.items():
         installation = await get_installation_by_github_id(org_id)
         if installation is None:
             logger.error("no installation model found for org '%s'", org_id)
             continue
 
-        logger.debug("checking blueprint with id '%s' for org '%s'...", blueprint_model.id.blueprint_id, org_id)
+        context = await BlueprintEvaluationContext.load(org_id)
+
+        # only the blueprints that have been evaluated successfully are marked as checked
+        checked_blueprint_models = []
+        for blueprint_model in blueprint_models:
+            logger.debug("checking blueprint with id '%s' for org '%s'...", blueprint_model.id.blueprint_id, org_id)
+
+            if context is not None:
+                blueprint_instance = create_blueprint_from_model(blueprint_model)
+                try:
+                    await blueprint_instance.evaluate(
+                        installation.installation_id, org_id, blueprint_model.recheck_needed, context
+                    )
+                except Exception:
+                    logger.exception(
+                        "failed to check blueprint with id '%s' for org '%s'", blueprint_model.id.blueprint_id, org_id
+                    )
+                    continue
 
-        blueprint_instance = create_blueprint_from_model(blueprint_model)
-        await blueprint_instance.evaluate(installation.installation_id, org_id, blueprint_model.recheck_needed)
+            blueprint_model.last_checked = current_utc_time()
 
-        blueprint_model.last_checked = current_utc_time()
+            # if we were forced to do a recheck, reset it afterward
+            if blueprint_model.recheck_needed is True:
+                blueprint_model.recheck_needed = False
 
-        # if we were forced to do a recheck, reset it afterward
-        if blueprint_model.recheck_needed is True:
-            blueprint_model.recheck_needed = False
+            checked_blueprint_models.append(blueprint_model)
 
-        await save_blueprint(blueprint_model)
+        if len(checked_blueprint_models) > 0:
+            await save_blueprints(checked_blueprint_models)
 
     return {}, 200
 
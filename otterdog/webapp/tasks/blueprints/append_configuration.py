@@ -13,7 +13,7 @@ import aiofiles
 from slugify import slugify
 
 from otterdog.models.github_organization import GitHubOrganization
-from otterdog.utils import jsonnet_evaluate_file, query_json, render_chevron
+from otterdog.utils import jsonnet_evaluate_file_async, query_json, render_chevron
 from otterdog.webapp.blueprints.append_configuration import AppendConfigurationBlueprint
 from otterdog.webapp.db.models import ConfigurationModel
 from otterdog.webapp.tasks.blueprints import BlueprintTask, CheckResult
@@ -115,7 +115,9 @@ class AppendConfigurationTask(BlueprintTask):
             try:
                 # confine imports to the org config directory, matching the layout
                 # expected by org configs (vendored templates only).
-                jsonnet_evaluate_file(patched_config_file, import_base_dir=org_config.jsonnet_config.org_dir)
+                await jsonnet_evaluate_file_async(
+                    patched_config_file, import_base_dir=org_config.jsonnet_config.org_dir
+                )
             except RuntimeError as ex:
                 self.logger.error("failed to evaluate patched configuration", exc_info=ex)
                 result.check_failed = True
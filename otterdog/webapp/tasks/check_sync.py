@@ -9,12 +9,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 from io import StringIO
 from typing import TYPE_CHECKING
 
 from quart import current_app, render_template
 
+from otterdog.models.github_organization import GitHubOrganization, OrganizationScope
 from otterdog.operations.plan import PlanOperation
 from otterdog.utils import IndentingPrinter, LogLevel, restrict_jsonnet_imports
 from otterdog.webapp.db.models import TaskModel
@@ -25,7 +26,6 @@ from otterdog.webapp.db.service import (
 from otterdog.webapp.tasks import InstallationBasedTask, Task
 from otterdog.webapp.utils import (
     backoff_if_needed,
-    current_utc_time,
     escape_for_github,
     fetch_config_from_github,
     get_full_admin_team_slugs,
@@ -34,6 +34,7 @@ from otterdog.webapp.utils import (
 from otterdog.webapp.webhook.github_models import PullRequest
 
 if TYPE_CHECKING:
+    from otterdog.config import OrganizationConfig
     from otterdog.models import LivePatch
     from otterdog.operations.diff_operation import DiffStatus
     from otterdog.operations.validate import ValidationStatus
@@ -88,40 +89,8 @@ class CheckConfigurationInSyncTask(InstallationBasedTask, Task[bool]):
         else:
             self._pull_request = self.pull_request_or_number
 
-        # do not perform checks every time a pull request is synchronized
-        # if the last check was done within an hour
-        if self.is_triggered_from_comment is False:
-            commits = await rest_api.pull_request.get_commits(
-                self.org_id,
-                self.repo_name,
-                str(self.pull_request_number),
-            )
-
-            if len(commits) > 1:
-                previous_commit = commits[-2]
-                commit_time = datetime.strptime(
-                    previous_commit["commit"]["committer"]["date"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=UTC)
-                current_time = current_utc_time()
-                timedelta_since_last_commit = current_time - commit_time
-                if timedelta_since_last_commit < timedelta(hours=1):
-                    commit_statuses = await rest_api.commit.get_commit_statuses(
-                        self.org_id,
-                        self.repo_name,
-                        previous_commit["sha"],
-                    )
-
-                    commit_status = list(
-                        filter(
-                            lambda x: x["context"] == _get_webhook_sync_context() and x["state"] != "pending",
-                            commit_statuses,
-                        )
-                    )
-
-                    # if a previous commit status was found, propagate it directly
-                    if len(commit_status) > 0:
-                        await self._update_final_status(commit_status[0]["state"] == "success")
-                        return False
+        # the status of a previous commit is not propagated to this commit as the check
+        # only covers the parts of the configuration changed by it, see _get_scope_of_changes
 
         latest_sync_task = await get_latest_sync_task_for_organization(self.org_id, self.repo_name)
         # to avoid secondary rate limit failures, backoff at least 1 min before running another sync task
@@ -154,11 +123,16 @@ class CheckConfigurationInSyncTask(InstallationBasedTask, Task[bool]):
                 # PRs might not be up-to-date
             )
 
+            # only check the parts of the configuration that are changed by the pull request
+            scope = await self._get_scope_of_changes(org_config, base_file)
+            self.logger.debug("checking sync with %s", scope if scope is not None else "full scope")
+
             output = StringIO()
             printer = IndentingPrinter(output, log_level=LogLevel.ERROR, output_for_github=True)
             operation = PlanOperation(True, "*", False, False, False, "")
             # set concurrency to 20 to avoid hitting secondary rate limits with installation tokens
             operation.concurrency = 20
+            operation.scope = scope
 
             config_in_sync = True
 
@@ -211,6 +185,35 @@ class CheckConfigurationInSyncTask(InstallationBasedTask, Task[bool]):
 
             return config_in_sync
 
+    async def _get_scope_of_changes(self, org_config: OrganizationConfig, base_file: str) -> OrganizationScope | None:
+        head_repo = self._pull_request.head.repo
+        if head_repo is None:
+            return None
+
+        head_file = base_file + "-HEAD"
+
+        try:
+            rest_api = await self.rest_api
+            await fetch_config_from_github(
+                rest_api,
+                self.org_id,
+                head_repo.owner.login,
+                head_repo.name,
+                head_file,
+                self._pull_request.head.sha,
+            )
+
+            # confine jsonnet imports to the org config directory so that
+            # configurations cannot reach files outside the expected vendor layout.
+            with restrict_jsonnet_imports(org_config.jsonnet_config.org_dir):
+                base_org = await GitHubOrganization.load_from_file_async(self.org_id, base_file)
+                head_org = await GitHubOrganization.load_from_file_async(self.org_id, head_file)
+        except Exception as ex:
+            self.logger.warning("failed to determine changes of pull request, checking full configuration: %s", ex)
+            return None
+
+        return OrganizationScope.of_changes(base_org, head_org)
+
     async def _create_pending_status(self):
         rest_api = await self.rest_api
         await rest_api.commit.create_commit_status(
@@ -9,7 +9,7 @@
 from dataclasses import dataclass
 
 from otterdog.models.github_organization import GitHubOrganization
-from otterdog.utils import jsonnet_evaluate_file
+from otterdog.utils import jsonnet_evaluate_file_async
 from otterdog.webapp.db.models import ConfigurationModel, StatisticsModel, TaskModel
 from otterdog.webapp.db.service import save_config, save_statistics
 from otterdog.webapp.tasks import InstallationBasedTask, Task
@@ -50,7 +50,9 @@ class FetchConfigTask(InstallationBasedTask, Task[None]):
 
             # save configuration — confine imports to the org config directory,
             # matching the layout expected by org configs (vendored templates only).
-            config_data = jsonnet_evaluate_file(config_file, import_base_dir=org_config.jsonnet_config.org_dir)
+            config_data = await jsonnet_evaluate_file_async(
+                config_file, import_base_dir=org_config.jsonnet_config.org_dir
+            )
             config = ConfigurationModel(  # type: ignore
                 github_id=self.org_id,
                 project_name=org_config.name,
@@ -0,0 +1,172 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    TokenCreator = Callable[[int], Awaitable[tuple[str, datetime]]]
+
+logger = getLogger(__name__)
+
+
+@dataclasses.dataclass
+class TokenCacheStatistics:
+    memory_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    tokens_created: int = 0
+    background_refreshes: int = 0
+    failed_refreshes: int = 0
+
+
+class InstallationTokenCache:
+    """
+    Caches installation tokens of the GitHub app in two tiers, in memory and in Redis.
+
+    Tokens are kept in memory for at most max_entries installations, evicting the least
+    recently used ones, and are shared with other workers via Redis. A token is only used
+    while it is valid for at least min_validity, each installation is looked up and created
+    by a single caller at a time while other installations are not blocked. Once a token
+    used from memory is valid for less than refresh_before, a new one is retrieved in the
+    background so that callers do not have to wait for it.
+    """
+
+    def __init__(
+        self,
+        get_redis: Callable[[], Any],
+        create_token: TokenCreator,
+        max_entries: int = 1024,
+        min_validity: timedelta = timedelta(minutes=1),
+        refresh_before: timedelta = timedelta(minutes=5),
+    ):
+        self._get_redis = get_redis
+        self._create_token = create_token
+        self._max_entries = max_entries
+        self._min_validity = min_validity
+        self._refresh_before = refresh_before
+        self._tokens: OrderedDict[int, tuple[str, datetime]] = OrderedDict()
+        self._pending: dict[int, asyncio.Future[tuple[str, datetime]]] = {}
+        self._refresh_tasks: dict[int, asyncio.Task] = {}
+        self._statistics = TokenCacheStatistics()
+
+    @property
+    def statistics(self) -> TokenCacheStatistics:
+        return self._statistics
+
+    async def get(self, installation_id: int) -> tuple[str, datetime]:
+        """
+        Returns a token for the given installation together with its expiration time.
+        """
+        cached = self._tokens.get(installation_id)
+        if cached is not None:
+            _, expires_at = cached
+            now = datetime.now(UTC)
+            if expires_at > now + self._min_validity:
+                self._tokens.move_to_end(installation_id)
+                self._statistics.memory_hits += 1
+
+                if expires_at <= now + self._refresh_before:
+                    self._schedule_refresh(installation_id)
+
+                return cached
+
+        return await self._load(installation_id, self._min_validity)
+
+    async def _load(self, installation_id: int, min_validity: timedelta) -> tuple[str, datetime]:
+        pending = self._pending.get(installation_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[tuple[str, datetime]] = asyncio.get_running_loop().create_future()
+        self._pending[installation_id] = future
+        try:
+            result = await self._retrieve(installation_id, min_validity)
+            self._store(installation_id, result)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as ex:
+            future.set_exception(ex)
+            # mark the exception as retrieved in case nobody else is waiting for it
+            future.exception()
+            raise
+        finally:
+            del self._pending[installation_id]
+
+    async def _retrieve(self, installation_id: int, min_validity: timedelta) -> tuple[str, datetime]:
+        redis = self._get_redis()
+        installation_key = f"token:{installation_id}"
+        raw_data = await redis.hgetall(installation_key)
+        current_data = {k.decode("utf-8"): v.decode("utf-8") for k, v in raw_data.items()}
+
+        cached_token = current_data.get("token")
+        expires_at_str = current_data.get("expires_at")
+
+        if cached_token is not None and expires_at_str is not None:
+            expires_at = datetime.fromisoformat(expires_at_str)
+            if expires_at > datetime.now(UTC) + min_validity:
+                logger.debug(f"re-using installation token for installation '{installation_id}' from redis")
+                self._statistics.redis_hits += 1
+                return cached_token, expires_at
+
+        self._statistics.misses += 1
+
+        logger.info(f"creating new installation token for installation '{installation_id}'")
+        token, expires_at = await self._create_token(installation_id)
+        self._statistics.tokens_created += 1
+
+        await redis.hset(
+            installation_key,
+            mapping={"token": token, "expires_at": expires_at.isoformat()},
+        )
+        return token, expires_at
+
+    def _store(self, installation_id: int, token: tuple[str, datetime]) -> None:
+        self._tokens[installation_id] = token
+        self._tokens.move_to_end(installation_id)
+
+        while len(self._tokens) > self._max_entries:
+            self._tokens.popitem(last=False)
+
+    def _schedule_refresh(self, installation_id: int) -> None:
+        if installation_id in self._refresh_tasks or installation_id in self._pending:
+            return
+
+        self._refresh_tasks[installation_id] = asyncio.create_task(self._refresh(installation_id))
+
+    async def _refresh(self, installation_id: int) -> None:
+        try:
+            # another worker might have refreshed the token already
+            await self._load(installation_id, self._refresh_before)
+            self._statistics.background_refreshes += 1
+        except Exception as ex:
+            self._statistics.failed_refreshes += 1
+            logger.warning(f"failed to refresh installation token for installation '{installation_id}': {ex!s}")
+        finally:
+            self._refresh_tasks.pop(installation_id, None)
+
+    async def close(self) -> None:
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        self._refresh_tasks.clear()
+        self._tokens.clear()
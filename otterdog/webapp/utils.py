@@ -25,8 +25,11 @@ from otterdog.providers.github.cache.ghproxy import ghproxy_cache
 from otterdog.providers.github.cache.redis import redis_cache
 from otterdog.providers.github.graphql import GraphQLClient
 from otterdog.providers.github.rest import RestApi
+from otterdog.providers.github.rest.requester import SessionPool, get_session_pool
+from otterdog.utils import JsonnetEngine
 from otterdog.webapp.blueprints import Blueprint, read_blueprint
 from otterdog.webapp.policies import Policy, read_policy
+from otterdog.webapp.token_cache import InstallationTokenCache
 
 logger = getLogger(__name__)
 
@@ -34,8 +37,6 @@ _OTTERDOG_CONFIG: OtterdogConfig | None = None
 _OTTERDOG_CONFIG_RETRIEVED_AT: datetime | None = None
 _OTTERDOG_CONFIG_LOCK = asyncio.Lock()
 
-_CREATE_INSTALLATION_TOKEN_LOCK = asyncio.Lock()
-
 _GLOBAL_POLICIES: list[Policy] | None = None
 _GLOBAL_BLUEPRINTS: list[Blueprint] | None = None
 
@@ -56,12 +57,27 @@ def get_github_ghproxy_cache(app_config):
     return ghproxy_cache(app_config["GHPROXY_URI"])
 
 
+def get_github_session_pool(app_config) -> SessionPool:
+    return SessionPool(app_config["GITHUB_POOL_LIMIT_PER_HOST"], app_config["GITHUB_POOL_KEEPALIVE_TIMEOUT"])
+
+
+def create_jsonnet_engine(app_config) -> JsonnetEngine:
+    return JsonnetEngine(app_config["JSONNET_WORKERS"], app_config["JSONNET_MAX_PENDING"])
+
+
 async def close_rest_apis():
+    await _INSTALLATION_TOKEN_CACHE.close()
+
     app_api_cache = get_rest_api_for_app.cache_info()
     if app_api_cache.hits > 0:
         logger.debug("closing rest api for app")
         await get_rest_api_for_app().close()
 
+    session_pool = get_session_pool()
+    if session_pool is not None:
+        logger.debug("closing http session pool")
+        await session_pool.close()
+
 
 @cache
 def get_rest_api_for_app() -> RestApi:
@@ -71,34 +87,22 @@ def get_rest_api_for_app() -> RestApi:
     return RestApi(app_auth(github_app_id, github_app_private_key), get_github_cache())
 
 
-async def get_token_for_installation(installation_id: int) -> tuple[str, datetime]:
-    redis = get_redis()
+async def _create_installation_token(installation_id: int) -> tuple[str, datetime]:
+    return await get_rest_api_for_app().app.create_installation_access_token(str(installation_id))
+
+
+_INSTALLATION_TOKEN_CACHE = InstallationTokenCache(get_redis, _create_installation_token)
+
 
-    async with _CREATE_INSTALLATION_TOKEN_LOCK:
-        installation_key = f"token:{installation_id}"
-        current_data = decode_bytes_dict(await redis.hgetall(installation_key))
-
-        cached_token = current_data.get("token", None)
-        expires_at_str = current_data.get("expires_at", None)
-
-        if cached_token is not None and expires_at_str is not None:
-            expires_at = datetime.fromisoformat(expires_at_str)
-            # add a buffer of 1 min for expiration to be safe
-            # the assumption is that any processing using the returned token
-            # will not take longer than 1 min (in fact will be much shorter)
-            if expires_at > (current_utc_time() + timedelta(minutes=1)):
-                logger.info(
-                    f"re-using installation token for installation '{installation_id}' expiring at '{expires_at}'"
-                )
-                return cached_token, expires_at
-
-        logger.info(f"creating new installation token for installation '{installation_id}'")
-        token, expires_at = await get_rest_api_for_app().app.create_installation_access_token(str(installation_id))
-        await redis.hset(
-            installation_key,
-            mapping={"token": token, "expires_at": expires_at.isoformat()},
-        )
-        return token, expires_at
+def get_installation_token_cache() -> InstallationTokenCache:
+    return _INSTALLATION_TOKEN_CACHE
+
+
+async def get_token_for_installation(installation_id: int) -> tuple[str, datetime]:
+    # tokens are only handed out while they are valid for at least 1 more min
+    # the assumption is that any processing using the returned token
+    # will not take longer than 1 min (in fact will be much shorter)
+    return await _INSTALLATION_TOKEN_CACHE.get(installation_id)
 
 
 def decode_bytes_dict(data: dict[bytes, bytes]) -> dict[str, str]:
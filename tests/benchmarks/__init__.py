@@ -0,0 +1,13 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+"""
+Micro-benchmarks that are not part of the test suite, run them individually, e.g.
+
+    poetry run python -m tests.benchmarks.bench_jsonnet_defaults
+"""
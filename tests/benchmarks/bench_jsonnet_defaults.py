@@ -0,0 +1,100 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+"""
+Compares the evaluation of the default configs of a template one snippet at a time
+with the single-pass evaluation of JsonnetConfig.
+
+For every organization, all default configs are accessed and the default organization
+config is requested 3 times, like done by validate, to_jsonnet and loading the teams.
+"""
+
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from rich.console import Console
+
+from otterdog import jsonnet
+from otterdog.jsonnet import JsonnetConfig
+from otterdog.utils import jsonnet_evaluate_snippet
+
+_TEMPLATE_DIR = Path(__file__).parent.parent.parent / "examples" / "template"
+_TEMPLATE_URL = "https://github.com/eclipse-csi/otterdog#otterdog-defaults.libsonnet@main"
+
+
+class CountingEvaluator:
+    def __init__(self):
+        self.evaluations = 0
+
+    def __call__(self, snippet: str, import_base_dir: str | None = None):
+        self.evaluations += 1
+        return jsonnet_evaluate_snippet(snippet, import_base_dir)
+
+
+async def create_configs(base_dir: Path, orgs: int) -> list[JsonnetConfig]:
+    configs = []
+    for i in range(orgs):
+        config = JsonnetConfig(f"org-{i}", str(base_dir), _TEMPLATE_URL, True)
+        shutil.copytree(_TEMPLATE_DIR, config.template_dir)
+        await config.init_template()
+        configs.append(config)
+
+    return configs
+
+
+def run_individually(configs: list[JsonnetConfig], evaluate: CountingEvaluator) -> None:
+    for config in configs:
+        for function, args in JsonnetConfig._default_configs.values():
+            evaluate(f"(import '{config.template_file}').{function}({args})")
+
+        for _ in range(3):
+            evaluate(f"(import '{config.template_file}').{config.create_org}('project', '{config.org_id}')")
+
+
+def run_single_pass(configs: list[JsonnetConfig]) -> None:
+    for config in configs:
+        for name in JsonnetConfig._default_configs:
+            getattr(config, name)
+
+        for _ in range(3):
+            config.default_org_config_for_org_id("project", config.org_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orgs", type=int, default=10, help="number of organizations")
+    options = parser.parse_args()
+
+    console = Console()
+    evaluate = CountingEvaluator()
+    jsonnet.jsonnet_evaluate_snippet = evaluate  # type: ignore
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        configs = asyncio.run(create_configs(Path(tmp_dir), options.orgs))
+
+        start = time.perf_counter()
+        run_individually(configs, evaluate)
+        individual_time = time.perf_counter() - start
+        individual_evaluations = evaluate.evaluations
+
+        evaluate.evaluations = 0
+        start = time.perf_counter()
+        run_single_pass(configs)
+        single_pass_time = time.perf_counter() - start
+
+    console.print(f"organizations: {options.orgs}")
+    console.print(f"individual:    {individual_evaluations:4d} evaluations, {individual_time:.3f}s")
+    console.print(f"single pass:   {evaluate.evaluations:4d} evaluations, {single_pass_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+"""
+Compares building a GitHubOrganization from model data with jsonbender mappings that are
+rebuilt for every object with the precompiled per-class converters.
+
+The synthetic organization consists of the given number of repositories, each having
+a branch protection rule, a ruleset, an environment, a secret and a variable.
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any
+
+from jsonbender import (
+    OptionalS,  # type: ignore
+    bend,  # type: ignore
+)
+from rich.console import Console
+
+from otterdog import models
+from otterdog.models import github_organization
+from otterdog.models.github_organization import GitHubOrganization
+from otterdog.utils import UNSET, jsonnet_evaluate_snippet
+
+_TEMPLATE_FILE = Path(__file__).parent.parent.parent / "examples" / "template" / "otterdog-defaults.libsonnet"
+
+_ORG_SNIPPET = """
+local orgs = import '{template_file}';
+
+orgs.newOrg('synthetic', 'synthetic') {{
+  repositories+: [
+    orgs.newRepo('repo-%d' % i) {{
+      branch_protection_rules: [orgs.newBranchProtectionRule('main')],
+      rulesets: [orgs.newRepoRuleset('main') {{ required_pull_request: orgs.newPullRequest() }}],
+      environments: [orgs.newEnvironment('production')],
+      secrets: [orgs.newRepoSecret('TOKEN') {{ value: 'secret' }}],
+      variables: [orgs.newRepoVariable('NAME') {{ value: 'value' }}],
+    }}
+    for i in std.range(1, {repos})
+  ],
+}}
+"""
+
+
+def _uncached_model_converter(cls: Any):
+    return lambda data: bend(cls.get_mapping_from_model(), data)
+
+
+def _uncached_field_selectors(cls: Any) -> dict[str, Any]:
+    return {k: OptionalS(k, default=UNSET) for k in (x.name for x in cls.all_fields())}
+
+
+def measure(data: dict[str, Any], rounds: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        GitHubOrganization.from_model_data(data)
+    with_validation = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        GitHubOrganization._from_validated_model_data(data)
+    without_validation = (time.perf_counter() - start) / rounds
+
+    return with_validation, without_validation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=1000, help="number of repositories")
+    parser.add_argument("--rounds", type=int, default=3, help="number of conversions to average")
+    options = parser.parse_args()
+
+    console = Console()
+    data = jsonnet_evaluate_snippet(_ORG_SNIPPET.format(template_file=_TEMPLATE_FILE, repos=options.repos))
+
+    compiled = measure(data, options.rounds)
+
+    models.get_model_converter = _uncached_model_converter  # type: ignore
+    models.get_field_selectors = _uncached_field_selectors  # type: ignore
+    github_organization.get_model_converter = _uncached_model_converter  # type: ignore
+    rebuilt = measure(data, options.rounds)
+
+    console.print(f"repositories: {options.repos}")
+    console.print(f"rebuilt mappings: {rebuilt[0]:.3f}s, {rebuilt[1]:.3f}s without schema validation")
+    console.print(f"compiled:         {compiled[0]:.3f}s, {compiled[1]:.3f}s without schema validation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from otterdog import cache
+from otterdog.models import github_organization
+from otterdog.models.config_cache import OrgConfigCache
+from otterdog.models.github_organization import GitHubOrganization
+from otterdog.utils import jsonnet_evaluate_file_with_imports, restrict_jsonnet_imports
+
+_TEST_ORG_DIR = Path(__file__).parent / "resources" / "test-org"
+_TEMPLATE_FILE = "vendor/test-defaults/test-defaults.libsonnet"
+
+
+@pytest.fixture
+def org_dir(tmp_path: Path) -> Path:
+    org_dir = tmp_path / "orgs" / "test-org"
+    shutil.copytree(_TEST_ORG_DIR, org_dir)
+    return org_dir
+
+
+@pytest.fixture
+def config_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> OrgConfigCache:
+    config_cache = OrgConfigCache(str(tmp_path / "cache"))
+    monkeypatch.setattr(cache, "_CONFIG_CACHE", config_cache)
+    return config_cache
+
+
+@pytest.fixture
+def evaluations(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    evaluated_files: list[str] = []
+
+    def _evaluate(file: str, import_base_dir: str | None = None):
+        evaluated_files.append(file)
+        return jsonnet_evaluate_file_with_imports(file, import_base_dir)
+
+    monkeypatch.setattr(github_organization, "jsonnet_evaluate_file_with_imports", _evaluate)
+    return evaluated_files
+
+
+def load(org_dir: Path) -> GitHubOrganization:
+    return GitHubOrganization.load_from_file("test-org", str(org_dir / "test-org.jsonnet"))
+
+
+def test_cached_configuration_is_used(org_dir: Path, config_cache: OrgConfigCache, evaluations: list[str]):
+    organization = load(org_dir)
+
+    assert load(org_dir) == organization
+    assert len(evaluations) == 1
+
+
+def test_imported_files_are_recorded(org_dir: Path):
+    _, files = jsonnet_evaluate_file_with_imports(str(org_dir / "test-org.jsonnet"))
+
+    assert set(files) == {
+        os.path.realpath(org_dir / "test-org.jsonnet"),
+        os.path.realpath(org_dir / _TEMPLATE_FILE),
+        os.path.realpath(org_dir / "vendor/test-defaults/otterdog-functions.libsonnet"),
+    }
+
+
+def test_changed_import_invalidates_entry(org_dir: Path, config_cache: OrgConfigCache, evaluations: list[str]):
+    organization = load(org_dir)
+
+    template = org_dir / _TEMPLATE_FILE
+    template.write_text(template.read_text() + "\n")
+
+    assert load(org_dir) == organization
+    assert len(evaluations) == 2
+
+
+def test_changed_config_invalidates_entry(org_dir: Path, config_cache: OrgConfigCache, evaluations: list[str]):
+    load(org_dir)
+
+    config_file = org_dir / "test-org.jsonnet"
+    config_file.write_text(config_file.read_text().replace("'test-org', 'test-org'", "'other-project', 'test-org'"))
+
+    assert load(org_dir).project_name == "other-project"
+    assert len(evaluations) == 2
+
+
+def test_entries_are_shared_between_copies(
+    tmp_path: Path, org_dir: Path, config_cache: OrgConfigCache, evaluations: list[str]
+):
+    organization = load(org_dir)
+
+    other_org_dir = tmp_path / "work" / "test-org"
+    shutil.copytree(org_dir, other_org_dir)
+
+    assert load(other_org_dir) == organization
+    assert len(evaluations) == 1
+
+
+def test_entry_outside_import_root_is_not_used(org_dir: Path, config_cache: OrgConfigCache, evaluations: list[str]):
+    load(org_dir)
+
+    with restrict_jsonnet_imports(str(org_dir / "vendor")), pytest.raises(RuntimeError, match="not allowed"):
+        # the org config imports files relative to the org dir
+        load(org_dir)
+
+    with restrict_jsonnet_imports(str(org_dir)):
+        load(org_dir)
+
+    assert len(evaluations) == 2
+
+
+def test_invalid_configuration_is_not_cached(org_dir: Path, config_cache: OrgConfigCache, evaluations: list[str]):
+    config_file = org_dir / "test-org.jsonnet"
+    config_file.write_text(config_file.read_text() + " + { settings+: { name: 1 } }")
+
+    for _ in range(2):
+        with pytest.raises(Exception, match="is not valid"):
+            load(org_dir)
+
+    assert len(evaluations) == 2
+
+
+def test_oldest_entries_are_evicted(tmp_path: Path, org_dir: Path):
+    config_cache = OrgConfigCache(str(tmp_path / "cache"), max_entries=2)
+    config_file = org_dir / "test-org.jsonnet"
+
+    for i in range(3):
+        config_file.write_text(f"{{ value: {i} }}")
+        data, files = jsonnet_evaluate_file_with_imports(str(config_file))
+        config_cache.put(str(config_file), data, files)
+        assert config_cache.get(str(config_file)) == {"value": i}
+
+    assert len(os.listdir(tmp_path / "cache")) == 2
@@ -0,0 +1,55 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import dataclasses
+
+import pytest
+
+from otterdog.models.organization_variable import OrganizationVariable
+from otterdog.models.repository import Repository
+from otterdog.models.team import Team
+
+
+def test_field_table_is_built_once():
+    assert Team._field_table() is Team._field_table()
+    assert Team._field_table() is not Repository._field_table()
+
+
+def test_field_table_matches_field_metadata():
+    table = Team._field_table()
+
+    assert table.all_fields == tuple(dataclasses.fields(Team))
+    assert table.key_field == "name"
+    assert [f.name for f in table.model_fields] == [
+        f.name for f in dataclasses.fields(Team) if not f.metadata.get("external_only", False)
+    ]
+    assert [f.name for f in table.model_only_fields] == ["skip_members", "skip_non_organization_members"]
+    assert Team._get_field("name") is table.fields_by_name["name"]
+
+    with pytest.raises(ValueError):
+        Team._get_field("unknown")
+
+
+def test_key_candidates():
+    table = Team._field_table()
+
+    assert "skip_members" in [f.name for f in table.key_candidates(False, False, False)]
+    assert "skip_members" not in [f.name for f in table.key_candidates(True, False, False)]
+    assert "skip_members" in [f.name for f in table.key_candidates(True, True, False)]
+
+    repo_table = Repository._field_table()
+    assert "webhooks" not in [f.name for f in repo_table.key_candidates(False, False, False)]
+    assert "webhooks" in [f.name for f in repo_table.key_candidates(False, False, True)]
+
+
+def test_diff_filters_are_only_called_if_overridden():
+    assert Repository._field_table().has_diff_filter is True
+    assert Repository._field_table().has_patch_filter is True
+    assert Team._field_table().has_diff_filter is True
+    assert OrganizationVariable._field_table().has_diff_filter is False
+    assert OrganizationVariable._field_table().has_patch_filter is False
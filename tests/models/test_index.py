@@ -0,0 +1,57 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import copy
+from types import SimpleNamespace
+
+from otterdog.models.index import KeyIndex, find_by_key
+
+
+def _item(name: str) -> SimpleNamespace:
+    return SimpleNamespace(name=name)
+
+
+def test_first_item_wins():
+    first = _item("a")
+    items = [first, _item("a"), _item("b")]
+
+    assert KeyIndex("name").get(items, "a") is first
+
+
+def test_index_follows_appended_and_replaced_lists():
+    owner = SimpleNamespace(items=[_item("a")])
+
+    assert find_by_key(owner, "items", "name", "b") is None
+
+    b = _item("b")
+    owner.items.append(b)
+    assert find_by_key(owner, "items", "name", "b") is b
+
+    c = _item("c")
+    owner.items = [c]
+    assert find_by_key(owner, "items", "name", "b") is None
+    assert find_by_key(owner, "items", "name", "c") is c
+
+
+def test_index_detects_changed_keys():
+    a = _item("a")
+    owner = SimpleNamespace(items=[a])
+
+    assert find_by_key(owner, "items", "name", "a") is a
+
+    a.name = "renamed"
+    assert find_by_key(owner, "items", "name", "a") is None
+    assert find_by_key(owner, "items", "name", "renamed") is a
+
+
+def test_index_of_copied_owner():
+    owner = SimpleNamespace(items=[_item("a")])
+    assert find_by_key(owner, "items", "name", "a") is owner.items[0]
+
+    copied = copy.deepcopy(owner)
+    assert find_by_key(copied, "items", "name", "a") is copied.items[0]
@@ -0,0 +1,107 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import json
+from pathlib import Path
+
+import pretend
+import pytest
+
+from otterdog import cache
+from otterdog.models import live_snapshot
+from otterdog.models.github_organization import GitHubOrganization
+from otterdog.models.live_snapshot import LiveSnapshotStore
+
+_TEST_ORG_FILE = Path(__file__).parent / "resources" / "test-org" / "test-org.jsonnet"
+
+
+@pytest.fixture
+def organization() -> GitHubOrganization:
+    return GitHubOrganization.load_from_file("test-org", str(_TEST_ORG_FILE))
+
+
+@pytest.fixture
+def snapshot_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> LiveSnapshotStore:
+    snapshot_store = LiveSnapshotStore(str(tmp_path / "live"))
+    monkeypatch.setattr(cache, "_LIVE_SNAPSHOT_STORE", snapshot_store)
+    return snapshot_store
+
+
+def test_model_data_round_trip(organization: GitHubOrganization):
+    data = json.loads(json.dumps(organization.to_model_data()))
+    assert GitHubOrganization.from_model_data(data) == organization
+
+
+def test_snapshot_is_used_until_outdated(snapshot_store: LiveSnapshotStore, monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr(live_snapshot.time, "time", lambda: now)
+
+    key = snapshot_store.get_key("test-org", False)
+    snapshot_store.put("test-org", key, {"value": 1})
+
+    now += 60
+    assert snapshot_store.get("test-org", key, 60) == {"value": 1}
+    assert snapshot_store.get("test-org", key, 59) is None
+    assert snapshot_store.get("test-org", snapshot_store.get_key("test-org", True), 60) is None
+
+
+def test_snapshot_of_other_version_is_ignored(snapshot_store: LiveSnapshotStore, monkeypatch: pytest.MonkeyPatch):
+    key = snapshot_store.get_key("test-org")
+    snapshot_store.put("test-org", key, {"value": 1})
+
+    monkeypatch.setattr(live_snapshot, "_SNAPSHOT_VERSION", "0-0.0.0")
+    assert snapshot_store.get("test-org", key, 60) is None
+
+
+def test_invalidate(snapshot_store: LiveSnapshotStore):
+    key = snapshot_store.get_key("test-org")
+    snapshot_store.put("test-org", key, {"value": 1})
+    snapshot_store.put("other-org", key, {"value": 2})
+
+    snapshot_store.invalidate("test-org")
+
+    assert snapshot_store.get("test-org", key, 60) is None
+    assert snapshot_store.get("other-org", key, 60) == {"value": 2}
+
+
+def test_entries_are_evicted(tmp_path: Path):
+    snapshot_store = LiveSnapshotStore(str(tmp_path / "live"), max_entries_per_org=2)
+
+    for i in range(4):
+        snapshot_store.put("test-org", snapshot_store.get_key(i), {"value": i})
+
+    assert len(list((tmp_path / "live" / "test-org").iterdir())) == 2
+
+
+async def test_load_from_provider_uses_snapshot(
+    organization: GitHubOrganization, snapshot_store: LiveSnapshotStore, monkeypatch: pytest.MonkeyPatch
+):
+    loads = []
+
+    async def _load_from_provider(*args):
+        loads.append(args)
+        return organization
+
+    monkeypatch.setattr(GitHubOrganization, "_load_from_provider", _load_from_provider)
+    jsonnet_config = pretend.stub(template_hash="abc")
+    provider = pretend.stub()
+
+    async def load(**kwargs) -> GitHubOrganization:
+        return await GitHubOrganization.load_from_provider("test", "test-org", jsonnet_config, provider, **kwargs)
+
+    assert await load() is organization
+    assert await load(max_age=60) == organization
+    assert len(loads) == 1
+
+    # a snapshot is only used if it has been retrieved with the same parameters
+    await load(max_age=60, no_web_ui=True)
+    assert len(loads) == 2
+
+    # without max_age the organization is always retrieved
+    await load()
+    assert len(loads) == 3
@@ -0,0 +1,66 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import copy
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from otterdog.models.github_organization import GitHubOrganization, OrganizationScope
+
+_TEST_ORG_FILE = Path(__file__).parent / "resources" / "test-org" / "test-org.jsonnet"
+
+
+@pytest.fixture
+def organization() -> GitHubOrganization:
+    return GitHubOrganization.load_from_file("test-org", str(_TEST_ORG_FILE))
+
+
+def test_unchanged_organization_has_empty_scope(organization: GitHubOrganization):
+    scope = OrganizationScope.of_changes(organization, copy.deepcopy(organization))
+
+    assert scope == OrganizationScope(
+        settings=False,
+        roles=False,
+        teams=False,
+        webhooks=False,
+        secrets=False,
+        variables=False,
+        rulesets=False,
+        repositories=frozenset(),
+    )
+
+
+def test_scope_includes_changed_parts(organization: GitHubOrganization):
+    head_org = copy.deepcopy(organization)
+    head_org.settings.description = "changed"
+    changed_repo = head_org.repositories[0]
+    changed_repo.description = "changed"
+    changed_repo.aliases = ["old-name"]
+    head_org.repositories.append(dataclasses.replace(head_org.repositories[1], name="new-repo"))
+
+    scope = OrganizationScope.of_changes(organization, head_org)
+
+    assert scope.settings is True
+    assert scope.webhooks is False
+    assert scope.repositories == {changed_repo.name, "old-name", "new-repo"}
+
+
+def test_restrict_removes_parts_not_in_scope(organization: GitHubOrganization):
+    current_org = copy.deepcopy(organization)
+    current_org.settings.description = "live"
+    repo_name = organization.repositories[0].name
+
+    scope = OrganizationScope(settings=False, webhooks=False, repositories=frozenset([repo_name]))
+    scope.restrict(organization, current_org)
+
+    assert current_org.settings is organization.settings
+    assert organization.webhooks == current_org.webhooks == []
+    assert [x.name for x in organization.repositories] == [repo_name]
+    assert [x.name for x in current_org.repositories] == [repo_name]
@@ -0,0 +1,240 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+import copy
+import time
+from collections import Counter
+
+import pretend
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from otterdog.models.github_organization import _load_repos_from_provider
+from otterdog.providers.github import GitHubProvider
+from otterdog.providers.github.auth import token_auth
+from otterdog.providers.github.cache.ghproxy import ghproxy_cache
+from otterdog.providers.github.graphql import GraphQLClient
+from otterdog.providers.github.rest import RestApi
+
+from . import ModelTest
+
+ORG_ID = "OtterdogTest"
+REPO_COUNT = 20
+
+
+def _to_graphql_actors(actors: list[str]) -> dict:
+    return {
+        "nodes": [{"actor": {"__typename": "User", "id": actor, "login": actor[1:]}} for actor in actors],
+        "pageInfo": {"hasNextPage": False, "endCursor": None},
+    }
+
+
+def _to_graphql_rule(rule: dict) -> dict:
+    rule = copy.deepcopy(rule)
+    rule["pushAllowances"] = _to_graphql_actors(rule.pop("pushRestrictions"))
+    for key in ("reviewDismissalAllowances", "bypassPullRequestAllowances", "bypassForcePushAllowances"):
+        rule[key] = _to_graphql_actors(rule[key])
+    return rule
+
+
+class RecordedGitHub:
+    """Serves recorded responses of the GitHub REST and GraphQL api and counts the requests made."""
+
+    def __init__(self, repo_names: list[str]):
+        self.repo_names = repo_names
+        self.repo = ModelTest.load_json_resource("github-repo.json")
+        self.rule = _to_graphql_rule(ModelTest.load_json_resource("github-bpr.json"))
+        self.requests: Counter[str] = Counter()
+        self.latency = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _page(self, nodes: list) -> dict:
+        return {"nodes": nodes, "pageInfo": {"hasNextPage": False, "endCursor": None}}
+
+    async def handle_graphql(self, request: web.Request) -> web.Response:
+        query = (await request.json())["query"]
+
+        if "repositories(first: $pageSize" in query:
+            self.requests["graphql:repositories"] += 1
+            repos = [
+                {
+                    "name": repo_name,
+                    "isArchived": False,
+                    "hasVulnerabilityAlertsEnabled": True,
+                    "repositoryTopics": {"nodes": [{"topic": {"name": "otterdog"}}]},
+                    "branchProtectionRules": self._page([copy.deepcopy(self.rule)]),
+                }
+                for repo_name in self.repo_names
+            ]
+            return web.json_response({"data": {"organization": {"repositories": self._page(repos)}}})
+        else:
+            self.requests["graphql:branch-protection-rules"] += 1
+            rules = self._page([copy.deepcopy(self.rule)])
+            return web.json_response({"data": {"repository": {"branchProtectionRules": rules}}})
+
+    async def handle_rest(self, request: web.Request) -> web.Response:
+        path = request.match_info["tail"]
+        self.requests[f"rest:{path.split('/', 3)[-1] if path.startswith('repos/') else path}"] += 1
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        parts = path.split("/")
+        if path == f"orgs/{ORG_ID}/teams":
+            return web.json_response([])
+        elif path == f"orgs/{ORG_ID}/repos":
+            return web.json_response([{"name": repo_name} for repo_name in self.repo_names])
+        elif len(parts) == 3:
+            return web.json_response(dict(self.repo, name=parts[2]))
+
+        match "/".join(parts[3:]):
+            case "vulnerability-alerts":
+                return web.Response(status=204)
+            case "private-vulnerability-reporting":
+                return web.json_response({"enabled": False})
+            case "topics":
+                return web.json_response({"names": ["otterdog"]})
+            case "properties/values" | "rulesets" | "hooks":
+                return web.json_response([])
+            case "actions/permissions":
+                return web.json_response({"enabled": False})
+            case "actions/permissions/fork-pr-contributor-approval":
+                return web.json_response({"approval_policy": "first_time_contributors"})
+            case "actions/secrets":
+                return web.json_response({"secrets": []})
+            case "actions/variables":
+                return web.json_response({"variables": []})
+            case "environments":
+                return web.json_response({"environments": []})
+            case _:
+                return web.json_response({"message": "Not Found"}, status=404)
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+
+@pytest_asyncio.fixture
+async def github():
+    recorded = RecordedGitHub([f"repo-{i:02d}" for i in range(REPO_COUNT)])
+    app = web.Application()
+    app.router.add_post("/graphql", recorded.handle_graphql)
+    app.router.add_get("/{tail:.*}", recorded.handle_rest)
+
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield recorded, str(server.make_url(""))
+    finally:
+        await server.close()
+
+
+def create_provider(url: str) -> GitHubProvider:
+    provider = GitHubProvider(None)
+    provider.rest_api = RestApi(None, ghproxy_cache(url))
+    provider.graphql_client = GraphQLClient(token_auth("fake-token"), ghproxy_cache(url))
+    return provider
+
+
+def create_jsonnet_config():
+    return pretend.stub(
+        default_repo_config=ModelTest.load_json_resource("otterdog-repo.json"),
+        default_branch_protection_rule_config={},
+        default_repo_ruleset_config={},
+        default_org_webhook_config={},
+        default_repo_secret_config={},
+        default_repo_variable_config={},
+        default_environment_config={},
+        default_environment_secret_config={},
+        default_environment_variable_config={},
+    )
+
+
+async def load_repos(url: str, bulk: bool, repo_filter: str | None = None, repo_names: set[str] | None = None) -> dict:
+    provider = create_provider(url)
+    try:
+        repos = _load_repos_from_provider(
+            ORG_ID, provider, create_jsonnet_config(), {}, repo_filter=repo_filter, bulk=bulk, repo_names=repo_names
+        )
+        return {repo.name: repo async for repo in repos}
+    finally:
+        await provider.rest_api.close()
+        await provider.graphql_client.close()
+
+
+async def test_bulk_loading_yields_same_repos(github):
+    _, url = github
+
+    per_repo = await load_repos(url, bulk=False)
+    bulk = await load_repos(url, bulk=True)
+
+    assert len(bulk) == REPO_COUNT
+    assert bulk == per_repo
+    assert bulk["repo-00"].topics == ["otterdog"]
+    assert bulk["repo-00"].dependabot_alerts_enabled is True
+    assert [rule.pattern for rule in bulk["repo-00"].branch_protection_rules] == ["main"]
+
+
+async def test_bulk_loading_request_count(github):
+    recorded, url = github
+
+    await load_repos(url, bulk=False)
+    per_repo_requests = recorded.total_requests
+    assert recorded.requests["graphql:branch-protection-rules"] == REPO_COUNT
+
+    recorded.requests.clear()
+    await load_repos(url, bulk=True)
+    bulk_requests = recorded.total_requests
+
+    assert recorded.requests["graphql:repositories"] == 1
+    assert recorded.requests["graphql:branch-protection-rules"] == 0
+    assert recorded.requests["rest:topics"] == 0
+    assert recorded.requests["rest:vulnerability-alerts"] == 0
+    assert recorded.requests[f"rest:orgs/{ORG_ID}/repos"] == 0
+    assert per_repo_requests - bulk_requests == 3 * REPO_COUNT
+
+
+async def test_single_repo_filter_skips_bulk_loading(github):
+    recorded, url = github
+
+    repos = await load_repos(url, bulk=True, repo_filter="repo-01")
+
+    assert list(repos) == ["repo-01"]
+    assert recorded.requests["graphql:repositories"] == 0
+
+
+async def test_repo_names_only_load_named_repos(github):
+    recorded, url = github
+
+    repos = await load_repos(url, bulk=True, repo_names={"repo-01", "repo-05", "unknown-repo"})
+
+    assert sorted(repos) == ["repo-01", "repo-05"]
+    assert recorded.requests["graphql:repositories"] == 0
+    assert recorded.requests["graphql:branch-protection-rules"] == 2
+
+
+async def test_single_repo_requests_are_sent_concurrently(github):
+    recorded, url = github
+    # large enough to dominate the overhead of setting up connections to the stub
+    recorded.latency = 0.2
+
+    start = time.monotonic()
+    repos = await load_repos(url, bulk=True, repo_filter="repo-01")
+    elapsed = time.monotonic() - start
+
+    assert list(repos) == ["repo-01"]
+    assert recorded.max_in_flight > 1
+    # only the workflow settings have to wait for the repo data, everything else runs concurrently
+    assert elapsed < recorded.latency * recorded.total_requests / 2
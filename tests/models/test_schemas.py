@@ -0,0 +1,21 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+from otterdog.models.schemas import get_schema_validator
+
+
+def test_validator_is_created_once():
+    assert get_schema_validator("organization.json") is get_schema_validator("organization.json")
+    assert get_schema_validator("organization.json") is not get_schema_validator("repository.json")
+
+
+def test_references_are_resolved():
+    validator = get_schema_validator("repository.json")
+
+    assert validator.is_valid({"name": "test", "private": False, "secrets": [{"name": "TOKEN", "value": "secret"}]})
+    assert not validator.is_valid({"name": "test", "private": False, "secrets": [{"name": "TOKEN", "value": 1}]})
@@ -0,0 +1,123 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+import json
+from pathlib import Path
+
+import pretend
+
+from otterdog.models import LivePatch
+from otterdog.models.environment import Environment
+from otterdog.models.repository import Repository
+from otterdog.operations.apply_engine import apply_patches, build_dependencies, order_patches
+
+_RESOURCES_DIR = Path(__file__).parent.parent / "models" / "resources"
+
+
+def load_json_resource(name: str):
+    with open(_RESOURCES_DIR / name) as file:
+        return json.load(file)
+
+
+def create_repo(name: str, **kwargs) -> Repository:
+    return Repository.from_model_data({**load_json_resource("otterdog-repo.json"), "name": name, **kwargs})
+
+
+def create_environment(repo_name: str) -> Environment:
+    environment = Environment.from_model_data(load_json_resource("otterdog-environment.json"))
+    environment.repo_name = repo_name
+    return environment
+
+
+async def noop(*args) -> None: ...
+
+
+def add(model_object, parent_object=None) -> LivePatch:
+    return LivePatch.of_addition(model_object, parent_object, noop)
+
+
+def archive(repo: Repository) -> LivePatch:
+    return LivePatch.of_changes(repo, repo, {}, None, False, noop, changes_object_to_readonly=True)
+
+
+def org_patch(name: str) -> LivePatch:
+    return add(pretend.stub(name=name))
+
+
+def test_repositories_are_independent():
+    repo_a = create_repo("repo-a")
+    repo_b = create_repo("repo-b")
+    patches = [
+        org_patch("team"),
+        add(repo_a),
+        add(create_environment("repo-a"), repo_a),
+        add(repo_b),
+        add(pretend.stub(name="secret"), create_environment("repo-b")),
+    ]
+
+    assert build_dependencies("org", patches) == [set(), {0}, {0, 1}, {0}, {0, 3}]
+
+
+def test_organization_patches_are_barriers():
+    repo_a = create_repo("repo-a")
+    patches = [add(repo_a), add(pretend.stub(name="bpr"), repo_a), add(create_repo("repo-b")), org_patch("team")]
+
+    assert build_dependencies("org", patches)[3] == {1, 2}
+
+
+def test_repository_is_added_after_template():
+    patches = [
+        add(create_repo("from-template", template_repository="ORG/template")),
+        add(create_repo("fork", forked_repository="other/template")),
+        add(create_repo("template")),
+    ]
+
+    assert build_dependencies("org", patches) == [{2}, set(), set()]
+
+
+def test_archiving_is_applied_last():
+    repo_a = create_repo("repo-a")
+    repo_b = create_repo("repo-b")
+    patches = order_patches([archive(repo_a), add(pretend.stub(name="bpr"), repo_a), add(repo_b)])
+
+    assert patches[2].changes_object_to_readonly
+    assert build_dependencies("org", patches)[2] == {0, 1}
+
+
+def test_cycle_falls_back_to_serial_order():
+    patches = [
+        add(create_repo("repo-a", template_repository="org/repo-b")),
+        add(create_repo("repo-b", template_repository="org/repo-a")),
+    ]
+
+    assert build_dependencies("org", patches) == [set(), {0}]
+
+
+async def test_independent_patches_are_applied_concurrently():
+    patches = [org_patch("team")] + [add(create_repo(f"repo-{i}")) for i in range(4)] + [org_patch("settings")]
+    dependencies = build_dependencies("org", patches)
+
+    applied: list[str] = []
+    running = 0
+    max_running = 0
+
+    async def apply_fn(patch: LivePatch) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        applied.append(patch.expected_object.name)
+        running -= 1
+
+    await apply_patches(patches, dependencies, apply_fn, 2)
+
+    assert max_running == 2
+    assert applied[0] == "team"
+    assert sorted(applied[1:5]) == [f"repo-{i}" for i in range(4)]
+    assert applied[5] == "settings"
@@ -198,3 +198,34 @@ async def test_delete(github: GitHubProviderTestKit):
         ),
         new=None,
     )
+
+
+async def test_public_key_is_reused(github: GitHubProviderTestKit):
+    github.fake_encryption((GITHUB_SERVER_PUBLIC_KEY, PLAINTEXT_SECRET), CIPHERTEXT)
+
+    # the public key of the organization is fetched only once for all secrets
+    github.http.expect(
+        "GET",
+        f"/orgs/{ORG_ID}/actions/secrets/public-key",
+        response_json={"key_id": KEY_ID, "key": GITHUB_SERVER_PUBLIC_KEY},
+    )
+
+    for name in ("FIRST_SECRET", "SECOND_SECRET"):
+        github.http.expect(
+            "PUT",
+            f"/orgs/{ORG_ID}/actions/secrets/{name}",
+            request_json={
+                "key_id": KEY_ID,
+                "encrypted_value": CIPHERTEXT,
+                "selected_repository_ids": [],
+                "visibility": "private",
+            },
+            response_status=201,
+        )
+
+    for name in ("FIRST_SECRET", "SECOND_SECRET"):
+        await generate_patch_and_run_it(
+            github,
+            old=None,
+            new=OrganizationSecret(name=name, value=PLAINTEXT_SECRET, visibility="private", selected_repositories=[]),
+        )
@@ -0,0 +1,369 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+import contextlib
+import json
+import os
+import time
+
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from otterdog.providers.github.auth import token_auth
+from otterdog.providers.github.cache.etag import etag_cache
+from otterdog.providers.github.cache.ghproxy import ghproxy_cache
+from otterdog.providers.github.rest import requester as requester_module
+from otterdog.providers.github.rest.requester import Requester, SessionPool
+from otterdog.providers.github.rest.scheduler import RateLimitScheduler
+
+
+class RateLimitStub:
+    """A local GitHub stub that emits rate limit headers and tracks the number of concurrent requests."""
+
+    def __init__(self):
+        self.remaining = 5000
+        self.reset = int(time.time()) + 3600
+        self.secondary_limit_hits = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.request_times: list[float] = []
+        self.conditional_requests = 0
+
+    async def handle_etag(self, request: web.Request) -> web.Response:
+        etag = f'"{request.headers.get("Authorization")}-{request.query.get("page", "1")}"'
+        headers = {"ETag": etag, "x-ratelimit-remaining": str(self.remaining)}
+
+        if request.query.get("page") is None:
+            headers["Link"] = f'<{request.url.with_query(page="2")}>; rel="next"'
+
+        if request.headers.get("If-None-Match") is not None:
+            self.conditional_requests += 1
+            if request.headers["If-None-Match"] == etag:
+                return web.Response(status=304, headers=headers)
+
+        return web.json_response([{"page": request.query.get("page", "1")}], headers=headers)
+
+    async def handle_paged(self, request: web.Request) -> web.Response:
+        pages = 10
+        page = int(request.query.get("page", "1"))
+
+        links = []
+        if page < pages:
+            links.append(f'<{request.url.update_query(page=str(page + 1))}>; rel="next"')
+            if request.match_info["mode"] == "parallel":
+                links.append(f'<{request.url.update_query(page=str(pages))}>; rel="last"')
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.in_flight -= 1
+
+        headers = {"Link": ", ".join(links)} if links else {}
+        return web.json_response([{"id": (page - 1) * 2 + i} for i in range(2)], headers=headers)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.request_times.append(time.monotonic())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+
+            if self.secondary_limit_hits > 0:
+                self.secondary_limit_hits -= 1
+                return web.json_response(
+                    {"message": "You have exceeded a secondary rate limit."},
+                    status=403,
+                    headers={"retry-after": "1"},
+                )
+
+            headers = {
+                "x-ratelimit-remaining": str(self.remaining),
+                "x-ratelimit-reset": str(self.reset),
+            }
+            return web.json_response({"path": request.path}, headers=headers)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest_asyncio.fixture
+async def stub():
+    stub = RateLimitStub()
+    app = web.Application()
+    app.router.add_get("/etag/{tail:.*}", stub.handle_etag)
+    app.router.add_get("/paged/{mode}", stub.handle_paged)
+    app.router.add_get("/{tail:.*}", stub.handle)
+
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield stub, str(server.make_url(""))
+    finally:
+        await server.close()
+
+
+def create_requester(url: str, scheduler: RateLimitScheduler | None = None) -> Requester:
+    return Requester(None, ghproxy_cache(url), "api.github.com", "2022-11-28", scheduler)
+
+
+async def test_concurrency_sized_from_remaining_rate_limit(stub):
+    server, url = stub
+    server.remaining = 40
+
+    requester = create_requester(url, RateLimitScheduler(max_concurrency=50, tokens_per_slot=20))
+    try:
+        await requester.request_json("GET", "/orgs/test")
+        server.max_in_flight = 0
+
+        await asyncio.gather(*[requester.request_json("GET", f"/repos/test/repo-{i}") for i in range(10)])
+
+        assert server.max_in_flight <= 2
+        assert requester.statistics.remaining_rate_limit == 40
+    finally:
+        await requester.close()
+
+
+async def test_full_concurrency_with_sufficient_rate_limit(stub):
+    server, url = stub
+
+    requester = create_requester(url, RateLimitScheduler(max_concurrency=10))
+    try:
+        await requester.request_json("GET", "/orgs/test")
+        server.max_in_flight = 0
+
+        await asyncio.gather(*[requester.request_json("GET", f"/repos/test/repo-{i}") for i in range(20)])
+
+        assert server.max_in_flight > 2
+        assert server.max_in_flight <= 10
+    finally:
+        await requester.close()
+
+
+async def test_retry_after_secondary_rate_limit(stub):
+    server, url = stub
+    server.secondary_limit_hits = 1
+
+    scheduler = RateLimitScheduler(max_concurrency=8)
+    requester = create_requester(url, scheduler)
+    try:
+        result = await requester.request_json("GET", "/orgs/test")
+
+        assert result == {"path": "/orgs/test"}
+        assert requester.statistics.throttled_requests == 1
+        assert requester.statistics.total_requests == 2
+        assert server.request_times[1] - server.request_times[0] >= 1.0
+    finally:
+        await requester.close()
+
+
+async def test_stream_updates_rate_limit_and_retries(stub):
+    server, url = stub
+    server.remaining = 40
+    server.secondary_limit_hits = 1
+
+    requester = create_requester(url)
+    try:
+        chunks = [chunk async for chunk in requester.request_stream("GET", "/repos/test/repo/zipball/main")]
+
+        assert json.loads(b"".join(chunks)) == {"path": "/repos/test/repo/zipball/main"}
+        assert requester.statistics.throttled_requests == 1
+        assert requester.statistics.total_requests == 2
+        assert requester.scheduler.remaining == 40
+    finally:
+        await requester.close()
+
+
+async def test_wait_for_reset_of_exhausted_rate_limit(stub):
+    server, url = stub
+    server.remaining = 0
+    server.reset = int(time.time()) + 2
+
+    requester = create_requester(url)
+    try:
+        await requester.request_json("GET", "/orgs/test")
+        await requester.request_json("GET", "/orgs/test")
+
+        assert requester.scheduler.remaining == 0
+        assert server.request_times[1] - server.request_times[0] >= 0.5
+    finally:
+        await requester.close()
+
+
+def create_etag_requester(url: str, cache_dir: str, token: str) -> Requester:
+    requester = Requester(token_auth(token), etag_cache(cache_dir), "api.github.com", "2022-11-28")
+    # redirect requests to the local stub
+    requester._base_url = url.rstrip("/")
+    return requester
+
+
+async def test_conditional_requests_serve_cached_body(stub, tmp_path):
+    server, url = stub
+
+    requester = create_etag_requester(url, str(tmp_path), "token-a")
+    try:
+        first = await requester.request_paged_json("GET", "/etag/repos")
+        second = await requester.request_paged_json("GET", "/etag/repos")
+
+        assert first == [{"page": "1"}, {"page": "2"}]
+        assert second == first
+        assert server.conditional_requests == 2
+        assert requester.statistics.cache_misses == 2
+        assert requester.statistics.not_modified_responses == 2
+    finally:
+        await requester.close()
+
+
+async def test_conditional_cache_is_keyed_by_identity(stub, tmp_path):
+    server, url = stub
+
+    requester_a = create_etag_requester(url, str(tmp_path), "token-a")
+    requester_b = create_etag_requester(url, str(tmp_path), "token-b")
+    try:
+        await requester_a.request_json("GET", "/etag/repos")
+        await requester_b.request_json("GET", "/etag/repos")
+
+        assert server.conditional_requests == 0
+        assert requester_b.statistics.cache_misses == 1
+        assert requester_b.statistics.not_modified_responses == 0
+    finally:
+        await requester_a.close()
+        await requester_b.close()
+
+
+async def test_expired_conditional_entries_are_discarded(tmp_path):
+    from otterdog.providers.github.cache.etag import ConditionalEntry
+
+    conditional_cache = etag_cache(str(tmp_path), max_age=60).get_conditional_cache()
+
+    await conditional_cache.put("aa01", ConditionalEntry("etag-1", "body"))
+    assert await conditional_cache.get("aa01") == ConditionalEntry("etag-1", "body")
+
+    expired = time.time() - 120
+    expired_file = tmp_path / "aa" / "aa01.json"
+    os.utime(expired_file, (expired, expired))
+    assert await conditional_cache.get("aa01") is None
+
+    # expired entries are removed when a new cache writes its first entry
+    other_cache = etag_cache(str(tmp_path), max_age=60).get_conditional_cache()
+    await other_cache.put("bb02", ConditionalEntry("etag-2", "body"))
+    assert not expired_file.exists()
+    assert await other_cache.get("bb02") is not None
+
+
+async def test_iter_paged_json_yields_entries_in_order(stub):
+    server, url = stub
+
+    requester = create_requester(url)
+    try:
+        entries = [entry["id"] async for entry in requester.iter_paged_json("GET", "/paged/parallel")]
+
+        assert entries == list(range(20))
+        assert server.max_in_flight > 1
+    finally:
+        await requester.close()
+
+
+async def test_iter_paged_json_stops_early(stub):
+    _, url = stub
+
+    requester = create_requester(url)
+    try:
+        async with contextlib.aclosing(requester.iter_paged_json("GET", "/paged/parallel")) as entries:
+            async for entry in entries:
+                if entry["id"] == 0:
+                    break
+
+        # pending page requests have been cancelled
+        assert requester.scheduler.in_flight == 0
+    finally:
+        await requester.close()
+
+
+async def test_parallel_page_fetching_latency(stub):
+    _, url = stub
+
+    requester = create_requester(url)
+    try:
+        start = time.monotonic()
+        serial_entries = await requester.request_paged_json("GET", "/paged/serial")
+        serial_time = time.monotonic() - start
+
+        start = time.monotonic()
+        parallel_entries = await requester.request_paged_json("GET", "/paged/parallel")
+        parallel_time = time.monotonic() - start
+
+        assert serial_entries == parallel_entries
+        assert parallel_time < serial_time / 2
+    finally:
+        await requester.close()
+
+
+def test_is_rate_limited():
+    assert RateLimitScheduler.is_rate_limited(403, {"retry-after": "60"}, "")
+    assert RateLimitScheduler.is_rate_limited(403, {"x-ratelimit-remaining": "0"}, "")
+    assert RateLimitScheduler.is_rate_limited(429, {}, "You have exceeded a secondary rate limit")
+    assert not RateLimitScheduler.is_rate_limited(403, {"x-ratelimit-remaining": "100"}, "Resource not accessible")
+    assert not RateLimitScheduler.is_rate_limited(200, {"retry-after": "60"}, "")
+
+
+def test_backoff_reduces_concurrency():
+    scheduler = RateLimitScheduler(max_concurrency=16)
+
+    delay = scheduler.backoff({"retry-after": "5"})
+
+    assert delay == 5
+    assert scheduler.concurrency_limit == 8
+
+    scheduler.update({"x-ratelimit-remaining": "4000", "x-ratelimit-reset": str(int(time.time()) + 3600)})
+    assert scheduler.concurrency_limit == 9
+
+
+async def test_pooled_session_is_shared_across_requesters(stub, monkeypatch):
+    _, url = stub
+
+    session_pool = SessionPool(limit_per_host=5)
+    monkeypatch.setattr(requester_module, "_SESSION_POOL", session_pool)
+
+    try:
+        for token in ("token-a", "token-b", "token-c"):
+            requester = Requester(token_auth(token), ghproxy_cache(url), "api.github.com", "2022-11-28")
+            try:
+                await requester.request_json("GET", "/orgs/test")
+            finally:
+                await requester.close()
+
+        (statistics,) = session_pool.statistics.values()
+        assert statistics.sessions_reused == 2
+        assert statistics.connections_created == 1
+        assert statistics.connections_reused == 2
+        assert statistics.requests_in_flight == 0
+        assert statistics.utilization == 0.0
+    finally:
+        await session_pool.close()
+
+
+async def test_pool_limits_connections_per_host(stub, monkeypatch):
+    server, url = stub
+
+    session_pool = SessionPool(limit_per_host=3)
+    monkeypatch.setattr(requester_module, "_SESSION_POOL", session_pool)
+
+    requester = create_requester(url)
+    try:
+        await asyncio.gather(*[requester.request_json("GET", f"/repos/test/repo-{i}") for i in range(10)])
+
+        (statistics,) = session_pool.statistics.values()
+        assert server.max_in_flight <= 3
+        assert statistics.connections_created <= 3
+        assert statistics.max_requests_in_flight == 10
+    finally:
+        await requester.close()
+        await session_pool.close()
@@ -0,0 +1,92 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+import json
+
+import pytest
+
+from otterdog.providers.github.rest import secret_encryptor
+from otterdog.providers.github.rest.secret_encryptor import SecretEncryptor
+
+
+class KeyStub:
+    def __init__(self, *key_ids: str):
+        self.key_ids = list(key_ids)
+        self.retrievals = 0
+
+    async def __call__(self) -> tuple[str, str]:
+        self.retrievals += 1
+        await asyncio.sleep(0)
+        key_id = self.key_ids.pop(0)
+        return key_id, f"public-{key_id}"
+
+
+class RequesterStub:
+    def __init__(self, *statuses: int):
+        self.statuses = list(statuses)
+        self.requests: list[dict] = []
+
+    async def request_raw(self, method: str, url_path: str, data: str | None = None) -> tuple[int, str]:
+        self.requests.append(json.loads(data or "{}"))
+        return self.statuses.pop(0), ""
+
+
+@pytest.fixture(autouse=True)
+def fake_encryption(monkeypatch):
+    monkeypatch.setattr(secret_encryptor, "encrypt_value", lambda pk, value: f"{value}@{pk}")
+
+
+async def test_public_key_is_retrieved_once_per_scope():
+    encryptor = SecretEncryptor()
+    retrieve = KeyStub("1", "2")
+
+    results = await asyncio.gather(*(encryptor.encrypt(("org", "test"), retrieve, f"v{i}") for i in range(5)))
+
+    assert retrieve.retrievals == 1
+    assert results[3] == {"encrypted_value": "v3@public-1", "key_id": "1"}
+
+    other = await encryptor.encrypt(("repo", "test", "repo"), retrieve, "value")
+    assert other["key_id"] == "2"
+
+
+async def test_failed_retrieval_is_not_cached():
+    encryptor = SecretEncryptor()
+
+    async def failing() -> tuple[str, str]:
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        await encryptor.encrypt(("org", "test"), failing, "value")
+
+    assert (await encryptor.encrypt(("org", "test"), KeyStub("1"), "value"))["key_id"] == "1"
+
+
+async def test_put_secret_retries_with_new_key_on_422():
+    encryptor = SecretEncryptor()
+    retrieve = KeyStub("old", "new")
+    requester = RequesterStub(422, 201)
+
+    status = await encryptor.put_secret(requester, "/url", {"value": "secret"}, ("org", "test"), retrieve)  # type: ignore
+
+    assert status == 201
+    assert retrieve.retrievals == 2
+    assert [r["key_id"] for r in requester.requests] == ["old", "new"]
+    assert requester.requests[1]["encrypted_value"] == "secret@public-new"
+
+
+async def test_put_secret_without_value():
+    encryptor = SecretEncryptor()
+    retrieve = KeyStub()
+    requester = RequesterStub(422)
+
+    status = await encryptor.put_secret(requester, "/url", {"visibility": "all"}, ("org", "test"), retrieve)  # type: ignore
+
+    assert status == 422
+    assert retrieve.retrievals == 0
+    assert requester.requests == [{"visibility": "all"}]
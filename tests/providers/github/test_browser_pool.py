@@ -0,0 +1,147 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+
+import pytest
+from playwright import async_api
+
+from otterdog.providers.github.browser_pool import BrowserPool
+
+
+class FakeContext:
+    def __init__(self, storage_state):
+        self.initial_storage_state = storage_state
+        self.closed = False
+
+    async def storage_state(self):
+        return {"cookies": [*(self.initial_storage_state or {}).get("cookies", []), "session"]}
+
+    async def new_page(self):
+        return self
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts: list[FakeContext] = []
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, storage_state=None, **kwargs):
+        context = FakeContext(storage_state)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers: list[FakeBrowser] = []
+        self.firefox = self
+
+    async def launch(self, headless=True):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+
+@pytest.fixture
+def playwright(monkeypatch):
+    playwright = FakePlaywright()
+    monkeypatch.setattr(async_api, "async_playwright", lambda: playwright)
+    return playwright
+
+
+async def _logout(page):
+    pass
+
+
+async def test_browser_and_session_are_reused(playwright):
+    pool = BrowserPool()
+
+    async with pool.new_context("bot", _logout) as first:
+        assert first.initial_storage_state is None
+
+    async with pool.new_context("bot", _logout) as second:
+        assert second.initial_storage_state == {"cookies": ["session"]}
+
+    async with pool.new_context("other", _logout) as other:
+        assert other.initial_storage_state is None
+
+    assert pool.browsers_launched == 1
+    assert first.closed and second.closed and other.closed
+
+    await pool.close()
+
+
+async def test_concurrent_contexts_are_limited(playwright):
+    pool = BrowserPool(max_contexts=2)
+    in_use = 0
+    max_in_use = 0
+
+    async def use():
+        nonlocal in_use, max_in_use
+        async with pool.new_context("bot", _logout):
+            in_use += 1
+            max_in_use = max(max_in_use, in_use)
+            await asyncio.sleep(0.01)
+            in_use -= 1
+
+    await asyncio.gather(*(use() for _ in range(5)))
+
+    assert max_in_use == 2
+    assert pool.browsers_launched == 1
+
+    await pool.close()
+
+
+async def test_idle_browser_is_closed(playwright):
+    pool = BrowserPool(idle_timeout=0.01)
+
+    async with pool.new_context("bot", _logout):
+        pass
+
+    await asyncio.sleep(0.05)
+    assert not playwright.browsers[0].is_connected()
+
+    # the session survives a relaunch of the browser
+    async with pool.new_context("bot", _logout) as context:
+        assert context.initial_storage_state == {"cookies": ["session"]}
+
+    assert pool.browsers_launched == 2
+
+    await pool.close()
+
+
+async def test_close_logs_out_accounts(playwright):
+    pool = BrowserPool()
+    logged_out = []
+
+    async def logout(page):
+        logged_out.append(page.initial_storage_state)
+
+    async with pool.new_context("bot", logout):
+        pass
+
+    await pool.close()
+
+    assert logged_out == [{"cookies": ["session"]}]
+    assert not playwright.browsers[-1].is_connected()
@@ -59,3 +59,89 @@ async def test_goto_does_not_retry_non_repository_defaults_page_on_404():
         await client._goto(page, "https://github.com/organizations/example/settings/security")
 
     assert len(page.goto_calls) == 1
+
+
+class _MockSettingsPage:
+    def __init__(self, elements):
+        self._elements = elements
+        self.evaluate_calls = 0
+        self.eval_on_selector_calls = []
+        self.clicks = []
+
+    async def evaluate(self, script, queries):
+        self.evaluate_calls += 1
+        return [
+            [True, self._elements[selector][prop]] if selector in self._elements else [False, None]
+            for selector, prop in queries
+        ]
+
+    async def eval_on_selector(self, selector, script, prop):
+        self.eval_on_selector_calls.append(selector)
+        return self._elements[selector][prop]
+
+    async def click(self, selector):
+        self.clicks.append(selector)
+
+    async def wait_for_selector(self, selector, state):
+        pass
+
+
+def _setting(name, setting_type, selector, value_selector, pre_selector=None, optional=False, **kwargs):
+    return {
+        "name": name,
+        "type": setting_type,
+        "selector": selector,
+        "valueSelector": value_selector,
+        "preSelector": pre_selector,
+        "optional": optional,
+        **kwargs,
+    }
+
+
+@pytest.mark.asyncio
+async def test_retrieve_settings_evaluates_page_once():
+    page_def = [
+        _setting("a", "checkbox", "#a", "checked"),
+        _setting("b", "text", "#b", "value"),
+        _setting("c", "radio", "#c", "value"),
+        _setting("d", "checkbox", "#d", "checked", optional=True),
+        _setting("e", "select-menu", "#e", "innerText", pre_selector=".menu", parent="a"),
+        _setting("f", "checkbox", "#f", "checked"),
+    ]
+    page = _MockSettingsPage(
+        {
+            "#a": {"checked": True},
+            "#b": {"value": " main "},
+            "#c:checked": {"value": "all"},
+            "#e": {"innerText": "repo\n"},
+        }
+    )
+    client = WebClient(pretend.stub())
+
+    with (
+        patch.object(client, "_goto", new=AsyncMock()),
+        patch.object(client, "_store_html_and_screenshot", new=AsyncMock()),
+    ):
+        settings = await client._retrieve_settings("example", "settings", page_def, {"a", "b", "c", "d", "e"}, page)
+
+    assert settings == {"a": True, "b": "main", "c": "all", "e": "repo"}
+    assert page.evaluate_calls == 1
+    assert page.eval_on_selector_calls == ["#e"]
+    assert page.clicks == [".menu"]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_settings_reports_missing_required_setting():
+    page_def = [_setting("a", "checkbox", "#a", "checked")]
+    page = _MockSettingsPage({})
+    client = WebClient(pretend.stub())
+
+    store = AsyncMock()
+    with (
+        patch.object(client, "_goto", new=AsyncMock()),
+        patch.object(client, "_store_html_and_screenshot", new=store),
+    ):
+        settings = await client._retrieve_settings("example", "settings", page_def, {"a"}, page)
+
+    assert settings == {}
+    store.assert_awaited_once()
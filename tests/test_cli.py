@@ -0,0 +1,82 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+
+import pretend
+
+from otterdog.cli import _execute_operation_in_parallel
+from otterdog.operations import Operation
+from otterdog.providers.github.rest.requester import get_session_pool
+from otterdog.utils import get_jsonnet_engine
+
+
+class SleepingOperation(Operation):
+    def __init__(self, delays: dict[str, float], exit_codes: dict[str, int]):
+        super().__init__()
+        self.delays = delays
+        self.exit_codes = exit_codes
+        self.executed: list[str] = []
+
+    def pre_execute(self) -> None: ...
+
+    def fork(self, printer):
+        forked = super().fork(printer)
+        forked.executed = []
+        return forked
+
+    def join(self, forked) -> None:
+        self.executed.extend(forked.executed)
+
+    async def execute(self, org_config, org_index=None, org_count=None) -> int:
+        self.printer.println(f"start {org_config.name} ({org_index}/{org_count})")
+        self.printer.level_up()
+
+        await asyncio.sleep(self.delays[org_config.name])
+        self.executed.append(org_config.name)
+
+        self.printer.println(f"done {org_config.name}")
+        self.printer.level_down()
+        return self.exit_codes.get(org_config.name, 0)
+
+
+def create_config(organizations: list[str]):
+    return pretend.stub(get_organization_config=lambda name: pretend.stub(name=name))
+
+
+async def test_output_is_flushed_in_order(capsys):
+    organizations = ["org-a", "org-b", "org-c"]
+    operation = SleepingOperation({"org-a": 0.2, "org-b": 0.1, "org-c": 0.0}, {"org-b": 1})
+
+    exit_code = await _execute_operation_in_parallel(create_config(organizations), organizations, operation, 3)
+
+    assert exit_code == 1
+    assert operation.executed == organizations
+    assert capsys.readouterr().out.splitlines() == [
+        "start org-a (1/3)",
+        "  done org-a",
+        "start org-b (2/3)",
+        "  done org-b",
+        "start org-c (3/3)",
+        "  done org-c",
+    ]
+    assert get_session_pool() is None
+    assert get_jsonnet_engine() is None
+
+
+async def test_number_of_concurrent_organizations_is_bounded():
+    organizations = [f"org-{i}" for i in range(6)]
+    operation = SleepingOperation(dict.fromkeys(organizations, 0.05), {})
+
+    start = asyncio.get_running_loop().time()
+    await _execute_operation_in_parallel(create_config(organizations), organizations, operation, 2)
+    elapsed = asyncio.get_running_loop().time() - start
+
+    assert operation.executed == organizations
+    assert elapsed >= 0.15
+    assert elapsed < 0.3
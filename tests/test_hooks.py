@@ -0,0 +1,83 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import os
+
+from otterdog.hooks import HookRegistry
+
+
+def test_missing_hook(tmp_path):
+    registry = HookRegistry()
+
+    assert registry.execute_if_present(str(tmp_path / "missing-hook.py"), {}, {}) is False
+    assert registry.get_timings() == {}
+
+
+def test_hook_is_compiled_once(tmp_path):
+    hook_script = tmp_path / "hook.py"
+    hook_script.write_text("result.append(value)")
+
+    registry = HookRegistry()
+    result: list[int] = []
+
+    for i in range(3):
+        assert registry.execute_if_present(str(hook_script), {}, {"result": result, "value": i}) is True
+
+    assert result == [0, 1, 2]
+    assert registry.get_code(str(hook_script)) is registry.get_code(str(hook_script))
+    assert registry.get_timings()[os.path.realpath(hook_script)].calls == 3
+
+
+def test_modified_hook_is_recompiled(tmp_path):
+    hook_script = tmp_path / "hook.py"
+    hook_script.write_text("result.append(1)")
+
+    registry = HookRegistry()
+    result: list[int] = []
+    registry.execute_if_present(str(hook_script), {}, {"result": result})
+
+    stat = hook_script.stat()
+    hook_script.write_text("result.append(22)")
+    os.utime(hook_script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    registry.execute_if_present(str(hook_script), {}, {"result": result})
+    assert result == [1, 22]
+
+
+def test_symlinked_hook_is_shared(tmp_path):
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    (workspace / "hook.py").write_text("result.append(1)")
+
+    registry = HookRegistry()
+    result: list[int] = []
+
+    for org in ("org1", "org2"):
+        os.makedirs(tmp_path / org / "vendor")
+        os.symlink(workspace, tmp_path / org / "vendor" / "template")
+        registry.execute_if_present(str(tmp_path / org / "vendor" / "template" / "hook.py"), {}, {"result": result})
+
+    assert result == [1, 1]
+    assert list(registry.get_timings()) == [os.path.realpath(workspace / "hook.py")]
+    assert registry.get_timings()[os.path.realpath(workspace / "hook.py")].calls == 2
+
+
+def test_hooks_are_evicted(tmp_path):
+    registry = HookRegistry(max_entries=2)
+
+    for i in range(3):
+        hook_script = tmp_path / f"hook-{i}.py"
+        hook_script.write_text("pass")
+        registry.execute_if_present(str(hook_script), {}, {})
+
+    assert sorted(registry.get_timings()) == [os.path.realpath(tmp_path / f"hook-{i}.py") for i in (1, 2)]
+
+    # hooks whose script has been removed are dropped
+    os.remove(tmp_path / "hook-2.py")
+    assert registry.execute_if_present(str(tmp_path / "hook-2.py"), {}, {}) is False
+    assert list(registry.get_timings()) == [os.path.realpath(tmp_path / "hook-1.py")]
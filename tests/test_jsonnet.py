@@ -0,0 +1,131 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from otterdog import jsonnet, utils
+from otterdog.jsonnet import JsonnetConfig
+from otterdog.utils import JsonnetEngine, jsonnet_evaluate_snippet
+
+_TEMPLATE_DIR = Path(__file__).parent.parent / "examples" / "template"
+
+
+@pytest.fixture(autouse=True)
+def evaluated_snippets(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    monkeypatch.setattr(jsonnet, "_default_configs_memo", {})
+    monkeypatch.setattr(jsonnet, "_default_org_configs_memo", {})
+
+    snippets: list[str] = []
+
+    def _evaluate_snippet(snippet: str, import_base_dir: str | None = None):
+        snippets.append(snippet)
+        return jsonnet_evaluate_snippet(snippet, import_base_dir)
+
+    monkeypatch.setattr(jsonnet, "jsonnet_evaluate_snippet", _evaluate_snippet)
+    return snippets
+
+
+async def create_jsonnet_config(base_dir: Path, org_id: str = "OtterdogTest") -> JsonnetConfig:
+    config = JsonnetConfig(
+        org_id,
+        str(base_dir),
+        "https://github.com/eclipse-csi/otterdog#otterdog-defaults.libsonnet@main",
+        True,
+    )
+    shutil.copytree(_TEMPLATE_DIR, config.template_dir)
+    await config.init_template()
+    return config
+
+
+def evaluate_individually(config: JsonnetConfig, name: str):
+    function, args = JsonnetConfig._default_configs[name]
+    return jsonnet_evaluate_snippet(f"(import '{config.template_file}').{function}({args})")
+
+
+async def test_default_configs_are_evaluated_in_single_pass(tmp_path: Path, evaluated_snippets: list[str]):
+    config = await create_jsonnet_config(tmp_path)
+
+    for name in JsonnetConfig._default_configs:
+        assert getattr(config, name) == evaluate_individually(config, name)
+
+    assert len(evaluated_snippets) == 1
+
+
+async def test_default_configs_are_shared_between_configs(tmp_path: Path, evaluated_snippets: list[str]):
+    config = await create_jsonnet_config(tmp_path / "first", "org-a")
+    other_config = await create_jsonnet_config(tmp_path / "second", "org-b")
+
+    assert config.template_hash == other_config.template_hash
+    assert config.default_repo_config == other_config.default_repo_config
+    assert config.default_repo_config is not other_config.default_repo_config
+
+    org_config = config.default_org_config_for_org_id("project", "org-a")
+    assert org_config == other_config.default_org_config_for_org_id("project", "org-a")
+    assert org_config != config.default_org_config_for_org_id("project", "org-b")
+
+    assert len(evaluated_snippets) == 3
+
+
+async def test_changed_template_is_evaluated_again(tmp_path: Path, evaluated_snippets: list[str]):
+    config = await create_jsonnet_config(tmp_path / "first")
+    assert config.default_merge_queue_config is not None
+
+    other_config = JsonnetConfig(
+        "OtterdogTest",
+        str(tmp_path / "second"),
+        "https://github.com/eclipse-csi/otterdog#otterdog-defaults.libsonnet@main",
+        True,
+    )
+    shutil.copytree(_TEMPLATE_DIR, other_config.template_dir)
+    template = Path(other_config.template_file)
+    template.write_text(template.read_text().replace("newMergeQueue:: newMergeQueue,", ""))
+    await other_config.init_template()
+
+    assert config.template_hash != other_config.template_hash
+    assert other_config.default_merge_queue_config is None
+    assert other_config.default_repo_config == config.default_repo_config
+    assert len(evaluated_snippets) == 2
+
+
+async def test_failing_default_config_is_evaluated_individually(tmp_path: Path, evaluated_snippets: list[str]):
+    config = JsonnetConfig(
+        "OtterdogTest",
+        str(tmp_path),
+        "https://github.com/eclipse-csi/otterdog#otterdog-defaults.libsonnet@main",
+        True,
+    )
+    shutil.copytree(_TEMPLATE_DIR, config.template_dir)
+    template = Path(config.template_file)
+    template.write_text(
+        template.read_text().replace("newMergeQueue:: newMergeQueue,", "newMergeQueue:: function() error 'broken',")
+    )
+    await config.init_template()
+
+    assert config.default_merge_queue_config is None
+    assert config.default_repo_config["name"] == "default"
+    # the single pass and the individual evaluations of both default configs
+    assert len(evaluated_snippets) == 3
+
+
+async def test_default_configs_are_evaluated_by_engine(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, evaluated_snippets: list[str]
+):
+    engine = JsonnetEngine(max_workers=2, use_processes=False)
+    monkeypatch.setattr(utils, "_JSONNET_ENGINE", engine)
+
+    try:
+        config = await create_jsonnet_config(tmp_path)
+    finally:
+        engine.close()
+
+    assert "_evaluated_default_configs" in vars(config)
+    assert config.default_repo_config == evaluate_individually(config, "default_repo_config")
+    assert len(evaluated_snippets) == 0
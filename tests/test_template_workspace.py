@@ -0,0 +1,194 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from otterdog import template_workspace
+from otterdog.template_workspace import TemplateWorkspaceCache
+from otterdog.utils import get_jsonnet_import_roots, is_within_jsonnet_import_roots, run_command
+
+_REPO_URL = "https://github.com/example/templates"
+
+
+class FakeCheckout:
+    def __init__(self):
+        self.sha = "a" * 40
+        self.updates = 0
+
+    async def __call__(self, repo_url: str, ref: str, checkout_dir: str) -> str:
+        self.updates += 1
+        os.makedirs(f"{checkout_dir}/.git", exist_ok=True)
+        os.makedirs(f"{checkout_dir}/otterdog", exist_ok=True)
+        Path(f"{checkout_dir}/otterdog/default.libsonnet").write_text(f"{{ sha: '{self.sha}' }}")
+        Path(f"{checkout_dir}/README.md").write_text("readme")
+        return self.sha
+
+
+@pytest.fixture
+def checkout(monkeypatch: pytest.MonkeyPatch) -> FakeCheckout:
+    fake_checkout = FakeCheckout()
+    monkeypatch.setattr(template_workspace, "update_template_checkout", fake_checkout)
+    return fake_checkout
+
+
+async def test_workspace_is_shared(tmp_path: Path, checkout: FakeCheckout):
+    cache = TemplateWorkspaceCache()
+
+    workspaces = await asyncio.gather(
+        *[cache.get(str(tmp_path), _REPO_URL, "main", "otterdog/default.libsonnet") for _ in range(5)]
+    )
+
+    assert checkout.updates == 1
+    assert len(set(workspaces)) == 1
+
+    workspace = workspaces[0]
+    assert workspace.sha == checkout.sha
+    assert os.path.exists(f"{workspace.path}/otterdog/default.libsonnet")
+    # only the directory of the template file is part of the workspace
+    assert not os.path.exists(f"{workspace.path}/README.md")
+    assert not os.path.exists(f"{workspace.path}/.git")
+    assert workspace.template_hash == template_workspace.hash_template_dir("otterdog/default.libsonnet", workspace.path)
+
+    await cache.close()
+
+
+async def test_outdated_checkout_is_refreshed_in_background(tmp_path: Path, checkout: FakeCheckout):
+    cache = TemplateWorkspaceCache(refresh_interval=0.0, keep_revisions=1)
+
+    first = await cache.get(str(tmp_path), _REPO_URL, "main", "otterdog/default.libsonnet")
+
+    checkout.sha = "b" * 40
+    # the last known workspace is returned while refreshing
+    assert await cache.get(str(tmp_path), _REPO_URL, "main", "otterdog/default.libsonnet") == first
+
+    state = next(iter(cache._checkouts.values()))
+    assert state.refresh_task is not None
+    await state.refresh_task
+
+    second = await cache.get(str(tmp_path), _REPO_URL, "main", "otterdog/default.libsonnet")
+    assert second.sha == checkout.sha
+    assert second.template_hash != first.template_hash
+
+    # the workspace of the evicted commit has been removed
+    assert not os.path.exists(first.path)
+    assert os.path.exists(second.path)
+
+    await cache.close()
+
+
+async def test_symlinked_workspace_is_import_root(tmp_path: Path, checkout: FakeCheckout):
+    cache = TemplateWorkspaceCache()
+    workspace = await cache.get(str(tmp_path / "base"), _REPO_URL, "main", "otterdog/default.libsonnet")
+
+    org_dir = tmp_path / "orgs" / "test-org"
+    os.makedirs(org_dir / "vendor")
+    os.symlink(os.path.abspath(workspace.path), org_dir / "vendor" / "templates", target_is_directory=True)
+
+    # symlinks to anything but a template workspace do not widen the allowed imports
+    outside_dir = tmp_path / "outside"
+    outside_dir.mkdir()
+    os.symlink(outside_dir, org_dir / "vendor" / "other", target_is_directory=True)
+    os.symlink(tmp_path / "base" / "workspaces", org_dir / "vendor" / "workspaces", target_is_directory=True)
+
+    roots = get_jsonnet_import_roots(str(org_dir))
+    imported_file = os.path.realpath(org_dir / "vendor" / "templates" / "otterdog" / "default.libsonnet")
+    assert is_within_jsonnet_import_roots(imported_file, roots)
+    assert not is_within_jsonnet_import_roots(str(tmp_path / "base" / "templates"), roots)
+    assert not is_within_jsonnet_import_roots(str(outside_dir / "secret.libsonnet"), roots)
+    assert len(roots) == 2
+
+    await cache.close()
+
+
+async def _git(*args: str, cwd: Path) -> str:
+    status, stdout, stderr = await run_command(
+        "git", "-c", "user.name=test", "-c", "user.email=test@example.org", *args, cwd=cwd
+    )
+    assert status == 0, stderr
+    return stdout.strip()
+
+
+async def _commit(repo: Path, content: str) -> str:
+    (repo / "default.libsonnet").write_text(content)
+    await _git("add", "-A", cwd=repo)
+    await _git("commit", "--quiet", "-m", content, cwd=repo)
+    return await _git("rev-parse", "HEAD", cwd=repo)
+
+
+@pytest.fixture
+async def template_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "remote"
+    repo.mkdir()
+    await _git("init", "--quiet", "-b", "main", cwd=repo)
+    return repo
+
+
+async def test_checkout_follows_ref(tmp_path: Path, template_repo: Path):
+    repo_url = template_repo.as_uri()
+    checkout_dir = str(tmp_path / "checkout")
+
+    first_sha = await _commit(template_repo, "{ a: 1 }")
+    await _git("tag", "-a", "v1", "-m", "v1", cwd=template_repo)
+
+    assert await template_workspace.update_template_checkout(repo_url, "main", checkout_dir) == first_sha
+    assert Path(checkout_dir, "default.libsonnet").read_text() == "{ a: 1 }"
+    # only the requested commit has been fetched
+    assert await _git("rev-parse", "--is-shallow-repository", cwd=Path(checkout_dir)) == "true"
+
+    second_sha = await _commit(template_repo, "{ a: 2 }")
+    assert await template_workspace.update_template_checkout(repo_url, "main", checkout_dir) == second_sha
+    assert Path(checkout_dir, "default.libsonnet").read_text() == "{ a: 2 }"
+
+    # annotated tags resolve to the commit they point to
+    assert await template_workspace.resolve_template_ref(repo_url, "v1") == first_sha
+    assert await template_workspace.update_template_checkout(repo_url, "v1", checkout_dir) == first_sha
+    assert await template_workspace.update_template_checkout(repo_url, second_sha, checkout_dir) == second_sha
+
+
+async def test_incomplete_checkout_is_recovered(tmp_path: Path, template_repo: Path):
+    sha = await _commit(template_repo, "{ a: 1 }")
+
+    # the checkout has been initialized but the initial fetch did not complete
+    checkout_dir = tmp_path / "checkout"
+    checkout_dir.mkdir()
+    await _git("init", "--quiet", cwd=checkout_dir)
+    await _git("remote", "add", "origin", template_repo.as_uri(), cwd=checkout_dir)
+
+    assert await template_workspace.update_template_checkout(template_repo.as_uri(), "main", str(checkout_dir)) == sha
+    assert Path(checkout_dir, "default.libsonnet").read_text() == "{ a: 1 }"
+
+
+async def test_unknown_ref_fails(tmp_path: Path, template_repo: Path):
+    await _commit(template_repo, "{ a: 1 }")
+
+    with pytest.raises(RuntimeError):
+        await template_workspace.update_template_checkout(
+            template_repo.as_uri(), "does-not-exist", str(tmp_path / "checkout")
+        )
+
+
+async def test_checkout_is_refreshed_once_per_interval(
+    tmp_path: Path, checkout: FakeCheckout, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(template_workspace, "_checkout_refreshes", {})
+    checkout_dir = str(tmp_path / "checkout")
+
+    shas = await asyncio.gather(
+        *[template_workspace.refresh_template_checkout(_REPO_URL, "main", checkout_dir) for _ in range(5)]
+    )
+
+    assert shas == [checkout.sha] * 5
+    assert checkout.updates == 1
+
+    checkout.sha = "b" * 40
+    assert await template_workspace.refresh_template_checkout(_REPO_URL, "main", checkout_dir, 0.0) == checkout.sha
+    assert checkout.updates == 2
@@ -6,19 +6,26 @@
 #  SPDX-License-Identifier: EPL-2.0
 #  *******************************************************************************
 
+import asyncio
 import os
+import sys
 from io import StringIO
 from pathlib import Path
 
 import pytest
 
+from otterdog import utils
 from otterdog.utils import (
     UNSET,
     IndentingPrinter,
+    JsonnetEngine,
     _make_jsonnet_import_callback,
+    add_jsonnet_workspace_dir,
     camel_to_snake_case,
     deep_merge_dict,
     format_date_for_csv,
+    gather_or_cancel,
+    get_jsonnet_import_roots,
     is_different_ignoring_order,
     is_ghsa_repo,
     jsonnet_evaluate_snippet,
@@ -127,12 +134,39 @@ def test_format_date_for_csv():
     assert format_date_for_csv("2023-12-31T23:59:59Z") == "2023-12-31 23:59:59"
 
 
+async def test_gather_or_cancel():
+    async def value(v: int) -> int:
+        await asyncio.sleep(0.01)
+        return v
+
+    assert await gather_or_cancel(value(1), value(2)) == [1, 2]
+
+
+async def test_gather_or_cancel_cancels_remaining():
+    cancelled = asyncio.Event()
+
+    async def fail() -> None:
+        raise RuntimeError("failed")
+
+    async def wait() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(RuntimeError, match="failed"):
+        await gather_or_cancel(wait(), fail())
+
+    assert cancelled.is_set()
+
+
 def test_jsonnet_import_callback_returns_files_inside_root(tmp_path: Path):
     (tmp_path / "vendor").mkdir()
     inside = tmp_path / "vendor" / "lib.libsonnet"
     inside.write_bytes(b"{ x: 1 }")
 
-    callback = _make_jsonnet_import_callback(str(tmp_path))
+    callback = _make_jsonnet_import_callback(get_jsonnet_import_roots(str(tmp_path)))
 
     # absolute path inside the root is returned
     resolved, content = callback("", str(inside))
@@ -146,7 +180,7 @@ def test_jsonnet_import_callback_returns_files_inside_root(tmp_path: Path):
 
 
 def test_jsonnet_import_callback_rejects_absolute_outside_root(tmp_path: Path):
-    callback = _make_jsonnet_import_callback(str(tmp_path))
+    callback = _make_jsonnet_import_callback(get_jsonnet_import_roots(str(tmp_path)))
 
     with pytest.raises(RuntimeError, match="not allowed"):
         callback("", "/etc/hosts")
@@ -155,7 +189,7 @@ def test_jsonnet_import_callback_rejects_absolute_outside_root(tmp_path: Path):
 def test_jsonnet_import_callback_rejects_parent_traversal(tmp_path: Path):
     sub = tmp_path / "sub"
     sub.mkdir()
-    callback = _make_jsonnet_import_callback(str(sub))
+    callback = _make_jsonnet_import_callback(get_jsonnet_import_roots(str(sub)))
 
     # ../ from a base inside the root must not resolve outside the root
     with pytest.raises(RuntimeError, match="not allowed"):
@@ -174,7 +208,7 @@ def test_jsonnet_import_callback_resolves_symlinks(tmp_path: Path):
     except (OSError, NotImplementedError):  # pragma: no cover - platforms without symlinks
         pytest.skip("symlinks not supported on this platform")
 
-    callback = _make_jsonnet_import_callback(str(root))
+    callback = _make_jsonnet_import_callback(get_jsonnet_import_roots(str(root)))
     # symlinks are resolved before the containment check, so a link pointing
     # outside the root is rejected
     with pytest.raises(RuntimeError, match="not allowed"):
@@ -216,6 +250,98 @@ def test_evaluate_without_restricting_import(tmp_path: Path):
     assert result["outside"] == "payload"
 
 
+@pytest.fixture
+def worker_sys_path(monkeypatch):
+    # the pytest configuration adds the package directory to the path which would
+    # shadow modules of the standard library, e.g. logging, in spawned worker processes.
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    monkeypatch.setattr(
+        sys, "path", [p for p in sys.path if os.path.abspath(p) != os.path.join(package_dir, "otterdog")]
+    )
+
+
+@pytest.fixture(params=[True, False], ids=["processes", "threads"])
+def jsonnet_engine(request, worker_sys_path):
+    engine = JsonnetEngine(max_workers=2, use_processes=request.param)
+    yield engine
+    engine.close()
+
+
+async def test_jsonnet_engine_keeps_import_restriction(jsonnet_engine: JsonnetEngine, tmp_path: Path):
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "inside.txt").write_text("inside")
+    outside = tmp_path / "outside.txt"
+    outside.write_text("outside")
+
+    with restrict_jsonnet_imports(str(root)):
+        result = await jsonnet_engine.evaluate_snippet(f'{{ inside: importstr "{root / "inside.txt"}" }}')
+        assert result["inside"] == "inside"
+
+        with pytest.raises(RuntimeError, match="not allowed"):
+            await jsonnet_engine.evaluate_snippet(f'{{ outside: importstr "{outside}" }}')
+
+    config_file = tmp_path / "config.jsonnet"
+    config_file.write_text('{ outside: importstr "outside.txt" }')
+
+    with pytest.raises(RuntimeError, match="not allowed"):
+        await jsonnet_engine.evaluate_file(str(config_file), import_base_dir=str(root))
+
+    assert await jsonnet_engine.evaluate_file(str(config_file)) == {"outside": "outside"}
+
+
+async def test_jsonnet_engine_allows_imports_from_workspace(
+    jsonnet_engine: JsonnetEngine, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(utils, "_jsonnet_workspace_dirs", set())
+
+    workspace_dir = tmp_path / "workspaces"
+    workspace = workspace_dir / "tpl-1234"
+    workspace.mkdir(parents=True)
+    (workspace / "lib.libsonnet").write_text("{ a: 1 }")
+    add_jsonnet_workspace_dir(str(workspace_dir))
+
+    org_dir = tmp_path / "orgs" / "test-org"
+    (org_dir / "vendor").mkdir(parents=True)
+    (org_dir / "vendor" / "tpl").symlink_to(workspace, target_is_directory=True)
+    config_file = org_dir / "test-org.jsonnet"
+    config_file.write_text('import "vendor/tpl/lib.libsonnet"')
+
+    # the workspace dir is only registered in this process, not in the workers
+    assert await jsonnet_engine.evaluate_file(str(config_file), import_base_dir=str(org_dir)) == {"a": 1}
+
+    with restrict_jsonnet_imports(str(org_dir)):
+        assert await jsonnet_engine.evaluate_snippet(f'import "{org_dir / "vendor" / "tpl" / "lib.libsonnet"}"') == {
+            "a": 1
+        }
+
+
+async def test_jsonnet_engine_does_not_block_event_loop(worker_sys_path):
+    engine = JsonnetEngine(max_workers=1, max_pending=1)
+    try:
+        # warm up the worker process
+        await engine.evaluate_snippet("{}")
+
+        ticks = 0
+
+        async def _tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(_tick())
+        results = await asyncio.gather(
+            *[engine.evaluate_snippet("{ sum: std.foldl(function(a, b) a + b, std.range(1, 200000), 0) }")] * 2
+        )
+        ticker.cancel()
+
+        assert results == [{"sum": 20000100000}] * 2
+        assert ticks > 5
+    finally:
+        engine.close()
+
+
 _long_string = "Too long to fit console width"
 
 
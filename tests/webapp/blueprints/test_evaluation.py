@@ -0,0 +1,136 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from otterdog.models.github_organization import GitHubOrganization
+from otterdog.webapp import blueprints
+from otterdog.webapp.blueprints import BlueprintEvaluationContext, RepoSelector
+from otterdog.webapp.blueprints.required_file import RequiredFileBlueprint
+from otterdog.webapp.db import service
+from otterdog.webapp.db.models import (
+    BlueprintStatus,
+    BlueprintStatusId,
+    BlueprintStatusModel,
+    ConfigurationModel,
+)
+
+_TEST_ORG_FILE = Path(__file__).parents[2] / "models" / "resources" / "test-org" / "test-org.jsonnet"
+
+
+evaluated_repos: list[str] = []
+
+
+class RecordingBlueprint(RequiredFileBlueprint):
+    async def evaluate_repo(self, installation_id, github_id, repo_name, config=None) -> None:
+        evaluated_repos.append(repo_name)
+
+
+@pytest.fixture
+def config_model() -> ConfigurationModel:
+    config = GitHubOrganization.load_from_file("test-org", str(_TEST_ORG_FILE)).to_model_data()
+    return ConfigurationModel(github_id="test-org", project_name="test", config=config, sha="1234")
+
+
+@pytest.fixture
+def db(config_model: ConfigurationModel, monkeypatch: pytest.MonkeyPatch) -> dict[str, list]:
+    calls: dict[str, list] = {"configurations": [], "statuses": [], "cleanups": []}
+    statuses = [
+        BlueprintStatusModel(
+            id=BlueprintStatusId(org_id="test-org", repo_name="test-repo", blueprint_id="bp"),
+            status=BlueprintStatus.SUCCESS,
+        ),
+        BlueprintStatusModel(
+            id=BlueprintStatusId(org_id="test-org", repo_name=".eclipsefdn", blueprint_id="bp"),
+            status=BlueprintStatus.FAILURE,
+        ),
+    ]
+
+    async def get_configuration_by_github_id(github_id: str):
+        calls["configurations"].append(github_id)
+        return config_model
+
+    async def get_blueprints_status(owner: str):
+        calls["statuses"].append(owner)
+        return statuses
+
+    async def cleanup_blueprint_status_of_repos(owner: str, repo_names: list[str], blueprint_id: str):
+        calls["cleanups"].append((owner, repo_names, blueprint_id))
+
+    monkeypatch.setattr(service, "get_configuration_by_github_id", get_configuration_by_github_id)
+    monkeypatch.setattr(service, "get_blueprints_status", get_blueprints_status)
+    monkeypatch.setattr(service, "cleanup_blueprint_status_of_repos", cleanup_blueprint_status_of_repos)
+    monkeypatch.setattr(blueprints, "_parsed_organizations", type(blueprints._parsed_organizations)())
+
+    evaluated_repos.clear()
+    return calls
+
+
+def _create_blueprint(repo_pattern: str = ".*") -> RecordingBlueprint:
+    return RecordingBlueprint(
+        id="bp",
+        path="a",
+        name=None,
+        description=None,
+        repo_selector=RepoSelector(name_pattern=repo_pattern),
+        files=[],
+    )
+
+
+async def test_context_is_loaded_once(db: dict[str, list]):
+    context = await BlueprintEvaluationContext.load("test-org")
+    assert context is not None
+
+    await _create_blueprint().evaluate(1, "test-org", context=context)
+    await _create_blueprint().evaluate(1, "test-org", recheck=True, context=context)
+
+    assert db["configurations"] == ["test-org"]
+    assert db["statuses"] == ["test-org"]
+
+    # repos that were already checked successfully are only evaluated on recheck
+    assert sorted(evaluated_repos) == [".eclipsefdn", ".eclipsefdn", "test-repo"]
+
+
+async def test_status_of_non_matching_repos_is_cleaned_up(db: dict[str, list]):
+    await _create_blueprint("test-repo").evaluate(1, "test-org", recheck=True)
+
+    assert evaluated_repos == ["test-repo"]
+    assert db["cleanups"] == [("test-org", [".eclipsefdn"], "bp")]
+
+
+async def test_config_is_parsed_once_per_sha(db: dict[str, list], config_model: ConfigurationModel):
+    first = await blueprints.get_organization_of_config(config_model)
+    assert await blueprints.get_organization_of_config(config_model) is first
+
+    changed_config = config_model.model_copy(update={"sha": "5678"})
+    assert await blueprints.get_organization_of_config(changed_config) is not first
+
+
+async def test_failing_repo_cancels_remaining_repos(db: dict[str, list]):
+    cancelled = []
+
+    class FailingBlueprint(RequiredFileBlueprint):
+        async def evaluate_repo(self, installation_id, github_id, repo_name, config=None) -> None:
+            if repo_name == "test-repo":
+                raise RuntimeError("failed")
+
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(repo_name)
+                raise
+
+    blueprint = FailingBlueprint(id="bp", path="a", name=None, description=None, files=[])
+
+    with pytest.raises(RuntimeError):
+        await blueprint.evaluate(1, "test-org", recheck=True)
+
+    assert cancelled == [".eclipsefdn"]
@@ -0,0 +1,121 @@
+#  *******************************************************************************
+#  Copyright (c) 2026 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from otterdog.webapp.token_cache import InstallationTokenCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, dict[bytes, bytes]] = {}
+        self.reads = 0
+
+    async def hgetall(self, key: str) -> dict[bytes, bytes]:
+        self.reads += 1
+        return self.data.get(key, {})
+
+    async def hset(self, key: str, mapping: dict[str, str]) -> None:
+        self.data[key] = {k.encode("utf-8"): v.encode("utf-8") for k, v in mapping.items()}
+
+
+class FakeTokenCreator:
+    def __init__(self, validity: timedelta = timedelta(hours=1)):
+        self.validity = validity
+        self.created: list[int] = []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, installation_id: int) -> tuple[str, datetime]:
+        self.started.set()
+        await self.release.wait()
+        self.created.append(installation_id)
+        return f"token-{installation_id}-{len(self.created)}", datetime.now(UTC) + self.validity
+
+
+@pytest.fixture
+def redis() -> FakeRedis:
+    return FakeRedis()
+
+
+async def test_token_is_cached_in_memory(redis: FakeRedis):
+    creator = FakeTokenCreator()
+    token_cache = InstallationTokenCache(lambda: redis, creator)
+
+    token, _ = await token_cache.get(1)
+    assert token == "token-1-1"
+    assert await token_cache.get(1) == await token_cache.get(1)
+
+    assert creator.created == [1]
+    assert redis.reads == 1
+    assert token_cache.statistics.misses == 1
+    assert token_cache.statistics.memory_hits == 2
+
+    # a new process picks up the token from redis
+    other_cache = InstallationTokenCache(lambda: redis, creator)
+    assert (await other_cache.get(1))[0] == token
+    assert other_cache.statistics.redis_hits == 1
+    assert creator.created == [1]
+
+
+async def test_token_is_created_once_per_installation(redis: FakeRedis):
+    creator = FakeTokenCreator()
+    creator.release.clear()
+    token_cache = InstallationTokenCache(lambda: redis, creator)
+
+    pending = [asyncio.create_task(token_cache.get(1)) for _ in range(5)]
+    await creator.started.wait()
+
+    # other installations are not blocked by a pending token creation
+    other = asyncio.create_task(token_cache.get(2))
+    await asyncio.sleep(0)
+    creator.release.set()
+
+    tokens = await asyncio.gather(*pending)
+    assert len(set(tokens)) == 1
+    assert (await other)[0].startswith("token-2-")
+    assert sorted(creator.created) == [1, 2]
+    assert token_cache.statistics.tokens_created == 2
+
+
+async def test_token_is_refreshed_before_expiry(redis: FakeRedis):
+    creator = FakeTokenCreator(validity=timedelta(minutes=3))
+    token_cache = InstallationTokenCache(lambda: redis, creator, refresh_before=timedelta(minutes=5))
+
+    first, _ = await token_cache.get(1)
+
+    # the token is still valid and returned, a new one is retrieved in the background
+    creator.validity = timedelta(hours=1)
+    assert (await token_cache.get(1))[0] == first
+    await asyncio.gather(*token_cache._refresh_tasks.values())
+
+    assert token_cache.statistics.background_refreshes == 1
+    assert (await token_cache.get(1))[0] != first
+    assert not token_cache._refresh_tasks
+    assert len(creator.created) == 2
+
+
+async def test_least_recently_used_tokens_are_evicted(redis: FakeRedis):
+    creator = FakeTokenCreator()
+    token_cache = InstallationTokenCache(lambda: redis, creator, max_entries=2)
+
+    await token_cache.get(1)
+    await token_cache.get(2)
+    await token_cache.get(1)
+    await token_cache.get(3)
+
+    assert list(token_cache._tokens) == [1, 3]
+
+    # evicted tokens are still found in redis
+    await token_cache.get(2)
+    assert token_cache.statistics.redis_hits == 1
+    assert creator.created == [1, 2, 3]